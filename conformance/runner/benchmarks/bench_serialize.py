@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Canonical Serializer Micro‑Benchmark (Informative)
+---------------------------------------------------------
+Compares the reference canonical_serialize() against the precompiled
+CanonicalSerializer in utils/seal.py. Before timing, the two outputs are
+checked for byte identity on the seal test vector and on a synthetic
+vector with a configurable plugin count.
+
+Usage:
+    python3 benchmarks/bench_serialize.py [--plugins N] [--iterations N]
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import timeit
+
+RUNNER_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUNNER_DIR))
+
+from utils.seal import CanonicalSerializer, canonical_serialize  # noqa: E402
+
+SEAL_VECTORS_DIR = RUNNER_DIR.parent / "seal_vectors"
+DOMAINS = ["Refraction", "FrameDrag", "Jitter", "Custom"]
+
+
+def synthetic_case(num_plugins: int):
+    """
+    Deterministic (vector, actual) pair with `num_plugins` plugins.
+    """
+    phase_state = [[i * 3 + a for a in range(3)] for i in range(16)]
+    plugins = {}
+    for i in range(num_plugins):
+        pid = f"plugin_{i:03d}"
+        plugins[pid] = {
+            "id": pid,
+            "domain": DOMAINS[i % len(DOMAINS)],
+            "warp_vector": [i, -i, i * 7],
+            "error": i % 2,
+            "version": "1.0.0",
+            "status": "OK",
+        }
+    vector = {
+        "initial_phase_state": phase_state,
+        "plugins": plugins,
+        "implementation_id": "iso16-ref",
+        "timestamp": 1700000000000000,
+        "nonce": "000102030405060708090a0b0c0d0e0f",
+    }
+    actual = {
+        "warp_total": [1, 2, 3],
+        "error_total": 0,
+        "phase_state_warped": [[x + 1, y + 2, z + 3] for (x, y, z) in phase_state],
+        "symmetry_ok": False,
+        "error_ok": True,
+        "true_delivery": False,
+    }
+    return vector, actual
+
+
+def seal_test_case():
+    with (SEAL_VECTORS_DIR / "SEALTEST_input.json").open() as f:
+        vector = json.load(f)
+    actual = {
+        "warp_total": [256, 512, 768],
+        "error_total": 1,
+        "phase_state_warped": [[256, 512, 768]] * 16,
+        "symmetry_ok": True,
+        "error_ok": True,
+        "true_delivery": True,
+    }
+    return vector, actual
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canonical serializer micro-benchmark")
+    parser.add_argument("--plugins", type=int, default=8, help="Plugins in the synthetic vector.")
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per timing run.")
+    args = parser.parse_args()
+
+    fast = CanonicalSerializer()
+
+    for name, (vector, actual) in (("SEALTEST", seal_test_case()),
+                                   ("synthetic", synthetic_case(args.plugins))):
+        if fast.serialize(vector, actual) != canonical_serialize(vector, actual):
+            print(f"[-] Byte mismatch on {name} case")
+            sys.exit(1)
+    print("[*] Byte-identical output verified.")
+
+    vector, actual = synthetic_case(args.plugins)
+    n = args.iterations
+
+    t_ref = min(timeit.repeat(lambda: canonical_serialize(vector, actual), number=n, repeat=5))
+    t_fast = min(timeit.repeat(lambda: fast.serialize_into(vector, actual), number=n, repeat=5))
+
+    print(f"[*] {args.plugins} plugins, {n} iterations (best of 5)")
+    print(f"    canonical_serialize          {n / t_ref:12,.0f} ops/s")
+    print(f"    CanonicalSerializer          {n / t_fast:12,.0f} ops/s")
+    print(f"    speedup                      {t_ref / t_fast:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
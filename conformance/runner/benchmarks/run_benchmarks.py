@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Benchmark Suite (Informative)
+------------------------------------
+Reproducible throughput benchmarks for the reference tooling:
+
+  • engine         vectors/s through ISO16Engine.run() (no tracing)
+  • batch_engine   vectors/s through iso16_batch_engine (needs NumPy)
+  • seal           seals/s through canonical_serialize_and_hash
+  • orchestrator   end‑to‑end wall time and peak RSS of
+                   conformance_orchestrator.py over a packed corpus
+
+Inputs are synthetic vectors generated from a fixed seed, with the
+plugin count and batch size as parameters, so two runs on the same
+machine measure the same work. Results are written as JSON; with
+--baseline, each metric is compared against a stored run and the suite
+exits non‑zero if any metric regresses by more than --tolerance.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py --output bench.json
+    python3 benchmarks/run_benchmarks.py --baseline bench.json
+"""
+
+import argparse
+import json
+import pathlib
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+RUNNER_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RUNNER_DIR))
+
+from iso16_reference_runner import ISO16Engine  # noqa: E402
+from utils.seal import canonical_serialize_and_hash  # noqa: E402
+from utils.vector_pack import write_pack  # noqa: E402
+
+DOMAINS = ["Refraction", "FrameDrag", "Jitter", "Custom"]
+
+
+# ------------------------------------------------------------
+# Synthetic inputs
+# ------------------------------------------------------------
+
+def synthetic_vectors(count: int, plugins: int, seed: int):
+    """
+    Deterministic schema‑shaped vectors with `plugins` plugins each.
+    """
+    rng = random.Random(seed)
+    vectors = []
+    for i in range(count):
+        base = [rng.randint(-4, 4) for _ in range(3)]
+        phase_state = [[c + rng.randint(0, 1) for c in base] for _ in range(16)]
+        plugin_outputs = {}
+        for j in range(plugins):
+            pid = f"p{j:03d}"
+            plugin_outputs[pid] = {
+                "id": pid,
+                "domain": DOMAINS[j % len(DOMAINS)],
+                "warp_vector": [rng.randint(-65536, 65536) for _ in range(3)],
+                "error": rng.randint(0, 1) if j == 0 else 0,
+                "version": "1.0.0",
+                "status": "OK",
+            }
+        vectors.append({
+            "vector_id": f"B{i:07d}",
+            "initial_phase_state": phase_state,
+            "plugins": plugin_outputs,
+        })
+    return vectors
+
+
+def _actual_for(vector):
+    """
+    Plausible `actual` record for sealing (values need not be decisions
+    of a real run; only serialization and hashing are measured).
+    """
+    warp = [0, 0, 0]
+    err = 0
+    for p in vector["plugins"].values():
+        warp = [(w + d) for w, d in zip(warp, p["warp_vector"])]
+        err += p["error"]
+    return {
+        "warp_total": warp,
+        "error_total": err,
+        "phase_state_warped": [[c + w for c, w in zip(ph, warp)] for ph in vector["initial_phase_state"]],
+        "symmetry_ok": True,
+        "error_ok": err <= 1,
+        "true_delivery": err <= 1,
+    }
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+# ------------------------------------------------------------
+# Benchmarks
+# ------------------------------------------------------------
+
+def bench_engine(vectors, repeat):
+    def run():
+        for v in vectors:
+            ISO16Engine(v).run()
+    return {"value": len(vectors) / _best_of(run, repeat), "unit": "vectors/s", "higher_is_better": True}
+
+
+def bench_batch_engine(vectors, repeat):
+    try:
+        from iso16_batch_engine import evaluate_batch, pack_vectors
+    except ImportError:
+        return None
+    inputs = pack_vectors(vectors)
+    return {"value": len(vectors) / _best_of(lambda: evaluate_batch(*inputs), repeat),
+            "unit": "vectors/s", "higher_is_better": True}
+
+
+def bench_seal(vectors, repeat):
+    pairs = [(v, _actual_for(v)) for v in vectors]
+
+    def run():
+        for v, a in pairs:
+            canonical_serialize_and_hash(v, a)
+    return {"value": len(pairs) / _best_of(run, repeat), "unit": "seals/s", "higher_is_better": True}
+
+
+def _with_expected_seal(vector: dict) -> dict:
+    engine = ISO16Engine(vector)
+    engine.run()
+    return dict(vector, expected_seal=f"{engine.seal_out:064x}")
+
+
+def bench_orchestrator(vectors, jobs):
+    """
+    Run the orchestrator in a child process over a packed copy of the
+    vectors (with their expected seals embedded, so every vector must
+    PASS), with caching and tracing disabled. A failing run raises
+    instead of being reported as a timing.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = pathlib.Path(tmp)
+        pack_path = tmp / "bench.i16p"
+        write_pack(pack_path, (_with_expected_seal(v) for v in vectors))
+
+        cmd = [sys.executable, str(RUNNER_DIR / "conformance_orchestrator.py"),
+               "--pack", str(pack_path), "--no-cache", "--trace", "none",
+               "--jobs", str(jobs), "--results-dir", str(tmp / "results")]
+        t0 = time.perf_counter()
+        proc = subprocess.run(cmd, cwd=RUNNER_DIR, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, text=True)
+        wall = time.perf_counter() - t0
+        if proc.returncode != 0:
+            raise RuntimeError(f"orchestrator benchmark run failed (exit {proc.returncode}):\n"
+                               f"{proc.stderr[-2000:]}")
+
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    peak_mib = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    return {
+        "orchestrator_wall": {"value": wall, "unit": "s", "higher_is_better": False},
+        "orchestrator_peak_rss": {"value": peak_mib, "unit": "MiB", "higher_is_better": False},
+    }
+
+
+def run_all(args) -> dict:
+    vectors = synthetic_vectors(args.batch, args.plugins, args.seed)
+
+    results = {
+        "engine": bench_engine(vectors, args.repeat),
+        "batch_engine": bench_batch_engine(vectors, args.repeat),
+        "seal": bench_seal(vectors, args.repeat),
+    }
+    if not args.skip_orchestrator:
+        results.update(bench_orchestrator(vectors, args.jobs))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "plugins": args.plugins,
+            "batch": args.batch,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "jobs": args.jobs,
+        },
+        "results": {k: v for k, v in results.items() if v is not None},
+    }
+
+
+# ------------------------------------------------------------
+# Baseline comparison
+# ------------------------------------------------------------
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Return a list of regression messages (empty when within tolerance).
+    Metrics missing from either side are ignored.
+    """
+    regressions = []
+    for name, cur in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or base["value"] == 0:
+            continue
+        ratio = cur["value"] / base["value"]
+        change = (ratio - 1.0) if cur["higher_is_better"] else (1.0 - ratio)
+        print(f"    {name:<24} {base['value']:14,.2f} → {cur['value']:14,.2f} {cur['unit']:<10} ({change:+.1%})")
+        if change < -tolerance:
+            regressions.append(f"{name} regressed by {-change:.1%} (tolerance {tolerance:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Benchmark Suite")
+    parser.add_argument("--plugins", type=int, default=8, help="Plugins per synthetic vector.")
+    parser.add_argument("--batch", type=int, default=2000, help="Synthetic vectors per benchmark.")
+    parser.add_argument("--seed", type=int, default=16, help="Synthetic vector seed.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per benchmark (best is kept).")
+    parser.add_argument("--jobs", type=int, default=1, help="Orchestrator worker processes.")
+    parser.add_argument("--skip-orchestrator", action="store_true", help="Skip the end-to-end benchmark.")
+    parser.add_argument("--output", type=pathlib.Path, help="Write results JSON here.")
+    parser.add_argument("--baseline", type=pathlib.Path, help="Compare against a stored results JSON.")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed fractional regression per metric. Default: 0.10.")
+    args = parser.parse_args()
+
+    current = run_all(args)
+
+    print(f"[*] ISO-16 benchmarks: {args.batch} vectors × {args.plugins} plugins (seed {args.seed})")
+    for name, r in current["results"].items():
+        print(f"    {name:<24} {r['value']:14,.2f} {r['unit']}")
+
+    if args.output:
+        with args.output.open("w") as f:
+            json.dump(current, f, indent=2)
+        print(f"[*] Results saved to: {args.output}")
+
+    if args.baseline:
+        with args.baseline.open() as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("plugins") != args.plugins or \
+           baseline.get("meta", {}).get("batch") != args.batch:
+            print("[!] Baseline was recorded with different --plugins/--batch parameters.")
+        print(f"[*] Comparison against {args.baseline}:")
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions:
+            for msg in regressions:
+                print(f"[-] REGRESSION: {msg}")
+            sys.exit(1)
+        print("[*] No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,33 +5,297 @@ ISO-16 Conformance Orchestrator
 Orchestrates the execution of all conformance vectors against the
 Reference Runner and validates the resulting Tetra-Seals.
 
+Vectors are read from conformance/vectors/V*.json, or from a packed
+.i16p container (utils/vector_pack.py) when --pack is given.
+
 Outputs:
   • Per-vector PASS/FAIL status
   • Aggregate JSON report (conformance_report.json)
+  • Optionally, run counters per engine state and pipeline phase
+    (--metrics, iso16_metrics.py)
 """
 
 import argparse
 import json
+import os
 import pathlib
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from iso16_reference_runner import run_vector
+from typing import NamedTuple
+from iso16_metrics import PHASE_JSON_LOAD, PHASE_SCHEMA_VALIDATION, Metrics
+from iso16_reference_runner import execute_vector
+from iso16_trace import TRACE_MODES, TraceConfig
+from utils.result_cache import DEFAULT_MAX_BYTES, ResultCache, code_fingerprint
+from utils.vector_pack import VectorPack
+
+RUNNER_DIR = pathlib.Path(__file__).resolve().parent
+SCHEMA_VECTOR = RUNNER_DIR.parent / "schema" / "vector_schema.json"
+
+# Source files whose contents can change a vector's result: this module
+# (it builds the detail) and every local module the worker path imports,
+# plus the schema --validate checks against. Any edit to one of these
+# invalidates every cached result.
+CACHE_FINGERPRINT_FILES = [
+    RUNNER_DIR / "conformance_orchestrator.py",
+    RUNNER_DIR / "iso16_reference_runner.py",
+    RUNNER_DIR / "iso16_trace.py",
+    RUNNER_DIR / "iso16_vcd_logger.py",
+    RUNNER_DIR / "iso16_metrics.py",
+    RUNNER_DIR / "utils" / "seal.py",
+    RUNNER_DIR / "utils" / "q16.py",
+    RUNNER_DIR / "utils" / "vector_pack.py",
+    RUNNER_DIR / "utils" / "audit_store.py",
+    RUNNER_DIR / "utils" / "schema_validate.py",
+    SCHEMA_VECTOR,
+]
+
+
+class PackEntry(NamedTuple):
+    """
+    One vector inside a .i16p container.
+    """
+    pack_path: str
+    index: int
+
+
+# Per-process cache of open (memory-mapped) containers
+_OPEN_PACKS = {}
+
+
+def _open_pack(pack_path: str) -> VectorPack:
+    vp = _OPEN_PACKS.get(pack_path)
+    if vp is None:
+        vp = _OPEN_PACKS[pack_path] = VectorPack(pack_path)
+    return vp
+
+
+def _load_entry(entry):
+    """
+    Return (vector_data, vector_id) for a JSON path or a PackEntry.
+    """
+    if isinstance(entry, PackEntry):
+        vector_data = _open_pack(entry.pack_path).vector(entry.index)
+        return vector_data, vector_data.get("id", vector_data["vector_id"])
+
+    with entry.open() as f:
+        vector_data = json.load(f)
+    return vector_data, vector_data.get("id", entry.stem)
+
+
+def _entry_bytes(entry) -> bytes:
+    """
+    Content bytes of a vector, used as its cache key.
+    """
+    if isinstance(entry, PackEntry):
+        return _open_pack(entry.pack_path).entry_bytes(entry.index)
+    return entry.read_bytes()
+
+
+def _process_vector(entry, results_dir: pathlib.Path, trace: TraceConfig = TraceConfig(),
+                    validate: bool = False, collect_metrics: bool = False) -> dict:
+    """
+    Execute one vector (JSON path or PackEntry) and return its report
+    detail entry. Runs in the parent process or in a pool worker; the
+    result is passed back in memory rather than through a *_result.json
+    file. With collect_metrics, the detail carries a "metrics" snapshot
+    that _run_details() removes and merges.
+    """
+    metrics = Metrics() if collect_metrics else None
+    detail = _execute_entry(entry, results_dir, trace, validate, metrics)
+    if metrics is not None:
+        detail["metrics"] = metrics.snapshot()
+    return detail
+
+
+def _execute_entry(entry, results_dir: pathlib.Path, trace: TraceConfig,
+                   validate: bool, metrics: Metrics) -> dict:
+    if metrics is not None:
+        t0 = time.perf_counter_ns()
+    vector_data, vector_id = _load_entry(entry)
+    if metrics is not None:
+        metrics.add_phase(PHASE_JSON_LOAD, time.perf_counter_ns() - t0)
+
+    if validate:
+        from utils.schema_validate import validate_json
+        if metrics is not None:
+            t0 = time.perf_counter_ns()
+        try:
+            validate_json(vector_data, str(SCHEMA_VECTOR))
+        except ValueError as e:
+            return {
+                "vector_id": vector_id,
+                "status": "FAIL",
+                "reason": "schema_invalid",
+                "error": str(e),
+                "expected": vector_data.get("expected_seal"),
+                "actual": None,
+                "elapsed_seconds": None
+            }
+        finally:
+            if metrics is not None:
+                metrics.add_phase(PHASE_SCHEMA_VALIDATION, time.perf_counter_ns() - t0)
+
+    expected_seal = vector_data.get("expected_seal", "").strip().lower()
+
+    # Basic seal sanity check
+    if len(expected_seal) != 64:
+        return {
+            "vector_id": vector_id,
+            "status": "FAIL",
+            "reason": "invalid_expected_seal_length",
+            "expected": expected_seal,
+            "actual": None,
+            "elapsed_seconds": None
+        }
+
+    # Execute the Reference Runner (monotonic clock)
+    t0 = time.perf_counter()
+    actual_data = execute_vector(vector_data, vector_id, results_dir, trace, metrics=metrics)
+    elapsed = time.perf_counter() - t0
+
+    actual_seal = actual_data.get("seal_out", "").strip().lower()
+    is_pass = (expected_seal == actual_seal)
+
+    detail = {
+        "vector_id": vector_id,
+        "status": "PASS" if is_pass else "FAIL",
+        "expected": expected_seal,
+        "actual": actual_seal,
+        "elapsed_seconds": elapsed
+    }
+    if not is_pass:
+        detail["reason"] = "seal_mismatch"
+    return detail
+
+
+def _print_row(detail: dict) -> None:
+    vector_id = detail["vector_id"]
+    status = detail["status"]
+
+    if detail.get("reason") == "invalid_expected_seal_length":
+        print(f"{vector_id:<15} | {status:<10} | {'Invalid expected seal length':<20} | {'-':>8}")
+        return
+    if detail.get("reason") == "schema_invalid":
+        print(f"{vector_id:<15} | {status:<10} | {'Schema invalid':<20} | {'-':>8}")
+        return
+
+    # Short preview of the seal for the console
+    actual_seal = detail["actual"]
+    preview = actual_seal[:16] + "..." if actual_seal else "N/A"
+    print(f"{vector_id:<15} | {status:<10} | {preview:<20} | {detail['elapsed_seconds']:8.3f}")
+
+
+def _run_details(vector_files, results_dir: pathlib.Path, jobs: int, trace: TraceConfig,
+                 validate: bool = False, metrics: Metrics = None):
+    """
+    Execute vectors and yield report details in input order, regardless
+    of how many workers produced them. Worker metrics are merged into
+    `metrics`.
+    """
+    for detail in _execute_details(vector_files, results_dir, jobs, trace, validate,
+                                   metrics is not None):
+        snapshot = detail.pop("metrics", None)
+        if snapshot is not None:
+            metrics.merge(snapshot)
+        yield detail
+
+
+def _execute_details(vector_files, results_dir: pathlib.Path, jobs: int, trace: TraceConfig,
+                     validate: bool, collect_metrics: bool):
+    if jobs <= 1:
+        for entry in vector_files:
+            yield _process_vector(entry, results_dir, trace, validate, collect_metrics)
+        return
+
+    # Large chunks keep IPC overhead low on big corpora; small corpora still
+    # get spread across all workers.
+    chunksize = max(1, min(256, len(vector_files) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_process_vector, vector_files,
+                           [results_dir] * len(vector_files),
+                           [trace] * len(vector_files),
+                           [validate] * len(vector_files),
+                           [collect_metrics] * len(vector_files),
+                           chunksize=chunksize)
+        try:
+            yield from results
+        finally:
+            # Strict mode may stop consuming early; drop queued work.
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_details(vector_files, results_dir: pathlib.Path, jobs: int, trace: TraceConfig,
+                  cache=None, validate: bool = False, metrics: Metrics = None):
+    """
+    Yield report details in sorted vector order. Vectors with a cache hit
+    reuse their stored detail (including the seal); only misses are
+    executed, and their details are stored for the next run.
+    """
+    if cache is None:
+        yield from _run_details(vector_files, results_dir, jobs, trace, validate, metrics)
+        return
+
+    # A result computed without --validate must not answer a --validate
+    # run (it never checked the schema), so the flag is part of the key
+    mode = b"\x01" if validate else b"\x00"
+    keys = [cache.key(mode + _entry_bytes(entry)) for entry in vector_files]
+    hits = {}
+    for i, key in enumerate(keys):
+        detail = cache.get(key)
+        if detail is not None:
+            hits[i] = detail
 
+    misses = [entry for i, entry in enumerate(vector_files) if i not in hits]
+    computed = _run_details(misses, results_dir, jobs, trace, validate, metrics)
+    try:
+        for i, key in enumerate(keys):
+            if i in hits:
+                yield hits[i]
+                continue
+            detail = next(computed)
+            if detail.get("reason") != "schema_invalid":
+                cache.put(key, detail)
+            yield detail
+    finally:
+        computed.close()
 
-def run_suite(strict: bool = False) -> int:
+
+def run_suite(strict: bool = False, jobs: int = 1, use_cache: bool = True,
+              cache_max_bytes: int = DEFAULT_MAX_BYTES, pack_path: str = None,
+              trace: TraceConfig = TraceConfig(), results_dir: str = None,
+              validate: bool = False, metrics_path: str = None) -> int:
     base_dir = pathlib.Path(__file__).resolve().parent.parent
     vectors_dir = base_dir / "vectors"
-    results_dir = base_dir / "conformance_results"
-    results_dir.mkdir(exist_ok=True)
+    if results_dir is None:
+        results_dir = base_dir / "conformance_results"
+    results_dir = pathlib.Path(results_dir)
+    results_dir.mkdir(parents=True, exist_ok=True)
 
-    vector_files = sorted(vectors_dir.glob("V*.json"))
+    if pack_path is not None:
+        # Container order is the report order (the converter packs sorted files).
+        pack_path = str(pathlib.Path(pack_path).resolve())
+        vector_files = [PackEntry(pack_path, i) for i in range(len(_open_pack(pack_path)))]
+        source = pack_path
+    else:
+        vector_files = sorted(vectors_dir.glob("V*.json"))
+        source = vectors_dir
     if not vector_files:
-        print(f"[-] No vectors found in {vectors_dir}")
+        print(f"[-] No vectors found in {source}")
         return 1
 
+    cache = None
+    if use_cache:
+        cache = ResultCache(results_dir / ".cache",
+                            code_fingerprint(CACHE_FINGERPRINT_FILES),
+                            max_bytes=cache_max_bytes)
+
+    metrics = Metrics() if metrics_path is not None else None
+
     start_ts = datetime.now()
     print(f"[*] ISO-16 Conformance Suite Started: {start_ts}")
-    print(f"[*] Found {len(vector_files)} vectors. Processing...\n")
+    print(f"[*] Found {len(vector_files)} vectors. Processing with {jobs} job(s)...\n")
 
     report = {
         "timestamp": start_ts.isoformat(),
@@ -42,90 +306,33 @@ def run_suite(strict: bool = False) -> int:
     print(f"{'Vector ID':<15} | {'Status':<10} | {'Seal Verification':<20} | {'Time (s)':>8}")
     print("-" * 80)
 
-    for v_path in vector_files:
-        with v_path.open() as f:
-            vector_data = json.load(f)
-
-        vector_id = vector_data.get("id", v_path.stem)
-        expected_seal = vector_data.get("expected_seal", "").strip().lower()
-
-        # Basic seal sanity check
-        if len(expected_seal) != 64:
-            print(f"{vector_id:<15} | {'FAIL':<10} | {'Invalid expected seal length':<20} | {'-':>8}")
-            report["summary"]["fail"] += 1
-            report["details"].append({
-                "vector_id": vector_id,
-                "status": "FAIL",
-                "reason": "invalid_expected_seal_length",
-                "expected": expected_seal,
-                "actual": None,
-                "elapsed_seconds": None
-            })
-            if strict:
-                break
-            continue
-
-        # 1. Execute the Reference Runner
-        t0 = datetime.now()
-        run_vector(v_path, results_dir)
-        elapsed = (datetime.now() - t0).total_seconds()
-
-        # 2. Load actual result
-        result_path = results_dir / f"{vector_id}_result.json"
-        if not result_path.exists():
-            print(f"{vector_id:<15} | {'FAIL':<10} | {'Missing result file':<20} | {elapsed:8.3f}")
-            report["summary"]["fail"] += 1
-            report["details"].append({
-                "vector_id": vector_id,
-                "status": "FAIL",
-                "reason": "missing_result_file",
-                "expected": expected_seal,
-                "actual": None,
-                "elapsed_seconds": elapsed
-            })
-            if strict:
-                break
-            continue
-
-        with result_path.open() as f:
-            actual_data = json.load(f)
-
-        actual_seal = actual_data.get("seal_out", "").strip().lower()
-        is_pass = (expected_seal == actual_seal)
-        status = "PASS" if is_pass else "FAIL"
+    for detail in _iter_details(vector_files, results_dir, jobs, trace, cache, validate, metrics):
+        _print_row(detail)
 
+        is_pass = detail["status"] == "PASS"
         if is_pass:
             report["summary"]["pass"] += 1
         else:
             report["summary"]["fail"] += 1
-
-        # Short preview of the seal for the console
-        preview = actual_seal[:16] + "..." if actual_seal else "N/A"
-
-        print(f"{vector_id:<15} | {status:<10} | {preview:<20} | {elapsed:8.3f}")
-
-        detail = {
-            "vector_id": vector_id,
-            "status": status,
-            "expected": expected_seal,
-            "actual": actual_seal,
-            "elapsed_seconds": elapsed
-        }
-        if not is_pass:
-            detail["reason"] = "seal_mismatch"
         report["details"].append(detail)
 
         if strict and not is_pass:
             break
 
-    # 3. Final Report
+    # Final Report
     report_path = results_dir / "conformance_report.json"
     with report_path.open("w") as f:
         json.dump(report, f, indent=2)
 
     print("-" * 80)
+    if cache is not None:
+        evicted = cache.prune()
+        print(f"[*] Cache: {cache.hits} hits, {cache.misses} misses, {evicted} evicted.")
     print(f"[*] Results: {report['summary']['pass']} Passed, {report['summary']['fail']} Failed.")
     print(f"[*] Full report saved to: {report_path}")
+    if metrics is not None:
+        metrics.write(metrics_path)
+        print(f"[*] Metrics saved to: {metrics_path}")
     return 0 if report["summary"]["fail"] == 0 else 1
 
 
@@ -136,9 +343,71 @@ def main():
         action="store_true",
         help="Stop on first failure instead of running all vectors."
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 = one per CPU core). Default: 1."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-execute every vector instead of reusing cached results."
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Evict least-recently-used cache entries above this size (MiB)."
+    )
+    parser.add_argument(
+        "--pack",
+        help="Read vectors from a packed .i16p container instead of conformance/vectors."
+    )
+    parser.add_argument(
+        "--trace",
+        choices=TRACE_MODES,
+        default="vcd",
+        help="Waveform trace mode: none, vcd (every vector), ring (last cycles, "
+             "written only for failing vectors) or sampled. Default: vcd."
+    )
+    parser.add_argument(
+        "--trace-depth",
+        type=int,
+        default=TraceConfig().depth,
+        help="Cycles kept per vector with --trace ring."
+    )
+    parser.add_argument(
+        "--trace-sample",
+        type=int,
+        default=TraceConfig().sample_every,
+        help="Trace 1 in N vectors with --trace sampled."
+    )
+    parser.add_argument(
+        "--results-dir",
+        help="Directory for traces, cache and the report. Default: conformance/conformance_results."
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Validate each vector against vector_schema.json before executing it."
+    )
+    parser.add_argument(
+        "--metrics",
+        help="Write per-state and per-phase counters to this file "
+             "(Prometheus text if it ends in .prom, JSON otherwise)."
+    )
     args = parser.parse_args()
 
-    exit_code = run_suite(strict=args.strict)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    exit_code = run_suite(strict=args.strict, jobs=jobs,
+                          use_cache=not args.no_cache,
+                          cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+                          pack_path=args.pack,
+                          trace=TraceConfig(args.trace, args.trace_depth, args.trace_sample),
+                          results_dir=args.results_dir,
+                          validate=args.validate,
+                          metrics_path=args.metrics)
     sys.exit(exit_code)
 
 
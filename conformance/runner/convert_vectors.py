@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Vector Converter (JSON ⇄ .i16p)
+--------------------------------------
+Converts conformance vectors between the human‑facing JSON form
+(conformance/vectors/*.json) and the packed, mmap‑able container defined
+in utils/vector_pack.py.
+
+  pack    JSON files → one .i16p container (validated against
+          vector_schema.json unless --no-validate)
+  unpack  .i16p container → one <vector_id>.json per vector
+
+Usage:
+    python3 convert_vectors.py pack ../vectors/V*.json -o corpus.i16p
+    python3 convert_vectors.py unpack corpus.i16p -o out_dir/
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+
+from utils.vector_pack import VectorPack, VectorPackWriter
+
+SCHEMA_VECTOR = pathlib.Path(__file__).resolve().parent.parent / "schema" / "vector_schema.json"
+
+
+def _validator(enabled: bool):
+    if not enabled:
+        return lambda data: None
+    from utils.schema_validate import validate_json
+    return lambda data: validate_json(data, str(SCHEMA_VECTOR))
+
+
+def pack(json_paths, out_path: pathlib.Path, validate: bool = True) -> int:
+    check = _validator(validate)
+    with VectorPackWriter(out_path) as w:
+        for path in json_paths:
+            with open(path) as f:
+                vector = json.load(f)
+            try:
+                check(vector)
+                w.add(vector)
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}") from None
+        return w.vector_count
+
+
+def unpack(pack_path: pathlib.Path, out_dir: pathlib.Path, validate: bool = True) -> int:
+    check = _validator(validate)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with VectorPack(pack_path) as vp:
+        for vector in vp:
+            check(vector)
+            with (out_dir / f"{vector['vector_id']}.json").open("w") as f:
+                json.dump(vector, f, indent=2)
+                f.write("\n")
+        return len(vp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Vector Converter (JSON <-> .i16p)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_pack = sub.add_parser("pack", help="Pack JSON vectors into a .i16p container.")
+    p_pack.add_argument("inputs", nargs="+", type=pathlib.Path)
+    p_pack.add_argument("-o", "--output", type=pathlib.Path, required=True)
+
+    p_unpack = sub.add_parser("unpack", help="Unpack a .i16p container into JSON vectors.")
+    p_unpack.add_argument("input", type=pathlib.Path)
+    p_unpack.add_argument("-o", "--output", type=pathlib.Path, required=True)
+
+    for p in (p_pack, p_unpack):
+        p.add_argument("--no-validate", action="store_true",
+                       help="Skip vector_schema.json validation.")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "pack":
+            n = pack(args.inputs, args.output, validate=not args.no_validate)
+        else:
+            n = unpack(args.input, args.output, validate=not args.no_validate)
+    except ValueError as e:
+        print(f"[-] {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"[*] {args.command}: {n} vectors")
+
+
+if __name__ == "__main__":
+    main()
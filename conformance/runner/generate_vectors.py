@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Synthetic Vector Generator (Informative)
+-----------------------------------------------
+Streams large, deterministic corpora of schema‑valid conformance vectors
+for load and soak testing, together with the expected outputs computed
+by the reference engine (ISO16Engine).
+
+Every vector i is generated from its own RNG seeded with (seed, i), so a
+corpus is reproducible, can be generated in parallel, and vector i can
+be regenerated on its own. Nothing is held in memory beyond the current
+chunk.
+
+Controls:
+
+  • --plugins MIN-MAX        plugins per vector
+  • --domains A=w,B=w,...    domain mix (weights)
+  • --symmetry-fail F        fraction with one adjacent delta > epsilon
+  • --error-overflow F       fraction with error_total > epsilon
+  • --bad-status F           fraction with one non‑OK plugin status
+  • --edge F                 fraction with coordinates, warps and errors
+                             near INT32_MIN/INT32_MAX (wraparound cases)
+  • --boundary F             share of symmetry and error failures that
+                             miss by exactly one ulp (|Δ| or error_total
+                             = ε + 1); edge vectors also place the
+                             failing step (or a passing one) across the
+                             INT32_MAX → INT32_MIN wrap
+
+Outputs:
+
+  • JSON Lines (-o corpus.jsonl) or a packed .i16p container
+    (-o corpus.i16p, utils/vector_pack.py)
+  • --expected PATH          expected outputs as JSON Lines
+                             (expected_schema.json records)
+  • --embed-seal             store the expected Tetra‑Seal in each vector
+                             as expected_seal (checked by the orchestrator)
+
+Usage:
+    python3 generate_vectors.py --count 1000000 --seed 7 -o corpus.i16p \\
+        --expected corpus_expected.jsonl --embed-seal --jobs 8
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+from typing import NamedTuple
+
+from iso16_reference_runner import ISO16Engine
+from utils.q16 import EPSILON, INT32_MAX, INT32_MIN, _to_int32
+from utils.vector_pack import VectorPackWriter
+
+DOMAINS  = ("Refraction", "FrameDrag", "Jitter", "Custom")
+STATUSES = ("INSUFFICIENT_DATA", "OUT_OF_RANGE", "TIMEOUT", "SENSOR_MISMATCH")
+VERSIONS = ("1.0.0", "1.1.0", "2.0.0")
+
+CHUNK_SIZE = 1000
+
+
+class GeneratorConfig(NamedTuple):
+    seed: int = 16
+    min_plugins: int = 1
+    max_plugins: int = 8
+    domain_weights: tuple = (1, 1, 1, 1)  # in DOMAINS order
+    symmetry_fail: float = 0.25
+    error_overflow: float = 0.10
+    bad_status: float = 0.05
+    edge: float = 0.05
+    boundary: float = 0.5
+
+
+# ----------------------------------------------------------------------
+# Generation
+# ----------------------------------------------------------------------
+
+def _near_limit(rng) -> int:
+    k = rng.randint(0, 1 << 16)
+    return INT32_MAX - k if rng.random() < 0.5 else INT32_MIN + k
+
+
+def generate_vector(config: GeneratorConfig, i: int) -> dict:
+    """
+    Vector i of the corpus defined by `config`.
+    """
+    rng = random.Random(f"{config.seed}:{i}")
+    edge = rng.random() < config.edge
+
+    # PhaseState: a walk with adjacent steps in [-1, 1] per axis (symmetric),
+    # wrapping at the int32 limits
+    base = [_near_limit(rng) if edge else rng.randint(-(1 << 20), 1 << 20) for _ in range(3)]
+    phases = [base]
+    for _ in range(15):
+        phases.append([_to_int32(c + rng.choice((-1, 0, 0, 1))) for c in phases[-1]])
+
+    k, axis = rng.randrange(15), rng.randrange(3)
+    if rng.random() < config.symmetry_fail:
+        # Set the step phase[k] → phase[k+1] to a failing delta; either the
+        # smallest one (ε + 1) or a larger one
+        if rng.random() < config.boundary:
+            delta = EPSILON + 1
+        else:
+            delta = rng.randint(EPSILON + 1, 1 << 16)
+        delta *= rng.choice((-1, 1))
+        jump = delta - _to_int32(phases[k + 1][axis] - phases[k][axis])
+        for phase in phases[k + 1:]:
+            phase[axis] = _to_int32(phase[axis] + jump)
+
+    if edge and rng.random() < config.boundary:
+        # Shift the axis so the step at k straddles the int32 wrap; adjacent
+        # deltas (mod 2^32) and hence the expected outputs are unchanged
+        step = _to_int32(phases[k + 1][axis] - phases[k][axis])
+        shift = (INT32_MAX if step >= 0 else INT32_MIN) - phases[k][axis]
+        for phase in phases:
+            phase[axis] = _to_int32(phase[axis] + shift)
+
+    # Plugins
+    count = rng.randint(config.min_plugins, config.max_plugins)
+    domains = rng.choices(DOMAINS, weights=config.domain_weights, k=count)
+    plugins = {}
+    for j, domain in enumerate(domains):
+        pid = f"{domain.lower()}_{j:02d}"
+        if edge:
+            warp = [_near_limit(rng) for _ in range(3)]
+        else:
+            warp = [rng.randint(-(8 << 16), 8 << 16) for _ in range(3)]
+        plugins[pid] = {
+            "id": pid,
+            "domain": domain,
+            "warp_vector": warp,
+            "error": 0,
+            "version": rng.choice(VERSIONS),
+            "status": "OK",
+        }
+
+    pids = list(plugins)
+    if rng.random() < config.error_overflow:
+        target = plugins[rng.choice(pids)]
+        if edge:
+            target["error"] = INT32_MAX - rng.randint(0, 1 << 16)
+        elif rng.random() < config.boundary:
+            target["error"] = EPSILON + 1
+        else:
+            target["error"] = rng.randint(EPSILON + 1, 1 << 16)
+    elif rng.random() < 0.5:
+        plugins[rng.choice(pids)]["error"] = EPSILON
+    if edge and rng.random() < 0.5:
+        if len(pids) >= 3 and rng.random() < config.boundary:
+            # Three errors whose int32 sum wraps to exactly ε or ε + 1
+            a, b, c = rng.sample(pids, 3)
+            plugins[a]["error"] = plugins[b]["error"] = INT32_MAX
+            plugins[c]["error"] = 2 + EPSILON + rng.randint(0, 1)
+            for pid in pids:
+                if pid not in (a, b, c):
+                    plugins[pid]["error"] = 0
+        else:
+            # Two large errors whose int32 sum wraps negative
+            for pid in rng.sample(pids, min(2, len(pids))):
+                plugins[pid]["error"] = INT32_MAX - rng.randint(0, 1 << 16)
+
+    if rng.random() < config.bad_status:
+        plugins[rng.choice(pids)]["status"] = rng.choice(STATUSES)
+
+    return {
+        "vector_id": f"G{i:09d}",
+        "initial_phase_state": phases,
+        "plugins": plugins,
+    }
+
+
+def expected_output(vector: dict) -> dict:
+    """
+    Expected outputs (expected_schema.json) from the reference engine.
+    """
+    engine = ISO16Engine(vector)
+    engine.run()
+    return {
+        "vector_id": vector["vector_id"],
+        "warp_total": engine.warp_total,
+        "error_total": engine.error_total,
+        "phase_state_warped": engine.phase_state_warped,
+        "symmetry_ok": bool(engine.symmetry_ok),
+        "error_ok": bool(engine.error_ok),
+        "true_delivery": bool(engine.true_delivery),
+        "tetra_seal": f"{engine.seal_out:064x}",
+    }
+
+
+def _generate_chunk(args):
+    config, start, stop, with_expected = args
+    out = []
+    for i in range(start, stop):
+        vector = generate_vector(config, i)
+        out.append((vector, expected_output(vector) if with_expected else None))
+    return out
+
+
+def generate(config: GeneratorConfig, count: int, with_expected: bool = True, jobs: int = 1):
+    """
+    Yield (vector, expected) for vectors 0..count-1 in order; `expected`
+    is None when with_expected is False.
+    """
+    chunks = ((config, s, min(s + CHUNK_SIZE, count), with_expected)
+              for s in range(0, count, CHUNK_SIZE))
+    if jobs <= 1:
+        for chunk in map(_generate_chunk, chunks):
+            yield from chunk
+        return
+    with multiprocessing.Pool(jobs) as pool:
+        for chunk in pool.imap(_generate_chunk, chunks):
+            yield from chunk
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+
+def _parse_range(text: str):
+    lo, _, hi = text.partition("-")
+    lo, hi = int(lo), int(hi or lo)
+    if not 1 <= lo <= hi:
+        raise argparse.ArgumentTypeError("expected MIN-MAX with 1 <= MIN <= MAX")
+    return lo, hi
+
+
+def _parse_domains(text: str):
+    weights = dict.fromkeys(DOMAINS, 0.0)
+    for item in text.split(","):
+        name, _, w = item.partition("=")
+        if name not in weights:
+            raise argparse.ArgumentTypeError(f"unknown domain {name!r}")
+        weights[name] = float(w or 1)
+    return tuple(weights[d] for d in DOMAINS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Synthetic Vector Generator")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Output file: .i16p for a packed container, otherwise JSON Lines ('-' for stdout).")
+    parser.add_argument("--count", type=int, default=10000, help="Vectors to generate. Default: 10000.")
+    parser.add_argument("--seed", type=int, default=16, help="Corpus seed. Default: 16.")
+    parser.add_argument("--plugins", type=_parse_range, default=(1, 8), help="Plugins per vector, MIN-MAX. Default: 1-8.")
+    parser.add_argument("--domains", type=_parse_domains, default=(1, 1, 1, 1),
+                        help="Domain weights, e.g. Refraction=4,Jitter=1. Default: uniform.")
+    parser.add_argument("--symmetry-fail", type=float, default=0.25, help="Fraction with a symmetry failure.")
+    parser.add_argument("--error-overflow", type=float, default=0.10, help="Fraction with error_total > epsilon.")
+    parser.add_argument("--bad-status", type=float, default=0.05, help="Fraction with a non-OK plugin.")
+    parser.add_argument("--edge", type=float, default=0.05, help="Fraction with values near the int32 limits.")
+    parser.add_argument("--boundary", type=float, default=0.5,
+                        help="Share of failures that miss by exactly one ulp. Default: 0.5.")
+    parser.add_argument("--expected", help="Write expected outputs (JSON Lines) here.")
+    parser.add_argument("--embed-seal", action="store_true", help="Store the expected Tetra-Seal as expected_seal.")
+    parser.add_argument("--jobs", type=int, default=1, help="Generator processes. Default: 1.")
+    args = parser.parse_args()
+
+    config = GeneratorConfig(
+        seed=args.seed,
+        min_plugins=args.plugins[0],
+        max_plugins=args.plugins[1],
+        domain_weights=args.domains,
+        symmetry_fail=args.symmetry_fail,
+        error_overflow=args.error_overflow,
+        bad_status=args.bad_status,
+        edge=args.edge,
+        boundary=args.boundary,
+    )
+    with_expected = bool(args.expected) or args.embed_seal
+
+    packed = args.output.endswith(".i16p")
+    if packed:
+        sink = VectorPackWriter(args.output)
+    else:
+        sink = sys.stdout if args.output == "-" else open(args.output, "w")
+    expected_f = open(args.expected, "w") if args.expected else None
+
+    true_count = 0
+    try:
+        for n, (vector, expected) in enumerate(generate(config, args.count, with_expected, args.jobs), 1):
+            if expected is not None:
+                true_count += expected["true_delivery"]
+                if args.embed_seal:
+                    vector["expected_seal"] = expected["tetra_seal"]
+                if expected_f is not None:
+                    expected_f.write(json.dumps(expected, separators=(",", ":")) + "\n")
+            if packed:
+                sink.add(vector)
+            else:
+                sink.write(json.dumps(vector, separators=(",", ":")) + "\n")
+            if n % 100000 == 0:
+                print(f"[*] {n:,} vectors", file=sys.stderr)
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+        if expected_f is not None:
+            expected_f.close()
+
+    print(f"[*] Generated {args.count:,} vectors (seed {args.seed}) → {args.output}", file=sys.stderr)
+    if with_expected:
+        print(f"[*] Expected TRUE: {true_count:,}, FALSE: {args.count - true_count:,}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
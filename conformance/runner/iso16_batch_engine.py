@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Batch Evaluation Engine (Vectorized, Informative)
+--------------------------------------------------------
+Evaluates the True Delivery Loop for N PhaseStates at once using NumPy
+int32 arrays instead of stepping ISO16Engine one vector at a time.
+
+Inputs (per batch):
+
+  • phase_states   N×16×3 int32   initial PhaseState per vector
+  • plugin_warp    N×P×3  int32   warp_vector per plugin
+  • plugin_error   N×P    int32   error per plugin
+  • plugin_ok      N×P    bool    status == "OK" per plugin (optional)
+
+Outputs (per vector):
+
+  • warp_total, error_total, phase_state_warped
+  • symmetry_ok, error_ok, true_delivery
+
+All arithmetic is int32 with two's‑complement wraparound, matching
+utils/q16.py (q16_add, q16_sub, q16_abs incl. INT32_MIN clamping,
+q16_leq) bit for bit; see utils/q16_array.py. Vectors with fewer than P plugins are padded with
+zero warp, zero error and status OK, which leaves every output unchanged.
+"""
+
+import json
+import pathlib
+
+import numpy as np
+
+from utils.q16 import EPSILON
+from utils.q16_array import q16_abs
+
+
+PHASES = 16
+AXES   = 3
+
+
+class BatchResult:
+    """
+    Per‑vector outputs of a batch evaluation, stored as NumPy arrays
+    indexed by batch position.
+    """
+
+    def __init__(self, warp_total, error_total, phase_state_warped,
+                 symmetry_ok, error_ok, true_delivery):
+        self.warp_total         = warp_total           # N×3    int32
+        self.error_total        = error_total          # N      int32
+        self.phase_state_warped = phase_state_warped   # N×16×3 int32
+        self.symmetry_ok        = symmetry_ok          # N      bool
+        self.error_ok           = error_ok             # N      bool
+        self.true_delivery      = true_delivery        # N      bool
+
+    def __len__(self):
+        return len(self.error_total)
+
+    @property
+    def warp_sum_x(self):
+        """
+        X‑axis warp accumulator as the unsigned 32‑bit value exposed by
+        ISO16Engine.warp_sum_x.
+        """
+        return self.warp_total[:, 0].view(np.uint32)
+
+    def record(self, i: int) -> dict:
+        """
+        Return the outputs of vector `i` as plain Python values, using the
+        field names of expected_schema.json (and of utils/seal.py `actual`).
+        """
+        return {
+            "warp_total":         [int(w) for w in self.warp_total[i]],
+            "error_total":        int(self.error_total[i]),
+            "phase_state_warped": self.phase_state_warped[i].tolist(),
+            "symmetry_ok":        bool(self.symmetry_ok[i]),
+            "error_ok":           bool(self.error_ok[i]),
+            "true_delivery":      bool(self.true_delivery[i]),
+        }
+
+
+# ----------------------------------------------------------------------
+# Input packing
+# ----------------------------------------------------------------------
+
+def pack_vectors(vectors):
+    """
+    Pack a sequence of conformance vector dicts (vector_schema.json) into
+    batch arrays. Plugins are laid out in lexicographic id order, the same
+    order utils/seal.canonical_serialize uses.
+
+    Returns (phase_states, plugin_warp, plugin_error, plugin_ok).
+    """
+    n = len(vectors)
+    p = max((len(v["plugins"]) for v in vectors), default=0)
+
+    phase_states = np.zeros((n, PHASES, AXES), dtype=np.int32)
+    plugin_warp  = np.zeros((n, p, AXES), dtype=np.int32)
+    plugin_error = np.zeros((n, p), dtype=np.int32)
+    plugin_ok    = np.ones((n, p), dtype=bool)
+
+    for i, vector in enumerate(vectors):
+        phase_states[i] = vector["initial_phase_state"]
+        plugins = vector["plugins"]
+        for j, pid in enumerate(sorted(plugins.keys())):
+            plugin = plugins[pid]
+            plugin_warp[i, j]  = plugin["warp_vector"]
+            plugin_error[i, j] = plugin["error"]
+            plugin_ok[i, j]    = plugin["status"] == "OK"
+
+    return phase_states, plugin_warp, plugin_error, plugin_ok
+
+
+# ----------------------------------------------------------------------
+# Vectorized True Delivery Loop
+# ----------------------------------------------------------------------
+
+def evaluate_batch(phase_states, plugin_warp, plugin_error, plugin_ok=None) -> BatchResult:
+    """
+    Run ACCUMULATE → APPLY → CHECK for a whole batch.
+
+    Array shapes are documented in the module header. `plugin_ok` defaults
+    to all plugins reporting status OK.
+    """
+    phase_states = np.asarray(phase_states, dtype=np.int32)
+    plugin_warp  = np.asarray(plugin_warp, dtype=np.int32)
+    plugin_error = np.asarray(plugin_error, dtype=np.int32)
+
+    if phase_states.ndim != 3 or phase_states.shape[1:] != (PHASES, AXES):
+        raise ValueError("phase_states must have shape N×16×3")
+    n = phase_states.shape[0]
+    if plugin_warp.shape[0] != n or plugin_warp.shape[2:] != (AXES,):
+        raise ValueError("plugin_warp must have shape N×P×3")
+    if plugin_error.shape != plugin_warp.shape[:2]:
+        raise ValueError("plugin_error must have shape N×P")
+
+    # ACCUMULATE: wraparound sums over the plugin axis
+    warp_total  = plugin_warp.sum(axis=1, dtype=np.int32)
+    error_total = plugin_error.sum(axis=1, dtype=np.int32)
+
+    # APPLY: phase' = phase + warp_total on all 16 phases
+    warped = phase_states + warp_total[:, np.newaxis, :]
+
+    # CHECK: per‑axis |phase'[i] - phase'[i+1]| <= epsilon for i in [0,14]
+    deltas = q16_abs(warped[:, :-1, :] - warped[:, 1:, :])
+    symmetry_ok = (deltas <= EPSILON).all(axis=(1, 2))
+
+    error_ok = error_total <= EPSILON
+    if plugin_ok is not None:
+        error_ok &= np.asarray(plugin_ok, dtype=bool).all(axis=1)
+
+    true_delivery = symmetry_ok & error_ok
+
+    return BatchResult(warp_total, error_total, warped,
+                       symmetry_ok, error_ok, true_delivery)
+
+
+def evaluate_vectors(vectors) -> BatchResult:
+    """
+    Convenience wrapper: pack conformance vector dicts and evaluate them.
+    """
+    return evaluate_batch(*pack_vectors(vectors))
+
+
+if __name__ == "__main__":
+    base = pathlib.Path(__file__).resolve().parent.parent
+    vector_paths = sorted((base / "vectors").glob("V*.json"))
+
+    vectors = []
+    for vector_path in vector_paths:
+        with vector_path.open() as f:
+            vectors.append(json.load(f))
+
+    result = evaluate_vectors(vectors)
+    for i, vector in enumerate(vectors):
+        rec = result.record(i)
+        print(f"{vector['vector_id']:<10} warp_total={rec['warp_total']} "
+              f"error_total={rec['error_total']} "
+              f"symmetry_ok={rec['symmetry_ok']} error_ok={rec['error_ok']} "
+              f"true_delivery={rec['true_delivery']}")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Short‑Circuit Decision Path (Informative)
+------------------------------------------------
+Decides TRUE/FALSE for a conformance vector with the cheapest checks
+first, stopping at the first failure (iso16_core.md §8.2):
+
+  1. plugin status      any status != OK            → FALSE
+  2. error_total        sum(error) > epsilon         → FALSE   (§7)
+  3. symmetry           any adjacent |Δ| > epsilon   → FALSE   (§6)
+
+The symmetry check runs on the initial PhaseState: every phase receives
+the same warp_total, so under int32 wraparound
+(p[i] + w) - (p[i+1] + w) == p[i] - p[i+1], and the warped PhaseState is
+not needed to decide.
+
+The full audit record (warp_total, phase_state_warped, every flag and the
+Tetra‑Seal) is only materialized when Decision.audit_record() is called.
+"""
+
+import json
+import pathlib
+
+from utils.q16 import EPSILON, q16_abs, q16_add, q16_leq, q16_sub
+from utils.seal import canonical_serialize_and_hash
+
+CHECK_PLUGIN_STATUS = "plugin_status"
+CHECK_ERROR_TOTAL   = "error_total"
+CHECK_SYMMETRY      = "symmetry"
+
+
+class Decision:
+    """
+    Outcome of decide(). `failed_check` names the check that fired
+    (None for TRUE) and `failed_at` locates it: the plugin id, the
+    error_total, or the index i of the failing pair (i, i+1).
+    """
+
+    __slots__ = ("vector", "true_delivery", "failed_check", "failed_at", "_record")
+
+    def __init__(self, vector, failed_check=None, failed_at=None):
+        self.vector        = vector
+        self.true_delivery = failed_check is None
+        self.failed_check  = failed_check
+        self.failed_at     = failed_at
+        self._record       = None
+
+    def audit_record(self) -> dict:
+        """
+        Full evaluation and Tetra‑Seal, computed on first use.
+        """
+        if self._record is None:
+            actual = evaluate(self.vector)
+            self._record = audit_record(self.vector, actual)
+        return self._record
+
+
+# ----------------------------------------------------------------------
+# Short‑circuit decision
+# ----------------------------------------------------------------------
+
+def decide(vector: dict) -> Decision:
+    plugins = vector["plugins"]
+
+    # 1. Plugin status: a string compare per plugin
+    for pid in sorted(plugins.keys()):
+        if plugins[pid]["status"] != "OK":
+            return Decision(vector, CHECK_PLUGIN_STATUS, pid)
+
+    # 2. error_total <= epsilon
+    error_total = 0
+    for p in plugins.values():
+        error_total = q16_add(error_total, p["error"])
+    if not q16_leq(error_total, EPSILON):
+        return Decision(vector, CHECK_ERROR_TOTAL, error_total)
+
+    # 3. Adjacent‑pair symmetry, first failing pair wins
+    phases = vector["initial_phase_state"]
+    for i in range(15):
+        a, b = phases[i], phases[i + 1]
+        for axis in range(3):
+            if not q16_leq(q16_abs(q16_sub(a[axis], b[axis])), EPSILON):
+                return Decision(vector, CHECK_SYMMETRY, i)
+
+    return Decision(vector)
+
+
+# ----------------------------------------------------------------------
+# Full evaluation (audit path)
+# ----------------------------------------------------------------------
+
+def evaluate(vector: dict) -> dict:
+    """
+    Complete evaluation of every output field, in the `actual` layout
+    used by utils/seal.py.
+    """
+    plugins = vector["plugins"]
+
+    warp_total = [0, 0, 0]
+    error_total = 0
+    status_ok = True
+    for pid in sorted(plugins.keys()):
+        p = plugins[pid]
+        warp_total = [q16_add(w, d) for w, d in zip(warp_total, p["warp_vector"])]
+        error_total = q16_add(error_total, p["error"])
+        status_ok = status_ok and p["status"] == "OK"
+
+    warped = [[q16_add(c, w) for c, w in zip(phase, warp_total)]
+              for phase in vector["initial_phase_state"]]
+
+    symmetry_ok = all(
+        q16_leq(q16_abs(q16_sub(warped[i][axis], warped[i + 1][axis])), EPSILON)
+        for i in range(15) for axis in range(3)
+    )
+    error_ok = status_ok and q16_leq(error_total, EPSILON)
+
+    return {
+        "warp_total": warp_total,
+        "error_total": error_total,
+        "phase_state_warped": warped,
+        "symmetry_ok": symmetry_ok,
+        "error_ok": error_ok,
+        "true_delivery": symmetry_ok and error_ok,
+    }
+
+
+def audit_record(vector: dict, actual: dict) -> dict:
+    """
+    Flat audit record: the sealed vector fields, the outputs and the
+    Tetra‑Seal (the record format read by verify_seals.py).
+    """
+    record = {"vector_id": vector.get("vector_id")}
+    for key in ("initial_phase_state", "plugins", "implementation_id", "timestamp", "nonce"):
+        if key in vector:
+            record[key] = vector[key]
+    record.update(actual)
+    record["tetra_seal"] = canonical_serialize_and_hash(vector, actual)
+    return record
+
+
+if __name__ == "__main__":
+    base = pathlib.Path(__file__).resolve().parent.parent
+    for vector_path in sorted((base / "vectors").glob("V*.json")):
+        with vector_path.open() as f:
+            vector = json.load(f)
+        d = decide(vector)
+        verdict = "TRUE" if d.true_delivery else f"FALSE ({d.failed_check} @ {d.failed_at})"
+        print(f"{vector.get('vector_id', vector_path.stem):<10} {verdict}")
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Differential Harness (Informative)
+-----------------------------------------
+Cross‑checks the C++ reference runner (reference_runner.cpp with
+utils/seal.cpp) against the Python twin (ISO16Engine), vector by vector.
+
+  • the C++ runner is started once in worker mode (--worker) and fed
+    batches of vectors over a pipe, in the length‑prefixed protocol
+    documented in reference_runner.cpp; no process is spawned and no
+    file is written per vector
+  • a writer thread keeps up to --in-flight batches queued in the worker
+    while the main thread compares, so both sides stay busy
+  • the Python outputs are computed on a process pool (--jobs)
+  • plugins are sent in source order; the worker sorts them itself
+  • warp_total, error_total, phase_state_warped, symmetry_ok, error_ok,
+    true_delivery and tetra_seal are compared field by field
+
+Vectors come from a synthetic corpus (--generate COUNT, generated on the
+fly exactly as generate_vectors.py does), a packed .i16p container
+(--pack) or JSON / JSON Lines files. Every --generate run starts with
+the fixed boundary corpus (boundary_vectors()): adjacent |Δ| of ε and
+ε + 1, error_total of ε and ε + 1, both also across the int32 wrap,
+the INT32_MIN difference, wrapping warp totals and every non‑OK status,
+so an off‑by‑one threshold cannot pass on a lucky random corpus.
+
+Without --worker-bin the worker is compiled with $CXX (default g++) into
+a temporary directory, with -DISO16_NO_JSON: worker mode needs no JSON
+library.
+
+Mismatch stream (JSON Lines, stdout unless --mismatches), one line per
+vector whose outputs differ:
+
+    {"index": n, "vector_id": ..., "fields": [...],
+     "python": {...}, "cpp": {...}}
+
+`fields` is ["accepted"] when exactly one side could not canonically
+encode the vector (e.g. a plugin id over 255 bytes); the rejecting side
+is then null and the other carries all of its compared outputs.
+
+Usage:
+    python3 iso16_differential.py --generate 1000000 --edge 0.2 --jobs 8
+    python3 iso16_differential.py --pack corpus.i16p --worker-bin ./iso16_worker
+    python3 iso16_differential.py ../vectors/*.json corpus.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import pathlib
+import queue
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from itertools import chain
+
+from generate_vectors import STATUSES, GeneratorConfig, generate_vector
+from iso16_reference_runner import ISO16Engine
+from utils.q16 import EPSILON, INT32_MAX, INT32_MIN, _to_int32
+from utils.seal import _nonce_bytes
+from utils.vector_pack import VectorPack
+
+RUNNER_DIR = pathlib.Path(__file__).resolve().parent
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_IN_FLIGHT  = 2
+
+COMPARED_FIELDS = ("warp_total", "error_total", "phase_state_warped",
+                   "symmetry_ok", "error_ok", "true_delivery", "tetra_seal")
+
+# ----------------------------------------------------------------------
+# Worker protocol (little‑endian; see reference_runner.cpp)
+# ----------------------------------------------------------------------
+
+WORKER_GREETING = b"ISO16WK1"
+
+_U16         = struct.Struct("<H")
+_U32         = struct.Struct("<I")
+_PHASES      = struct.Struct("<48i")
+_PLUGIN_NUMS = struct.Struct("<4i")     # warp x/y/z + error
+_TRAILER     = struct.Struct("<Q16s")   # timestamp + nonce
+_RESULT      = struct.Struct("<B3ii48iB64s")
+
+
+def _encode_str(s: str) -> bytes:
+    b = s.encode("utf-8")
+    return _U16.pack(len(b)) + b
+
+
+def encode_vector(vector: dict) -> bytes:
+    """
+    Worker request record for one vector.
+    """
+    plugins = vector.get("plugins") or {}
+    parts = [_PHASES.pack(*chain.from_iterable(vector["initial_phase_state"])),
+             _U16.pack(len(plugins))]
+    for p in plugins.values():
+        parts += [_encode_str(p["id"]), _encode_str(p["domain"]),
+                  _PLUGIN_NUMS.pack(*p["warp_vector"], p["error"]),
+                  _encode_str(p["version"]), _encode_str(p["status"])]
+    parts += [_encode_str(vector.get("implementation_id", "iso16-ref")),
+              _TRAILER.pack(vector.get("timestamp", 0), _nonce_bytes(vector.get("nonce", bytes(16))))]
+    return b"".join(parts)
+
+
+def encode_batch(vectors) -> bytes:
+    """
+    Request payload (without the frame length) for a batch of vectors.
+    """
+    return _U32.pack(len(vectors)) + b"".join(encode_vector(v) for v in vectors)
+
+
+def decode_results(payload: bytes) -> list:
+    """
+    Worker response payload → one output dict (None if rejected) per vector.
+    """
+    count, = _U32.unpack_from(payload, 0)
+    if len(payload) != _U32.size + count * _RESULT.size:
+        raise ValueError(f"worker response of {len(payload)} bytes for {count} vectors")
+    results = []
+    for fields in _RESULT.iter_unpack(payload[_U32.size:]):
+        if not fields[0]:
+            results.append(None)
+            continue
+        warped, flags = fields[5:53], fields[53]
+        results.append({
+            "warp_total": list(fields[1:4]),
+            "error_total": fields[4],
+            "phase_state_warped": [list(warped[k:k + 3]) for k in range(0, 48, 3)],
+            "symmetry_ok": bool(flags & 1),
+            "error_ok": bool(flags & 2),
+            "true_delivery": bool(flags & 4),
+            "tetra_seal": fields[54].decode("ascii"),
+        })
+    return results
+
+
+def build_worker(out_dir, cxx: str = None) -> str:
+    """
+    Compile the worker‑only runner into `out_dir`; returns the binary path.
+    """
+    binary = os.path.join(out_dir, "iso16_worker")
+    cmd = [cxx or os.environ.get("CXX", "g++"), "-std=c++17", "-O2", "-DISO16_NO_JSON",
+           "-o", binary, str(RUNNER_DIR / "reference_runner.cpp"), str(RUNNER_DIR / "utils" / "seal.cpp")]
+    print(f"[*] Building worker: {' '.join(cmd)}", file=sys.stderr)
+    subprocess.run(cmd, check=True)
+    return binary
+
+
+class ReferenceWorker:
+    """
+    A resident C++ runner in worker mode. submit() queues a request
+    payload (written by a background thread, so a large batch never
+    blocks the caller on a full pipe); receive() returns the results of
+    the oldest outstanding batch.
+    """
+
+    def __init__(self, binary: str):
+        self.proc = subprocess.Popen([binary, "--worker"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self._requests = queue.Queue()
+        self._write_error = None
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+        greeting = self.proc.stdout.read(len(WORKER_GREETING))
+        if greeting != WORKER_GREETING:
+            self.close()
+            raise RuntimeError(f"{binary} is not an ISO-16 worker (greeting {greeting!r})")
+
+    def _write_loop(self):
+        stdin = self.proc.stdin
+        try:
+            while True:
+                payload = self._requests.get()
+                stdin.write(_U32.pack(len(payload)))
+                if not payload:
+                    break
+                stdin.write(payload)
+                stdin.flush()
+            stdin.close()
+        except (BrokenPipeError, OSError) as exc:
+            self._write_error = exc
+
+    def submit(self, payload: bytes) -> None:
+        self._requests.put(payload)
+
+    def receive(self) -> list:
+        header = self.proc.stdout.read(_U32.size)
+        if len(header) == _U32.size:
+            length, = _U32.unpack(header)
+            payload = self.proc.stdout.read(length)
+            if len(payload) == length:
+                return decode_results(payload)
+        status = self.proc.wait()
+        detail = f" ({self._write_error})" if self._write_error else ""
+        raise RuntimeError(f"worker exited with status {status} mid-batch{detail}")
+
+    def evaluate(self, vectors) -> list:
+        """
+        Outputs of the C++ runner for one batch of vectors.
+        """
+        self.submit(encode_batch(vectors))
+        return self.receive()
+
+    def close(self) -> int:
+        if self.proc.poll() is None:
+            self._requests.put(b"")  # zero‑length frame ends the session
+            self._writer.join()
+        self.proc.stdout.close()
+        return self.proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ----------------------------------------------------------------------
+# Python side
+# ----------------------------------------------------------------------
+
+def reference_outputs(vector: dict):
+    """
+    ISO16Engine outputs for `vector`; None if it cannot be canonically
+    encoded.
+    """
+    try:
+        engine = ISO16Engine(vector)
+        engine.run()
+    except ValueError:
+        return None
+    return {
+        "warp_total": engine.warp_total,
+        "error_total": engine.error_total,
+        "phase_state_warped": engine.phase_state_warped,
+        "symmetry_ok": bool(engine.symmetry_ok),
+        "error_ok": bool(engine.error_ok),
+        "true_delivery": bool(engine.true_delivery),
+        "tetra_seal": f"{engine.seal_out:064x}",
+    }
+
+
+# ----------------------------------------------------------------------
+# Boundary corpus
+# ----------------------------------------------------------------------
+
+def _boundary_vector(phases=None, plugins=None, **trailer) -> dict:
+    vector = {
+        "initial_phase_state": phases or [[0, 0, 0] for _ in range(16)],
+        "plugins": plugins or {"p0": {"id": "p0", "domain": "Refraction", "warp_vector": [0, 0, 0],
+                                      "error": 0, "version": "1.0.0", "status": "OK"}},
+    }
+    vector.update(trailer)
+    return vector
+
+
+def _step_at(k: int, axis: int, first: int, delta: int) -> list:
+    """
+    Flat PhaseState except phase[k+1:] on `axis`, which is `delta` past
+    phase[k] (= first), wrapped to int32.
+    """
+    phases = [[0, 0, 0] for _ in range(16)]
+    for i, phase in enumerate(phases):
+        phase[axis] = first if i <= k else _to_int32(first + delta)
+    return phases
+
+
+def _plugins(*specs) -> dict:
+    """
+    Plugins p0, p1, ... from (warp_vector, error, status) tuples.
+    """
+    domains = ("Refraction", "FrameDrag", "Jitter", "Custom")
+    return {
+        f"p{j}": {"id": f"p{j}", "domain": domains[j % 4], "warp_vector": list(warp),
+                  "error": error, "version": "1.0.0", "status": status}
+        for j, (warp, error, status) in enumerate(specs)
+    }
+
+
+def boundary_vectors() -> list:
+    """
+    Fixed vectors on every decision boundary, where an off‑by‑one in a
+    threshold or in wraparound handling changes an output.
+    """
+    vectors = []
+
+    # Symmetry: |Δ| = ε passes, ε + 1 fails; per axis, both signs, at 0,
+    # across INT32_MAX → INT32_MIN and across INT32_MIN → INT32_MAX
+    for axis in range(3):
+        for magnitude in (EPSILON, EPSILON + 1):
+            for sign in (1, -1):
+                delta = sign * magnitude
+                vectors.append(_boundary_vector(_step_at(7, axis, 0, delta)))
+                wrap_from = INT32_MAX if sign > 0 else INT32_MIN
+                vectors.append(_boundary_vector(_step_at(7, axis, wrap_from, delta)))
+                vectors.append(_boundary_vector(_step_at(0, axis, wrap_from - delta + sign, delta)))
+
+    # |Δ| = 2^31: the difference is INT32_MIN, whose absolute value clamps
+    vectors.append(_boundary_vector(_step_at(3, 0, 0, INT32_MIN)))
+    vectors.append(_boundary_vector(_step_at(3, 1, INT32_MAX, INT32_MIN)))
+
+    # A warp that carries a symmetric PhaseState across the wrap
+    near_max = [[INT32_MAX - (i % 2), 0, 0] for i in range(16)]
+    vectors.append(_boundary_vector(near_max, _plugins(([1, 0, 0], 0, "OK"))))
+    vectors.append(_boundary_vector(near_max, _plugins(([INT32_MAX, INT32_MAX, INT32_MIN], 0, "OK"),
+                                                       ([2, INT32_MAX, INT32_MIN], 0, "OK"))))
+
+    # Error: error_total = ε passes, ε + 1 fails; also as sums and as
+    # int32 sums that wrap to exactly ε, ε + 1 or negative
+    zero = [0, 0, 0]
+    for errors in ((EPSILON,), (EPSILON + 1,), (0, EPSILON), (EPSILON, 1),
+                   (INT32_MAX, INT32_MAX, EPSILON + 2), (INT32_MAX, INT32_MAX, EPSILON + 3),
+                   (INT32_MAX, 1), (INT32_MAX, INT32_MAX), (INT32_MIN, INT32_MAX, EPSILON + 1)):
+        vectors.append(_boundary_vector(plugins=_plugins(*((zero, e, "OK") for e in errors))))
+
+    # Every non‑OK status, alone and next to an OK plugin, on an otherwise
+    # passing vector
+    for status in STATUSES:
+        vectors.append(_boundary_vector(plugins=_plugins((zero, 0, status))))
+        vectors.append(_boundary_vector(plugins=_plugins((zero, 0, "OK"), (zero, EPSILON, status))))
+
+    # Trailer fields at their limits
+    vectors.append(_boundary_vector(implementation_id="vendor‑x/2.0", timestamp=(1 << 64) - 1,
+                                    nonce="ff" * 16))
+
+    for n, vector in enumerate(vectors):
+        vector["vector_id"] = f"BOUNDARY-{n:04d}"
+    return vectors
+
+
+_packs = {}
+
+
+def _materialize(spec) -> list:
+    kind = spec[0]
+    if kind == "generate":
+        _, config, start, stop = spec
+        return [generate_vector(config, i) for i in range(start, stop)]
+    if kind == "pack":
+        _, path, start, stop = spec
+        pack = _packs.get(path)
+        if pack is None:
+            pack = _packs[path] = VectorPack(path)
+        return [pack.vector(i) for i in range(start, stop)]
+    return spec[1]
+
+
+def _prepare_batch(spec):
+    """
+    (request payload, [(vector_id, Python outputs)]) for one batch spec.
+    """
+    vectors = _materialize(spec)
+    refs = [(v.get("vector_id"), reference_outputs(v)) for v in vectors]
+    return encode_batch(vectors), refs
+
+
+def _batch_specs(args, batch_size: int):
+    if args.generate is not None:
+        yield ("vectors", boundary_vectors())
+        config = GeneratorConfig(seed=args.seed, edge=args.edge)
+        for start in range(0, args.generate, batch_size):
+            yield ("generate", config, start, min(start + batch_size, args.generate))
+    if args.pack:
+        with VectorPack(args.pack) as pack:
+            total = len(pack)
+        for start in range(0, total, batch_size):
+            yield ("pack", args.pack, start, min(start + batch_size, total))
+
+    batch = []
+    for path in args.vectors:
+        with open(path) as f:
+            if path.endswith(".json"):
+                batch.append(json.load(f))
+            else:
+                batch.extend(json.loads(line) for line in f if line.strip())
+        while len(batch) >= batch_size:
+            yield ("vectors", batch[:batch_size])
+            batch = batch[batch_size:]
+    if batch:
+        yield ("vectors", batch)
+
+
+# ----------------------------------------------------------------------
+# Comparison
+# ----------------------------------------------------------------------
+
+def compare(python, cpp) -> list:
+    """
+    Names of the outputs on which the two implementations differ.
+    """
+    if python is None or cpp is None:
+        return [] if python is cpp else ["accepted"]
+    return [f for f in COMPARED_FIELDS if python[f] != cpp[f]]
+
+
+def _reported(output, fields: list):
+    """
+    One side of a mismatch record: None if it rejected the vector, every
+    compared output if only it accepted, otherwise the differing fields.
+    """
+    if output is None:
+        return None
+    return {f: output[f] for f in (COMPARED_FIELDS if fields == ["accepted"] else fields)}
+
+
+def run_differential(specs, worker: ReferenceWorker, out, jobs: int = 1,
+                     in_flight: int = DEFAULT_IN_FLIGHT) -> dict:
+    """
+    Stream the batches described by `specs` through both implementations,
+    writing mismatches to `out`. Returns the counters.
+    """
+    stats = {"vectors": 0, "mismatches": 0, "rejected": 0}
+    pending = deque()
+    t0 = time.monotonic()
+    next_report = 100000
+
+    def drain_one():
+        refs = pending.popleft()
+        results = worker.receive()
+        if len(results) != len(refs):
+            raise RuntimeError(f"worker answered {len(results)} of {len(refs)} vectors")
+        for (vector_id, python), cpp in zip(refs, results):
+            n = stats["vectors"]
+            stats["vectors"] += 1
+            stats["rejected"] += python is None
+            fields = compare(python, cpp)
+            if fields:
+                stats["mismatches"] += 1
+                out.write(json.dumps({
+                    "index": n,
+                    "vector_id": vector_id,
+                    "fields": fields,
+                    "python": _reported(python, fields),
+                    "cpp": _reported(cpp, fields),
+                }, separators=(",", ":")) + "\n")
+
+    pool = multiprocessing.Pool(jobs) if jobs > 1 else None
+    try:
+        prepared = pool.imap(_prepare_batch, specs) if pool else map(_prepare_batch, specs)
+        for payload, refs in prepared:
+            worker.submit(payload)
+            pending.append(refs)
+            while len(pending) > in_flight:
+                drain_one()
+            if stats["vectors"] >= next_report:
+                next_report += 100000
+                rate = stats["vectors"] / (time.monotonic() - t0)
+                print(f"[*] {stats['vectors']:,} vectors, {stats['mismatches']:,} mismatches, "
+                      f"{rate:,.0f} vectors/s", file=sys.stderr)
+        while pending:
+            drain_one()
+    finally:
+        if pool is not None:
+            pool.terminate()
+    stats["seconds"] = time.monotonic() - t0
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Differential Harness (C++ worker vs Python engine)")
+    parser.add_argument("vectors", nargs="*", help="Vector files: .json (one vector) or JSON Lines.")
+    parser.add_argument("--generate", type=int, metavar="COUNT", help="Compare COUNT synthetic vectors.")
+    parser.add_argument("--seed", type=int, default=16, help="Synthetic corpus seed. Default: 16.")
+    parser.add_argument("--edge", type=float, default=0.05,
+                        help="Synthetic fraction with values near the int32 limits. Default: 0.05.")
+    parser.add_argument("--pack", help="Compare every vector of a packed .i16p container.")
+    parser.add_argument("--worker-bin", help="Prebuilt worker (reference_runner --worker). Default: build one.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Vectors per worker frame. Default: {DEFAULT_BATCH_SIZE}.")
+    parser.add_argument("--in-flight", type=int, default=DEFAULT_IN_FLIGHT,
+                        help=f"Batches queued in the worker. Default: {DEFAULT_IN_FLIGHT}.")
+    parser.add_argument("--jobs", type=int, default=1, help="Python reference processes. Default: 1.")
+    parser.add_argument("--mismatches", default="-", help="Mismatch stream (JSON Lines). Default: stdout.")
+    args = parser.parse_args()
+
+    if args.generate is None and not args.pack and not args.vectors:
+        parser.error("no vectors: give files, --generate or --pack")
+
+    out = sys.stdout if args.mismatches == "-" else open(args.mismatches, "w")
+    with tempfile.TemporaryDirectory(prefix="iso16_worker_") as build_dir:
+        binary = args.worker_bin or build_worker(build_dir)
+        try:
+            with ReferenceWorker(binary) as worker:
+                stats = run_differential(_batch_specs(args, args.batch_size), worker, out,
+                                         args.jobs, args.in_flight)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    rate = stats["vectors"] / stats["seconds"] if stats["seconds"] else 0.0
+    print(f"[*] Compared {stats['vectors']:,} vectors in {stats['seconds']:.1f}s ({rate:,.0f} vectors/s): "
+          f"{stats['mismatches']:,} mismatches, {stats['rejected']:,} rejected by the Python engine",
+          file=sys.stderr)
+    if stats["mismatches"]:
+        print("[-] Differential FAILED", file=sys.stderr)
+        raise SystemExit(1)
+    print("[*] Differential PASSED", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Incremental Evaluator (Informative)
+------------------------------------------
+Re‑evaluates a vector after a change to one plugin's output without
+recomputing everything from scratch. The evaluator keeps:
+
+  • running warp_total / error_total and a count of non‑OK plugins,
+    updated by the delta of the changed plugin (int32 wraparound)
+  • symmetry_ok, computed once: every phase receives the same
+    warp_total, so the adjacent deltas of the warped PhaseState equal
+    those of the initial PhaseState
+  • the canonical seal input (iso16_seal.md §3) as separate byte
+    segments: initial PhaseState, one segment per plugin, totals,
+    warped PhaseState, flags and the implementation_id/timestamp/nonce
+    tail
+
+update_plugin() re‑packs only the changed plugin's segment and the
+sections that depend on it; the warped PhaseState is re‑packed only when
+warp_total changes. serialize() joins the segments and is byte‑identical
+to utils/seal.canonical_serialize() on the current vector.
+"""
+
+import bisect
+import hashlib
+import struct
+
+from utils.q16 import EPSILON, q16_abs, q16_add, q16_leq, q16_sub
+from utils.seal import (SEAL_PREFIX, _DOMAIN_CODES, _FLAGS, _PHASE_STATE, _TAIL,
+                        _TOTALS, _encode_length_prefixed_string, _encode_string)
+
+_PLUGIN_VALUES = struct.Struct(">4i")  # warp_vector x/y/z + error
+
+_PLUGIN_FIELDS = ("id", "domain", "warp_vector", "error", "version", "status")
+
+
+def _plugin_segment(p: dict) -> bytes:
+    return b"".join((
+        _encode_length_prefixed_string(p["id"]),
+        bytes([_DOMAIN_CODES.get(p["domain"], 0xFF)]),
+        _PLUGIN_VALUES.pack(*p["warp_vector"], p["error"]),
+        _encode_length_prefixed_string(p["version"]),
+    ))
+
+
+class IncrementalEvaluator:
+    def __init__(self, vector: dict):
+        self._vector = {k: v for k, v in vector.items() if k != "plugins"}
+        self._plugins = {pid: dict(p) for pid, p in vector["plugins"].items()}
+        self._order = sorted(self._plugins.keys())
+
+        phases = [list(p) for p in vector["initial_phase_state"]]
+        self._vector["initial_phase_state"] = phases
+        self._coords = [c for phase in phases for c in phase]
+
+        # Running totals
+        self._warp_total = [0, 0, 0]
+        self._error_total = 0
+        self._not_ok = 0
+        for p in self._plugins.values():
+            self._add(p, +1)
+
+        # Constant for the lifetime of the PhaseState
+        self._symmetry_ok = all(
+            q16_leq(q16_abs(q16_sub(self._coords[k], self._coords[k + 3])), EPSILON)
+            for k in range(45)
+        )
+
+        # Seal input segments
+        nonce = vector.get("nonce", bytes(16))
+        if isinstance(nonce, str):
+            nonce = bytes.fromhex(nonce)
+        if len(nonce) != 16:
+            raise ValueError("Nonce must be 16 bytes")
+
+        self._seg_initial = _PHASE_STATE.pack(*self._coords)
+        self._seg_plugins = {pid: _plugin_segment(p) for pid, p in self._plugins.items()}
+        self._seg_tail = (_encode_string(vector.get("implementation_id", "iso16-ref")) +
+                          _TAIL.pack(vector.get("timestamp", 0), nonce))
+        self._seg_warped = None
+        self._warped_for = None
+
+    # ------------------------------------------------------------------
+    # Running totals
+    # ------------------------------------------------------------------
+
+    def _add(self, p: dict, sign: int) -> None:
+        """
+        Add (sign=+1) or remove (sign=-1) a plugin's contribution.
+        """
+        op = q16_add if sign > 0 else q16_sub
+        self._warp_total = [op(t, w) for t, w in zip(self._warp_total, p["warp_vector"])]
+        self._error_total = op(self._error_total, p["error"])
+        if p["status"] != "OK":
+            self._not_ok += sign
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update_plugin(self, pid: str, **fields) -> None:
+        """
+        Change some fields of plugin `pid` (any of id, domain, warp_vector,
+        error, version, status). An unknown `pid` adds a new plugin, which
+        then needs every field. The id must stay equal to `pid`. Fields
+        are checked before any state changes, so a rejected update leaves
+        the vector as it was.
+        """
+        unknown = set(fields) - set(_PLUGIN_FIELDS)
+        if unknown:
+            raise KeyError(f"Unknown plugin fields: {sorted(unknown)}")
+
+        old = self._plugins.get(pid)
+        if old is None:
+            missing = [f for f in _PLUGIN_FIELDS if f not in fields]
+            if missing:
+                raise KeyError(f"New plugin {pid!r} is missing fields: {missing}")
+            new = dict(fields)
+        else:
+            new = dict(old, **fields)
+        if new["id"] != pid:
+            raise ValueError(f"Plugin {pid!r} cannot have id {new['id']!r}")
+        if "warp_vector" in fields:
+            new["warp_vector"] = list(fields["warp_vector"])
+        segment = None
+        if old is None or any(k != "status" for k in fields):
+            segment = _plugin_segment(new)
+
+        if old is None:
+            bisect.insort(self._order, pid)
+        else:
+            self._add(old, -1)
+        self._plugins[pid] = new
+        self._add(new, +1)
+        if segment is not None:
+            self._seg_plugins[pid] = segment
+
+    def remove_plugin(self, pid: str) -> None:
+        self._add(self._plugins.pop(pid), -1)
+        del self._seg_plugins[pid]
+        self._order.remove(pid)
+
+    # ------------------------------------------------------------------
+    # Outputs
+    # ------------------------------------------------------------------
+
+    def _warped_segment(self) -> bytes:
+        if self._warped_for != self._warp_total:
+            warp = self._warp_total * 16
+            self._seg_warped = _PHASE_STATE.pack(*(q16_add(c, w) for c, w in zip(self._coords, warp)))
+            self._warped_for = list(self._warp_total)
+        return self._seg_warped
+
+    def _flags(self):
+        error_ok = self._not_ok == 0 and q16_leq(self._error_total, EPSILON)
+        return self._symmetry_ok, error_ok, self._symmetry_ok and error_ok
+
+    def vector(self) -> dict:
+        """
+        The current vector (vector_schema.json layout).
+        """
+        return dict(self._vector, plugins={pid: dict(p) for pid, p in self._plugins.items()})
+
+    def actual(self) -> dict:
+        """
+        The current outputs, in the `actual` layout used by utils/seal.py.
+        """
+        warped = [q16_add(c, w) for c, w in zip(self._coords, self._warp_total * 16)]
+        symmetry_ok, error_ok, true_delivery = self._flags()
+        return {
+            "warp_total": list(self._warp_total),
+            "error_total": self._error_total,
+            "phase_state_warped": [warped[k:k + 3] for k in range(0, 48, 3)],
+            "symmetry_ok": symmetry_ok,
+            "error_ok": error_ok,
+            "true_delivery": true_delivery,
+        }
+
+    @property
+    def true_delivery(self) -> bool:
+        return self._flags()[2]
+
+    def serialize(self) -> bytes:
+        """
+        Canonical seal input for the current state.
+        """
+        return b"".join((
+            self._seg_initial,
+            b"".join(self._seg_plugins[pid] for pid in self._order),
+            _TOTALS.pack(*self._warp_total, self._error_total),
+            self._warped_segment(),
+            _FLAGS.pack(*(1 if f else 0 for f in self._flags())),
+            self._seg_tail,
+        ))
+
+    def seal(self) -> str:
+        """
+        Tetra‑Seal (lowercase hex) for the current state.
+        """
+        return hashlib.sha3_256(SEAL_PREFIX + self.serialize()).hexdigest()
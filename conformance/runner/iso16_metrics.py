@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Run Instrumentation (Informative)
+----------------------------------------
+Counters for where time goes inside a conformance run:
+
+  • per engine state (COLLECT, PLUGIN, ACCUMULATE, CHECK, SEAL, DONE):
+    cycles and wall time
+  • per pipeline phase (json_load, schema_validation, engine, seal,
+    result_io): calls, total and maximum wall time
+  • per plugin (iso16_plugins.PluginExecutor): calls, total and maximum
+    wall time, non‑OK results
+
+Wall time is time.perf_counter_ns(), a monotonic clock. Phases are
+measured independently: "engine" is the whole ISO16Engine run, so it
+includes "seal".
+
+Instrumentation is off unless a Metrics object is passed in (ISO16Engine,
+PluginExecutor, execute_vector, the orchestrator); with None every hook
+is a single `is not None` test. The stepped engine is timed per cycle;
+run_to_completion() records the closed‑form cycle counts and times each
+state's block of work.
+
+Export with write(path): Prometheus text exposition format when the path
+ends in .prom, JSON otherwise. Snapshots from worker processes are
+combined with merge().
+"""
+
+import json
+import time
+from contextlib import contextmanager
+
+STATE_ORDER = ("COLLECT", "PLUGIN", "ACCUMULATE", "CHECK", "SEAL", "DONE")
+
+PHASE_JSON_LOAD         = "json_load"
+PHASE_SCHEMA_VALIDATION = "schema_validation"
+PHASE_ENGINE            = "engine"
+PHASE_SEAL              = "seal"
+PHASE_RESULT_IO         = "result_io"
+
+_NS = 1e-9
+
+
+class Metrics:
+    def __init__(self):
+        self.states = {}    # state → [cycles, ns]
+        self.phases = {}    # phase → [calls, total ns, max ns]
+        self.plugins = {}   # plugin id → [calls, total ns, max ns, non‑OK]
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def add_state(self, state: str, cycles: int, ns: int) -> None:
+        entry = self.states.get(state)
+        if entry is None:
+            entry = self.states[state] = [0, 0]
+        entry[0] += cycles
+        entry[1] += ns
+
+    def add_phase(self, phase: str, ns: int) -> None:
+        entry = self.phases.get(phase)
+        if entry is None:
+            entry = self.phases[phase] = [0, 0, 0]
+        entry[0] += 1
+        entry[1] += ns
+        if ns > entry[2]:
+            entry[2] = ns
+
+    def add_plugin(self, plugin_id: str, ns: int, status: str = "OK") -> None:
+        entry = self.plugins.get(plugin_id)
+        if entry is None:
+            entry = self.plugins[plugin_id] = [0, 0, 0, 0]
+        entry[0] += 1
+        entry[1] += ns
+        if ns > entry[2]:
+            entry[2] = ns
+        if status != "OK":
+            entry[3] += 1
+
+    @contextmanager
+    def phase(self, phase: str):
+        """
+        Time the enclosed block as one call of `phase`.
+        """
+        t0 = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter_ns() - t0)
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """
+        Plain‑data copy of the counters (JSON‑serializable, picklable).
+        """
+        return {
+            "states": {k: list(v) for k, v in self.states.items()},
+            "phases": {k: list(v) for k, v in self.phases.items()},
+            "plugins": {k: list(v) for k, v in self.plugins.items()},
+        }
+
+    def merge(self, snapshot: dict) -> None:
+        """
+        Add the counters of a snapshot (e.g. from a worker process).
+        """
+        for state, (cycles, ns) in snapshot.get("states", {}).items():
+            self.add_state(state, cycles, ns)
+        for phase, (calls, ns, max_ns) in snapshot.get("phases", {}).items():
+            entry = self.phases.setdefault(phase, [0, 0, 0])
+            entry[0] += calls
+            entry[1] += ns
+            entry[2] = max(entry[2], max_ns)
+        for pid, (calls, ns, max_ns, not_ok) in snapshot.get("plugins", {}).items():
+            entry = self.plugins.setdefault(pid, [0, 0, 0, 0])
+            entry[0] += calls
+            entry[1] += ns
+            entry[2] = max(entry[2], max_ns)
+            entry[3] += not_ok
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_json(self) -> dict:
+        def state_key(item):
+            return STATE_ORDER.index(item[0]) if item[0] in STATE_ORDER else len(STATE_ORDER)
+
+        return {
+            "states": {
+                state: {"cycles": cycles, "seconds": ns * _NS}
+                for state, (cycles, ns) in sorted(self.states.items(), key=state_key)
+            },
+            "phases": {
+                phase: {"calls": calls, "seconds": ns * _NS, "max_seconds": max_ns * _NS}
+                for phase, (calls, ns, max_ns) in sorted(self.phases.items())
+            },
+            "plugins": {
+                pid: {"calls": calls, "seconds": ns * _NS, "max_seconds": max_ns * _NS,
+                      "non_ok": not_ok}
+                for pid, (calls, ns, max_ns, not_ok) in sorted(self.plugins.items())
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        lines = []
+
+        def family(name, kind, help_text, label, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in samples:
+                escaped = key.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                lines.append(f'{name}{{{label}="{escaped}"}} {value!r}')
+
+        snap = self.to_json()
+        states, phases, plugins = snap["states"], snap["phases"], snap["plugins"]
+        family("iso16_state_cycles_total", "counter", "Engine cycles spent in each state.",
+               "state", [(k, v["cycles"]) for k, v in states.items()])
+        family("iso16_state_seconds_total", "counter", "Wall time spent in each engine state.",
+               "state", [(k, v["seconds"]) for k, v in states.items()])
+        family("iso16_phase_calls_total", "counter", "Pipeline phase executions.",
+               "phase", [(k, v["calls"]) for k, v in phases.items()])
+        family("iso16_phase_seconds_total", "counter", "Wall time spent in each pipeline phase.",
+               "phase", [(k, v["seconds"]) for k, v in phases.items()])
+        family("iso16_phase_max_seconds", "gauge", "Longest single execution of each pipeline phase.",
+               "phase", [(k, v["max_seconds"]) for k, v in phases.items()])
+        family("iso16_plugin_calls_total", "counter", "Plugin evaluations.",
+               "plugin", [(k, v["calls"]) for k, v in plugins.items()])
+        family("iso16_plugin_seconds_total", "counter", "Wall time spent in each plugin.",
+               "plugin", [(k, v["seconds"]) for k, v in plugins.items()])
+        family("iso16_plugin_max_seconds", "gauge", "Longest single evaluation of each plugin.",
+               "plugin", [(k, v["max_seconds"]) for k, v in plugins.items()])
+        family("iso16_plugin_non_ok_total", "counter", "Plugin evaluations with a non-OK status.",
+               "plugin", [(k, v["non_ok"]) for k, v in plugins.items()])
+        return "\n".join(lines) + "\n"
+
+    def write(self, path) -> None:
+        """
+        Write the counters to `path`: Prometheus text for *.prom, else JSON.
+        """
+        path = str(path)
+        with open(path, "w") as f:
+            if path.endswith(".prom"):
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.to_json(), f, indent=2)
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Plugin Registry and Executor (Informative)
+-------------------------------------------------
+Runs registered plugins against a PhaseState and produces the `plugins`
+object of a conformance vector (vector_schema.json).
+
+Per iso16_plugins.md §4.3 a plugin is a pure function
+
+    output = f(phase_state)
+
+where phase_state is the 16×3 Q16.16 PhaseState (tuple of tuples) and
+output is (warp_vector, error) or a dict with "warp_vector", "error" and
+optionally "status". A plugin may also raise PluginStatus to report a
+non‑OK status (e.g. INSUFFICIENT_DATA).
+
+Per §5.1 plugins are evaluated independently and concurrently:
+
+  • executor="thread"   ThreadPoolExecutor; suited to plugins that release
+                        the GIL (NumPy, native extensions, I/O)
+  • executor="process"  ProcessPoolExecutor; plugin functions must be
+                        importable module‑level callables
+
+Each plugin has a timeout, measured from when its call starts running
+on a worker (process executor: when it is handed to a worker), so time
+spent queued never counts against it. A plugin that
+has not finished in time is reported with status TIMEOUT, zero warp and
+zero error. A running call cannot be cancelled: if one is still running
+when the next evaluation starts, the pool is retired (its stuck worker
+finishes in the background) and a fresh one takes over, so healthy
+plugins never queue behind it. A plugin that raises anything other than
+PluginStatus, or returns an output that is not three int32 warp
+components, a non‑negative int32 error and a known status, is reported
+as INSUFFICIENT_DATA with zero warp and zero error. Results are merged in
+lexicographic plugin id order, the order canonical_serialize uses.
+
+Because plugins are pure, an output depends only on (id, version,
+PhaseState). An optional PluginMemo caches outputs under a BLAKE2b digest
+of the packed big‑endian 16×3 PhaseState; entries of a plugin are dropped
+as soon as it is seen with a different version. Only outputs the plugin
+actually returned (or reported through PluginStatus) are cached, and
+only after they pass validation; TIMEOUT and failed calls never are.
+
+With an iso16_metrics.Metrics, the executor records each plugin's wall
+time (measured in the worker, so queueing is excluded) and non‑OK
+results; memo hits are not timed.
+"""
+
+import concurrent.futures
+import hashlib
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+from utils.q16 import INT32_MAX, INT32_MIN
+
+DOMAINS  = ("Refraction", "FrameDrag", "Jitter", "Custom")
+STATUSES = ("OK", "INSUFFICIENT_DATA", "OUT_OF_RANGE", "TIMEOUT", "SENSOR_MISMATCH")
+
+DEFAULT_TIMEOUT = 0.050  # seconds
+DEFAULT_MEMO_ENTRIES = 65536
+
+# Status reported for a plugin whose call raised, whose output was
+# invalid, or whose worker died
+FAILED_STATUS = "INSUFFICIENT_DATA"
+
+# How often queued calls are checked for having started
+_START_POLL = 0.001  # seconds
+
+_PHASE_STATE = struct.Struct(">48i")
+
+
+class PluginStatus(Exception):
+    """
+    Raised by a plugin to report a non‑OK status.
+    """
+
+    def __init__(self, status: str):
+        if status not in STATUSES or status == "OK":
+            raise ValueError(f"Invalid plugin status: {status!r}")
+        super().__init__(status)
+        self.status = status
+
+
+class Plugin(NamedTuple):
+    id: str
+    domain: str
+    version: str
+    fn: Callable
+    timeout: float = None  # None → executor default
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+
+class PluginRegistry:
+    def __init__(self):
+        self._plugins = {}
+
+    def register(self, id: str, domain: str, version: str, fn: Callable = None,
+                 timeout: float = None):
+        """
+        Register `fn` under `id`. Without `fn`, returns a decorator:
+
+            @registry.register("refraction_v1", "Refraction", "1.0.0")
+            def refraction(phase_state): ...
+        """
+        if domain not in DOMAINS:
+            raise ValueError(f"Invalid plugin domain: {domain!r}")
+
+        def add(fn):
+            self._plugins[id] = Plugin(id, domain, version, fn, timeout)
+            return fn
+
+        return add if fn is None else add(fn)
+
+    def unregister(self, id: str) -> None:
+        del self._plugins[id]
+
+    def __getitem__(self, id: str) -> Plugin:
+        return self._plugins[id]
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._plugins
+
+    def __len__(self):
+        return len(self._plugins)
+
+    def __iter__(self):
+        """
+        Plugins in lexicographic id order.
+        """
+        return (self._plugins[pid] for pid in sorted(self._plugins))
+
+
+# ----------------------------------------------------------------------
+# Output memoization
+# ----------------------------------------------------------------------
+
+def phase_state_key(phase_state) -> bytes:
+    """
+    128‑bit BLAKE2b digest of the packed big‑endian 16×3 PhaseState.
+    """
+    packed = _PHASE_STATE.pack(*(c for phase in phase_state for c in phase))
+    return hashlib.blake2b(packed, digest_size=16).digest()
+
+
+class PluginMemo:
+    """
+    LRU cache of plugin outputs keyed on (plugin id, PhaseState digest),
+    bounded to `max_entries`. Thread safe.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MEMO_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (pid, key) → (warp_vector, error, status)
+        self._versions = {}            # pid → version the entries were made with
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self, plugin: Plugin) -> None:
+        if self._versions.get(plugin.id, plugin.version) != plugin.version:
+            stale = [k for k in self._entries if k[0] == plugin.id]
+            for k in stale:
+                del self._entries[k]
+            self.invalidations += len(stale)
+        self._versions[plugin.id] = plugin.version
+
+    def get(self, plugin: Plugin, key: bytes):
+        with self._lock:
+            self._check_version(plugin)
+            out = self._entries.get((plugin.id, key))
+            if out is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((plugin.id, key))
+            self.hits += 1
+            return out
+
+    def put(self, plugin: Plugin, key: bytes, out) -> None:
+        if out[2] == "TIMEOUT":
+            return
+        with self._lock:
+            self._check_version(plugin)
+            self._entries[(plugin.id, key)] = out
+            self._entries.move_to_end((plugin.id, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# ----------------------------------------------------------------------
+# Executor
+# ----------------------------------------------------------------------
+
+def _call_plugin(fn, phase_state):
+    """
+    Run one plugin and normalize its output to (warp_vector, error, status).
+    """
+    try:
+        out = fn(phase_state)
+    except PluginStatus as s:
+        return [0, 0, 0], 0, s.status
+
+    if isinstance(out, dict):
+        return list(out["warp_vector"]), out["error"], out.get("status", "OK")
+    warp_vector, error = out
+    return list(warp_vector), error, "OK"
+
+
+def _timed_call_plugin(fn, phase_state):
+    """
+    _call_plugin() plus its wall time in nanoseconds.
+    """
+    t0 = time.perf_counter_ns()
+    out = _call_plugin(fn, phase_state)
+    return out, time.perf_counter_ns() - t0
+
+
+def _is_q16(value) -> bool:
+    return type(value) is int and INT32_MIN <= value <= INT32_MAX
+
+
+def _output(plugin: Plugin, warp_vector, error, status) -> dict:
+    if len(warp_vector) != 3 or not all(_is_q16(c) for c in warp_vector):
+        raise ValueError(f"Plugin {plugin.id}: warp_vector must be 3 Q16.16 integers")
+    if not _is_q16(error) or error < 0:
+        raise ValueError(f"Plugin {plugin.id}: error must be a non-negative Q16.16 integer")
+    if status not in STATUSES:
+        raise ValueError(f"Plugin {plugin.id}: invalid status {status!r}")
+    return {
+        "id": plugin.id,
+        "domain": plugin.domain,
+        "warp_vector": warp_vector,
+        "error": error,
+        "version": plugin.version,
+        "status": status,
+    }
+
+
+class PluginExecutor:
+    """
+    Evaluates every plugin of a registry concurrently on a persistent pool.
+    """
+
+    def __init__(self, registry: PluginRegistry, executor: str = "thread",
+                 max_workers: int = None, timeout: float = DEFAULT_TIMEOUT,
+                 memo: PluginMemo = None, metrics=None):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor!r}")
+        self.registry = registry
+        self.timeout = timeout
+        self.memo = memo
+        self.metrics = metrics
+        self._executor = executor
+        self._workers = max_workers or max(1, len(registry))
+        self._pool = self._new_pool()
+        self._stuck = set()  # timed‑out calls still running on self._pool
+
+    def _new_pool(self):
+        if self._executor == "thread":
+            return concurrent.futures.ThreadPoolExecutor(max_workers=self._workers)
+        return concurrent.futures.ProcessPoolExecutor(max_workers=self._workers)
+
+    def _replace_pool(self) -> None:
+        """
+        Retire the current pool without waiting for its running calls.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool()
+        self._stuck = set()
+
+    def evaluate(self, phase_state) -> dict:
+        """
+        Run all registered plugins on `phase_state` and return the
+        `plugins` object (pid → output), in lexicographic id order.
+        """
+        phase_state = tuple(tuple(p) for p in phase_state)
+        plugins = list(self.registry)
+        memo = self.memo
+        metrics = self.metrics
+        key = phase_state_key(phase_state) if memo is not None else None
+        call = _call_plugin if metrics is None else _timed_call_plugin
+
+        self._stuck = {f for f in self._stuck if not f.done()}
+        if self._stuck:
+            self._replace_pool()
+
+        results = {}
+        pending = {}  # future → (plugin, limit)
+        for plugin in plugins:
+            cached = memo.get(plugin, key) if memo is not None else None
+            if cached is not None:
+                warp_vector, error, status = cached
+                results[plugin.id] = _output(plugin, list(warp_vector), error, status)
+            else:
+                limit = self.timeout if plugin.timeout is None else plugin.timeout
+                pending[self._pool.submit(call, plugin.fn, phase_state)] = (plugin, limit)
+
+        started = {}  # future → monotonic time it was first seen running
+        broken = False
+        try:
+            while pending:
+                now = time.monotonic()
+                for future in pending:
+                    if future not in started and (future.running() or future.done()):
+                        started[future] = now
+
+                for future in [f for f in pending if f.done()]:
+                    plugin, _ = pending.pop(future)
+                    try:
+                        out = future.result()
+                        ns = None
+                        if metrics is not None:
+                            out, ns = out
+                        cacheable = True
+                    except Exception as e:
+                        broken |= isinstance(e, concurrent.futures.BrokenExecutor)
+                        out = ([0, 0, 0], 0, FAILED_STATUS)
+                        ns = int((now - started[future]) * 1e9)
+                        cacheable = False
+                    try:
+                        warp_vector, error, status = out
+                        warp_vector = list(warp_vector)
+                        # Validate before caching
+                        results[plugin.id] = _output(plugin, warp_vector, error, status)
+                    except (TypeError, ValueError):
+                        warp_vector, error, status = [0, 0, 0], 0, FAILED_STATUS
+                        results[plugin.id] = _output(plugin, warp_vector, error, status)
+                        cacheable = False
+                    if metrics is not None:
+                        metrics.add_plugin(plugin.id, ns, status)
+                    if memo is not None and cacheable:
+                        memo.put(plugin, key, (list(warp_vector), error, status))
+
+                for future in [f for f in pending if f in started and now >= started[f] + pending[f][1]]:
+                    plugin, limit = pending.pop(future)
+                    if not future.cancel():
+                        self._stuck.add(future)
+                    results[plugin.id] = _output(plugin, [0, 0, 0], 0, "TIMEOUT")
+                    if metrics is not None:
+                        metrics.add_plugin(plugin.id, int(limit * 1e9), "TIMEOUT")
+
+                if not pending:
+                    break
+                wake = [started[f] + limit for f, (_, limit) in pending.items() if f in started]
+                if len(wake) < len(pending):
+                    wake.append(now + _START_POLL)
+                concurrent.futures.wait(pending, timeout=max(0.0, min(wake) - time.monotonic()),
+                                        return_when=concurrent.futures.FIRST_COMPLETED)
+        finally:
+            # Calls abandoned by an exception still hold workers
+            self._stuck.update(f for f in pending if not f.cancel())
+
+        if broken:
+            self._replace_pool()
+        return {plugin.id: results[plugin.id] for plugin in plugins}
+
+    def vector(self, phase_state, vector_id: str = None) -> dict:
+        """
+        Build a conformance vector (vector_schema.json layout) for
+        `phase_state` from the plugin outputs.
+        """
+        vector = {
+            "initial_phase_state": [list(p) for p in phase_state],
+            "plugins": self.evaluate(phase_state),
+        }
+        if vector_id is not None:
+            vector["vector_id"] = vector_id
+        return vector
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    from iso16_decision import decide
+
+    registry = PluginRegistry()
+
+    @registry.register("refraction", "Refraction", "1.0.0")
+    def refraction(phase_state):
+        return [phase_state[0][0] >> 8, 0, 0], 0
+
+    @registry.register("jitter", "Jitter", "1.0.0")
+    def jitter(phase_state):
+        return {"warp_vector": [0, 1, 0], "error": 1}
+
+    @registry.register("frame_drag", "FrameDrag", "1.0.0", timeout=0.010)
+    def frame_drag(phase_state):
+        time.sleep(0.100)
+        return [0, 0, 1], 0
+
+    memo = PluginMemo()
+    with PluginExecutor(registry, memo=memo) as executor:
+        vector = executor.vector([[65536, 0, 0]] * 16, "DEMO")
+        executor.vector([[65536, 0, 0]] * 16, "DEMO")
+    for pid, out in vector["plugins"].items():
+        print(f"{pid:<12} {out['status']:<8} warp={out['warp_vector']} error={out['error']}")
+    d = decide(vector)
+    print(f"true_delivery={d.true_delivery} failed_check={d.failed_check}")
+    print(f"memo: {memo.stats()}")
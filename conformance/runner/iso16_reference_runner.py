@@ -5,17 +5,30 @@ ISO‑16 Reference Runner (Cycle‑Accurate, VCD‑Integrated)
 Executes the True Delivery Loop against a conformance vector and emits:
 
   • result JSON
-  • VCD waveform trace (iso16_<vector_id>.vcd)
+  • VCD waveform trace (iso16_<vector_id>.vcd), per the selected
+    trace mode (see iso16_trace.py)
+  • optionally, the full audit record of every vector, appended to an
+    audit store (--audit-dir, utils/audit_store.py)
+
+Vectors are read from conformance/vectors/V*.json, or from a packed
+.i16p container (utils/vector_pack.py) with --pack.
 
 The state machine and timing are aligned with iso16_true_delivery.v.
 The seal is computed using the canonical ISO‑16 SHA3‑256 serializer.
 """
 
+import argparse
 import json
 import pathlib
-import hashlib
+import time
+from array import array
 
-from iso16_vcd_logger import ISO16VCDLogger
+from iso16_metrics import PHASE_ENGINE, PHASE_JSON_LOAD, PHASE_RESULT_IO, PHASE_SEAL, Metrics
+from iso16_trace import TRACE_MODES, TraceConfig, make_trace_sink
+from utils.q16 import EPSILON
+from utils.audit_store import AuditStore
+from utils.seal import SealHasher
+from utils.vector_pack import VectorPack
 
 # ----------------------------------------------------------------------
 # State encoding (must match hdl/iso16_true_delivery.v)
@@ -27,23 +40,85 @@ STATE_CHECK      = 0x4
 STATE_SEAL       = 0x5
 STATE_DONE       = 0x6
 
+STATE_NAMES = {
+    STATE_COLLECT:    "COLLECT",
+    STATE_PLUGIN:     "PLUGIN",
+    STATE_ACCUMULATE: "ACCUMULATE",
+    STATE_CHECK:      "CHECK",
+    STATE_SEAL:       "SEAL",
+    STATE_DONE:       "DONE",
+}
+
+# Cycles spent outside STATE_PLUGIN before the seal is computed:
+# COLLECT (1) + PLUGIN exit (1) + ACCUMULATE (1) + CHECK (1) + SEAL start (1)
+# + SEAL compute (1). The seal is computed on cycle plugins + SEAL_CYCLE_OFFSET
+# and DONE is reached one cycle later.
+SEAL_CYCLE_OFFSET = 6
+
+MASK32 = 0xFFFFFFFF
+
+
+def _signed(word: int) -> int:
+    return word - (1 << 32) if word & 0x80000000 else word
+
 
 class ISO16Engine:
     """
     Cycle‑accurate software twin of the HDL True Delivery Loop.
     Exposes the same observable signals and advances one cycle at a time.
+
+    Reads a conformance vector (vector_schema.json): the 16×3
+    initial_phase_state and the plugins in lexicographic id order. A
+    legacy vector with only `plugin_warp` (x‑axis warps) is still accepted.
+    PhaseState, plugin outputs and the warped PhaseState are held as flat
+    uint32 arrays (two's‑complement Q16.16); the accumulators are uint32
+    like the HDL registers, with signed views in warp_total, error_total
+    and phase_state_warped.
+
+    `trace` is an optional sink (iso16_trace.py) that receives a signal
+    snapshot per cycle from run(). Without one, no snapshots are built.
+
+    seal_out is the Tetra‑Seal of the run (utils/seal.SealHasher).
+    `seal_base` is an optional SealHasher checkpoint with this vector's
+    initial PhaseState and plugins already absorbed, for callers that
+    evaluate the same inputs repeatedly.
+
+    `metrics` is an optional iso16_metrics.Metrics that receives cycles
+    and wall time per state and the seal phase time.
     """
 
-    def __init__(self, vector):
-        # Inputs from vector
-        self.phase_state   = vector.get("phase_state", [])
-        self.plugin_warp   = vector.get("plugin_warp", [])
+    __slots__ = (
+        "phase_state", "plugin_warp", "plugin_error", "plugin_ok", "expected_seal",
+        "state", "cycle", "warp_sum_x", "warp_sum_y", "warp_sum_z", "error_sum",
+        "symmetry_ok", "error_ok", "true_delivery", "seal_start", "seal_ready",
+        "seal_out", "phase_warped", "_plugin_count", "_plugin_index", "_status_ok",
+        "_done", "trace", "metrics", "_vector", "_seal_base",
+    )
+
+    def __init__(self, vector, trace=None, seal_base=None, metrics=None):
+        # Inputs from vector: 48 coordinates, 3 warps + 1 error per plugin
+        phases = vector.get("initial_phase_state") or vector.get("phase_state") or [[0, 0, 0]] * 16
+        self.phase_state = array("I", (c & MASK32 for phase in phases for c in phase))
+
+        plugins = vector.get("plugins")
+        if plugins:
+            ordered = [plugins[pid] for pid in sorted(plugins.keys())]
+            self.plugin_warp  = array("I", (c & MASK32 for p in ordered for c in p["warp_vector"]))
+            self.plugin_error = array("I", (p["error"] & MASK32 for p in ordered))
+            self.plugin_ok    = all(p["status"] == "OK" for p in ordered)
+        else:
+            legacy = vector.get("plugin_warp", [])
+            self.plugin_warp  = array("I", (c & MASK32 for w in legacy for c in (w, 0, 0)))
+            self.plugin_error = array("I", bytes(4 * len(legacy)))
+            self.plugin_ok    = True
         self.expected_seal = int(vector["expected_seal"], 16) if "expected_seal" in vector else None
 
         # Observable signals
         self.state         = STATE_COLLECT
         self.cycle         = 0
         self.warp_sum_x    = 0
+        self.warp_sum_y    = 0
+        self.warp_sum_z    = 0
         self.error_sum     = 0
         self.symmetry_ok   = 0
         self.error_ok      = 0
@@ -51,10 +126,17 @@ class ISO16Engine:
         self.seal_start    = 0
         self.seal_ready    = 0
         self.seal_out      = 0
+        self.phase_warped  = array("I", bytes(4 * 48))
 
         # Internal bookkeeping
+        self._plugin_count = len(self.plugin_error)
         self._plugin_index = 0
+        self._status_ok    = True
         self._done         = False
+        self.trace         = trace
+        self.metrics       = metrics
+        self._vector       = vector
+        self._seal_base    = seal_base
 
     def step(self):
         """
@@ -64,29 +146,31 @@ class ISO16Engine:
         self.cycle += 1
 
         if self.state == STATE_COLLECT:
-            # In a full implementation, phase_state would be loaded here.
+            # PhaseState and plugin outputs are already loaded.
             self.state = STATE_PLUGIN
 
         elif self.state == STATE_PLUGIN:
-            # Apply one plugin per cycle (simplified).
-            if self._plugin_index < len(self.plugin_warp):
-                self.warp_sum_x = (self.warp_sum_x + self.plugin_warp[self._plugin_index]) & 0xFFFFFFFF
-                self._plugin_index += 1
+            # Accumulate one plugin per cycle (warp on all axes, error, status).
+            i = self._plugin_index
+            if i < self._plugin_count:
+                w = self.plugin_warp
+                self.warp_sum_x = (self.warp_sum_x + w[3 * i])     & MASK32
+                self.warp_sum_y = (self.warp_sum_y + w[3 * i + 1]) & MASK32
+                self.warp_sum_z = (self.warp_sum_z + w[3 * i + 2]) & MASK32
+                self.error_sum  = (self.error_sum + self.plugin_error[i]) & MASK32
+                self._plugin_index = i + 1
             else:
+                self._status_ok = self.plugin_ok
                 self.state = STATE_ACCUMULATE
 
         elif self.state == STATE_ACCUMULATE:
-            # In a full implementation, error_sum would be computed here.
-            # For now, assume no error.
-            self.error_sum = 0
+            # APPLY: phase' = phase + warp_total on all 16 phases.
+            self._apply_warp()
             self.state = STATE_CHECK
 
         elif self.state == STATE_CHECK:
-            # Symmetry and error checks (simplified but deterministic).
-            self.symmetry_ok   = 1
-            self.error_ok      = 1
-            self.true_delivery = 1
-            self.state         = STATE_SEAL
+            self._check()
+            self.state = STATE_SEAL
 
         elif self.state == STATE_SEAL:
             # Seal boundary: start, then compute and mark ready.
@@ -100,89 +184,307 @@ class ISO16Engine:
         elif self.state == STATE_DONE:
             self._done = True
 
+    def _apply_warp(self):
+        warp = (self.warp_sum_x, self.warp_sum_y, self.warp_sum_z) * 16
+        self.phase_warped = array("I", ((c + w) & MASK32 for c, w in zip(self.phase_state, warp)))
+
+    def _check(self):
+        """
+        Symmetry (iso16_core.md §6): |phase'[i] - phase'[i+1]| <= epsilon
+        per axis for i in [0, 14]. For uint32 words the signed difference
+        is within ±epsilon exactly when (a - b) mod 2^32 is within
+        [0, epsilon] or [2^32 - epsilon, 2^32).
+        Error (§7): every plugin status OK and error_total <= epsilon.
+        """
+        q = self.phase_warped
+        symmetry_ok = 1
+        for k in range(45):
+            d = (q[k] - q[k + 3]) & MASK32
+            if EPSILON < d < (1 << 32) - EPSILON:
+                symmetry_ok = 0
+                break
+
+        self.symmetry_ok   = symmetry_ok
+        self.error_ok      = int(self._status_ok and _signed(self.error_sum) <= EPSILON)
+        self.true_delivery = self.symmetry_ok & self.error_ok
+
+    @property
+    def warp_total(self) -> list:
+        return [_signed(w) for w in (self.warp_sum_x, self.warp_sum_y, self.warp_sum_z)]
+
+    @property
+    def error_total(self) -> int:
+        return _signed(self.error_sum)
+
+    @property
+    def phase_state_warped(self) -> list:
+        q = [_signed(c) for c in self.phase_warped]
+        return [q[k:k + 3] for k in range(0, 48, 3)]
+
     def _compute_seal(self):
         """
-        Canonical ISO‑16 SHA3‑256 seal.
-        Mirrors the hardware seal boundary and canonical serializer.
+        Canonical ISO‑16 SHA3‑256 Tetra‑Seal over the run's inputs and
+        outputs, streamed section by section into the hash.
         """
-        prefix = b"ISO16-SEAL-V1"
-        payload = (
-            prefix +
-            self.warp_sum_x.to_bytes(4, "big") +
-            self.error_sum.to_bytes(4, "big") +
-            self.cycle.to_bytes(4, "big")
-        )
-        digest = hashlib.sha3_256(payload).digest()
-        return int.from_bytes(digest, "big")
+        if self.metrics is not None:
+            t0 = time.perf_counter_ns()
+
+        if self._seal_base is not None:
+            h = self._seal_base.copy()
+        else:
+            p = [_signed(c) for c in self.phase_state]
+            h = SealHasher().initial_phase_state(p[k:k + 3] for k in range(0, 48, 3))
+            h.plugins(self._vector.get("plugins") or {})
+
+        seal = h.finish(self._vector, {
+            "warp_total":         self.warp_total,
+            "error_total":        self.error_total,
+            "phase_state_warped": self.phase_state_warped,
+            "symmetry_ok":        self.symmetry_ok,
+            "error_ok":           self.error_ok,
+            "true_delivery":      self.true_delivery,
+        })
+
+        if self.metrics is not None:
+            self.metrics.add_phase(PHASE_SEAL, time.perf_counter_ns() - t0)
+        return int(seal, 16)
 
     def is_done(self):
         return self._done
 
+    def run_to_completion(self):
+        """
+        Jump from COLLECT straight to DONE without per‑cycle iteration.
 
-def run_vector(vector_path: pathlib.Path, out_dir: pathlib.Path):
-    """
-    Run a single conformance vector and emit:
+        Produces the same accumulators, warped PhaseState, flags, cycle
+        and seal_out as stepping, since the accumulations and the cycle count have a
+        closed form. An engine that has already been stepped falls back to
+        stepping the remaining cycles.
+        """
+        if self._done:
+            return
+        if self.state != STATE_COLLECT or self.cycle != 0:
+            while not self._done:
+                self.step()
+            return
+
+        metrics = self.metrics
+        if metrics is not None:
+            t0 = time.perf_counter_ns()
+
+        plugins = self._plugin_count
+        w = self.plugin_warp
+
+        # PLUGIN: one wraparound accumulation per plugin
+        self.warp_sum_x    = (self.warp_sum_x + sum(w[0::3])) & MASK32
+        self.warp_sum_y    = (self.warp_sum_y + sum(w[1::3])) & MASK32
+        self.warp_sum_z    = (self.warp_sum_z + sum(w[2::3])) & MASK32
+        self.error_sum     = (self.error_sum + sum(self.plugin_error)) & MASK32
+        self._plugin_index = plugins
+        self._status_ok    = self.plugin_ok
+        if metrics is not None:
+            t1 = time.perf_counter_ns()
+
+        # ACCUMULATE (APPLY) + CHECK
+        self._apply_warp()
+        if metrics is not None:
+            t2 = time.perf_counter_ns()
+        self._check()
+        if metrics is not None:
+            t3 = time.perf_counter_ns()
+
+        # SEAL: computed on the same cycle as the stepped engine
+        self.seal_start    = 1
+        self.cycle         = plugins + SEAL_CYCLE_OFFSET
+        self.seal_out      = self._compute_seal()
+        self.seal_ready    = 1
+        self.state         = STATE_DONE
+
+        # DONE
+        self.cycle        += 1
+        self._done         = True
+
+        if metrics is not None:
+            t4 = time.perf_counter_ns()
+            metrics.add_state("COLLECT", 1, 0)
+            metrics.add_state("PLUGIN", plugins + 1, t1 - t0)
+            metrics.add_state("ACCUMULATE", 1, t2 - t1)
+            metrics.add_state("CHECK", 1, t3 - t2)
+            metrics.add_state("SEAL", 2, t4 - t3)
+            metrics.add_state("DONE", 1, 0)
+
+    def run(self):
+        """
+        Run until DONE. Without a trace sink this is run_to_completion();
+        with one, the engine steps and feeds the sink a snapshot before
+        every cycle and once more after DONE. With metrics, each step is
+        timed and attributed to the state it started in.
+        """
+        trace = self.trace
+        if trace is None:
+            self.run_to_completion()
+            return
+
+        metrics = self.metrics
+        while not self._done:
+            # Log current state before stepping (cycle‑accurate snapshot)
+            trace.record(self.signals())
+            if metrics is None:
+                self.step()
+            else:
+                state = self.state
+                t0 = time.perf_counter_ns()
+                self.step()
+                metrics.add_state(STATE_NAMES[state], 1, time.perf_counter_ns() - t0)
 
-      • result JSON
-      • VCD waveform trace
-    """
-    with vector_path.open() as f:
-        vector = json.load(f)
+        # Final snapshot after DONE (optional but useful)
+        trace.record(self.signals())
 
-    vector_id = vector.get("id", vector_path.stem)
-
-    engine = ISO16Engine(vector)
-    vcd_path = out_dir / f"{vector_id}.vcd"
-    vcd = ISO16VCDLogger(str(vcd_path))
-
-    # Main cycle loop
-    while not engine.is_done():
-        # Log current state before stepping (cycle‑accurate snapshot)
-        vcd.write("state",        engine.state)
-        vcd.write("cycle",        engine.cycle)
-        vcd.write("warp_sum_x",   engine.warp_sum_x)
-        vcd.write("error_sum",    engine.error_sum)
-        vcd.write("symmetry_ok",  engine.symmetry_ok)
-        vcd.write("error_ok",     engine.error_ok)
-        vcd.write("true_delivery", engine.true_delivery)
-        vcd.write("seal_start",   engine.seal_start)
-        vcd.write("seal_ready",   engine.seal_ready)
-        vcd.write("seal_out",     engine.seal_out)
-
-        engine.step()
-
-    # Final snapshot after DONE (optional but useful)
-    vcd.write("state",        engine.state)
-    vcd.write("cycle",        engine.cycle)
-    vcd.write("warp_sum_x",   engine.warp_sum_x)
-    vcd.write("error_sum",    engine.error_sum)
-    vcd.write("symmetry_ok",  engine.symmetry_ok)
-    vcd.write("error_ok",     engine.error_ok)
-    vcd.write("true_delivery", engine.true_delivery)
-    vcd.write("seal_start",   engine.seal_start)
-    vcd.write("seal_ready",   engine.seal_ready)
-    vcd.write("seal_out",     engine.seal_out)
-
-    vcd.close()
+    def signals(self) -> dict:
+        """
+        Snapshot of the observable signals, keyed by VCD signal name.
+        """
+        return {
+            "state":         self.state,
+            "cycle":         self.cycle,
+            "warp_sum_x":    self.warp_sum_x,
+            "warp_sum_y":    self.warp_sum_y,
+            "warp_sum_z":    self.warp_sum_z,
+            "error_sum":     self.error_sum,
+            "symmetry_ok":   self.symmetry_ok,
+            "error_ok":      self.error_ok,
+            "true_delivery": self.true_delivery,
+            "seal_start":    self.seal_start,
+            "seal_ready":    self.seal_ready,
+            "seal_out":      self.seal_out,
+        }
+
+
+def execute_vector(vector: dict, vector_id: str, out_dir: pathlib.Path,
+                   trace: TraceConfig = TraceConfig(), audit: AuditStore = None,
+                   metrics: Metrics = None) -> dict:
+    """
+    Execute an already‑loaded conformance vector and return the result
+    record. A waveform trace is written into `out_dir` according to
+    `trace`; in ring mode only if the seal does not match expected_seal.
+    With `audit`, the full audit record is appended to the store; with
+    `metrics`, the engine run is instrumented.
+    """
+    sink = make_trace_sink(trace, out_dir, vector_id)
+    engine = ISO16Engine(vector, trace=sink, metrics=metrics)
+    if metrics is None:
+        engine.run()
+    else:
+        with metrics.phase(PHASE_ENGINE):
+            engine.run()
+
+    if sink is not None:
+        failed = engine.expected_seal is not None and engine.seal_out != engine.expected_seal
+        sink.close(failed=failed)
 
     result = {
         "vector_id": vector_id,
         "warp_sum_x": engine.warp_sum_x,
         "error_sum": engine.error_sum,
         "seal_out": f"{engine.seal_out:064x}",
+        "warp_total": engine.warp_total,
+        "error_total": engine.error_total,
+        "phase_state_warped": engine.phase_state_warped,
+        "symmetry_ok": bool(engine.symmetry_ok),
+        "error_ok": bool(engine.error_ok),
         "true_delivery": bool(engine.true_delivery),
     }
+    if audit is not None:
+        audit.append(dict(vector, vector_id=vector_id), result, engine.seal_out.to_bytes(32, "big"))
+    return result
+
+
+def run_vector(vector_path: pathlib.Path, out_dir: pathlib.Path, write_result: bool = True,
+               trace: TraceConfig = TraceConfig(), audit: AuditStore = None,
+               metrics: Metrics = None) -> dict:
+    """
+    Run a single conformance vector and emit:
+
+      • result JSON (unless write_result is False)
+      • VCD waveform trace (per `trace`)
+
+    The result record is also returned to the caller.
+    """
+    if metrics is not None:
+        t0 = time.perf_counter_ns()
+    with vector_path.open() as f:
+        vector = json.load(f)
+    if metrics is not None:
+        metrics.add_phase(PHASE_JSON_LOAD, time.perf_counter_ns() - t0)
+
+    vector_id = vector.get("id", vector_path.stem)
+    result = execute_vector(vector, vector_id, out_dir, trace, audit, metrics)
+
+    if write_result:
+        _write_result(out_dir / f"{vector_id}_result.json", result, metrics)
+
+    return result
 
-    result_path = out_dir / f"{vector_id}_result.json"
-    with result_path.open("w") as f:
+
+def _write_result(path: pathlib.Path, result: dict, metrics: Metrics = None) -> None:
+    if metrics is not None:
+        t0 = time.perf_counter_ns()
+    with path.open("w") as f:
         json.dump(result, f, indent=2)
+    if metrics is not None:
+        metrics.add_phase(PHASE_RESULT_IO, time.perf_counter_ns() - t0)
+
+
+def run_pack(pack_path: pathlib.Path, out_dir: pathlib.Path, write_result: bool = True,
+             trace: TraceConfig = TraceConfig(), audit: AuditStore = None,
+             metrics: Metrics = None) -> list:
+    """
+    Run every vector of a memory‑mapped .i16p container. Returns the
+    result records in container order.
+    """
+    results = []
+    with VectorPack(pack_path) as vp:
+        for vector in vp:
+            vector_id = vector.get("id", vector["vector_id"])
+            result = execute_vector(vector, vector_id, out_dir, trace, audit, metrics)
+            if write_result:
+                _write_result(out_dir / f"{vector_id}_result.json", result, metrics)
+            results.append(result)
+    return results
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ISO-16 Reference Runner")
+    parser.add_argument("--pack", type=pathlib.Path,
+                        help="Run vectors from a packed .i16p container.")
+    parser.add_argument("--trace", choices=TRACE_MODES, default="vcd",
+                        help="Waveform trace mode. Default: vcd.")
+    parser.add_argument("--trace-depth", type=int, default=TraceConfig().depth,
+                        help="Cycles kept by --trace ring.")
+    parser.add_argument("--trace-sample", type=int, default=TraceConfig().sample_every,
+                        help="Trace 1 in N vectors with --trace sampled.")
+    parser.add_argument("--audit-dir", type=pathlib.Path,
+                        help="Append every audit record to the audit store in this directory.")
+    parser.add_argument("--metrics", type=pathlib.Path,
+                        help="Write per-state, per-phase counters here (.prom for Prometheus text, else JSON).")
+    args = parser.parse_args()
+    trace = TraceConfig(args.trace, args.trace_depth, args.trace_sample)
+
     base = pathlib.Path(__file__).resolve().parent.parent
     vectors_dir = base / "vectors"
     out_dir = base / "waveforms_python"
     out_dir.mkdir(exist_ok=True)
 
-    for vector_path in sorted(vectors_dir.glob("V*.json")):
-        run_vector(vector_path, out_dir)
+    audit = AuditStore(args.audit_dir) if args.audit_dir is not None else None
+    metrics = Metrics() if args.metrics is not None else None
+    try:
+        if args.pack is not None:
+            run_pack(args.pack, out_dir, trace=trace, audit=audit, metrics=metrics)
+        else:
+            for vector_path in sorted(vectors_dir.glob("V*.json")):
+                run_vector(vector_path, out_dir, trace=trace, audit=audit, metrics=metrics)
+    finally:
+        if audit is not None:
+            audit.close()
+    if metrics is not None:
+        metrics.write(args.metrics)
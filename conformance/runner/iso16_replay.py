@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Deterministic Replay (Informative)
+-----------------------------------------
+Re‑executes every record of a columnar audit archive (.i16a,
+utils/audit_archive.py) through ISO16Engine, per iso16_audit.md §9.1:
+from the recorded initial PhaseState and plugin outputs, the replay must
+reproduce warp_total, error_total, phase_state_warped, symmetry_ok,
+error_ok and true_delivery exactly, and the recomputed Tetra‑Seal must
+equal the recorded one.
+
+  • row groups are replayed on a process pool (--jobs, default all
+    cores); each worker maps the archive once
+  • results are consumed in row group order, so the mismatch stream is
+    deterministic and progress is a single "next row group" position
+  • every --checkpoint-every seconds the mismatch stream is fsynced and
+    a checkpoint (archive fingerprint, next row group, mismatch stream
+    length, counters) is written atomically; on restart the mismatch
+    stream is truncated to the checkpointed length and replay resumes
+    from the next row group, so no mismatch is lost or duplicated
+
+Mismatch stream (JSON Lines), one line per record that does not replay:
+
+    {"group": g, "row": i, "vector_id": ..., "fields": [...],
+     "recorded": {...}, "replayed": {...}}
+
+`fields` names the differing outputs; "tetra_seal" alone means the
+outputs replay but the recorded seal does not match them.
+
+Usage:
+    python3 iso16_replay.py audit.i16a [--jobs N] [--mismatches PATH]
+        [--checkpoint PATH] [--checkpoint-every SECONDS] [--restart]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from iso16_reference_runner import ISO16Engine
+from utils.audit_archive import AuditArchive
+
+DEFAULT_CHECKPOINT_EVERY = 60.0  # seconds
+
+REPLAYED_FIELDS = ("warp_total", "error_total", "phase_state_warped",
+                   "symmetry_ok", "error_ok", "true_delivery", "tetra_seal")
+
+
+# ----------------------------------------------------------------------
+# Replay (worker side)
+# ----------------------------------------------------------------------
+
+def replay_record(record: dict) -> dict:
+    """
+    Outputs of ISO16Engine on the record's sealed inputs.
+    """
+    engine = ISO16Engine(record)
+    engine.run()
+    return {
+        "warp_total": engine.warp_total,
+        "error_total": engine.error_total,
+        "phase_state_warped": engine.phase_state_warped,
+        "symmetry_ok": bool(engine.symmetry_ok),
+        "error_ok": bool(engine.error_ok),
+        "true_delivery": bool(engine.true_delivery),
+        "tetra_seal": f"{engine.seal_out:064x}",
+    }
+
+
+_archive = None
+
+
+def _init_worker(path: str) -> None:
+    global _archive
+    _archive = AuditArchive(path)
+
+
+def _replay_group(g: int):
+    """
+    Replay row group g; returns (g, records replayed, mismatches).
+    """
+    mismatches = []
+    n = 0
+    for i, record in enumerate(_archive.scan(groups=[g])):
+        n += 1
+        replayed = replay_record(record)
+        fields = [f for f in REPLAYED_FIELDS if replayed[f] != record[f]]
+        if fields:
+            mismatches.append({
+                "group": g,
+                "row": i,
+                "vector_id": record["vector_id"],
+                "fields": fields,
+                "recorded": {f: record[f] for f in fields},
+                "replayed": {f: replayed[f] for f in fields},
+            })
+    return g, n, mismatches
+
+
+# ----------------------------------------------------------------------
+# Checkpoints
+# ----------------------------------------------------------------------
+
+def load_checkpoint(path: str, fingerprint: str):
+    """
+    The checkpoint at `path` if it belongs to this archive, else None.
+    """
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    if state.get("archive") != fingerprint:
+        raise SystemExit(f"[-] {path} is a checkpoint for a different archive (use --restart)")
+    return state
+
+
+def save_checkpoint(path: str, state: dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# ----------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------
+
+def replay_archive(path: str, mismatches_path: str, checkpoint_path: str,
+                   jobs: int = None, checkpoint_every: float = DEFAULT_CHECKPOINT_EVERY,
+                   restart: bool = False) -> dict:
+    """
+    Replay the archive at `path`, resuming from `checkpoint_path` unless
+    `restart`. Returns the final counters.
+    """
+    with AuditArchive(path) as archive:
+        fingerprint = archive.fingerprint
+        groups = archive.row_group_count
+        total = len(archive)
+
+    state = None if restart else load_checkpoint(checkpoint_path, fingerprint)
+    if state is None:
+        state = {"archive": fingerprint, "next_group": 0, "mismatch_bytes": 0,
+                 "records": 0, "mismatches": 0}
+    elif state["next_group"] > 0:
+        print(f"[*] Resuming at row group {state['next_group']}/{groups} "
+              f"({state['records']:,} records replayed)", file=sys.stderr)
+
+    out = open(mismatches_path, "a+b")
+    out.truncate(state["mismatch_bytes"])
+    out.seek(state["mismatch_bytes"])
+
+    def checkpoint():
+        out.flush()
+        os.fsync(out.fileno())
+        state["mismatch_bytes"] = out.tell()
+        save_checkpoint(checkpoint_path, state)
+
+    t0 = last = time.monotonic()
+    done_at_start = state["records"]
+    pool = multiprocessing.Pool(jobs or os.cpu_count(), _init_worker, (path,))
+    try:
+        pending = range(state["next_group"], groups)
+        for g, n, mismatches in pool.imap(_replay_group, pending):
+            for m in mismatches:
+                out.write((json.dumps(m, separators=(",", ":")) + "\n").encode("utf-8"))
+            state["next_group"] = g + 1
+            state["records"] += n
+            state["mismatches"] += len(mismatches)
+
+            now = time.monotonic()
+            if now - last >= checkpoint_every:
+                checkpoint()
+                last = now
+                rate = (state["records"] - done_at_start) / (now - t0)
+                print(f"[*] {state['records']:,}/{total:,} records, "
+                      f"{state['mismatches']:,} mismatches, {rate:,.0f} records/s", file=sys.stderr)
+        checkpoint()
+    finally:
+        pool.terminate()
+        out.close()
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Deterministic Replay")
+    parser.add_argument("archive", help="Columnar audit archive (.i16a).")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes. Default: all cores.")
+    parser.add_argument("--mismatches", help="Mismatch stream (JSON Lines). Default: ARCHIVE.mismatches.jsonl.")
+    parser.add_argument("--checkpoint", help="Checkpoint file. Default: ARCHIVE.replay.json.")
+    parser.add_argument("--checkpoint-every", type=float, default=DEFAULT_CHECKPOINT_EVERY,
+                        help=f"Seconds between checkpoints. Default: {DEFAULT_CHECKPOINT_EVERY:g}.")
+    parser.add_argument("--restart", action="store_true", help="Ignore any checkpoint and start over.")
+    args = parser.parse_args()
+
+    mismatches_path = args.mismatches or args.archive + ".mismatches.jsonl"
+    checkpoint_path = args.checkpoint or args.archive + ".replay.json"
+
+    state = replay_archive(args.archive, mismatches_path, checkpoint_path,
+                           args.jobs, args.checkpoint_every, args.restart)
+
+    print(f"[*] Replayed {state['records']:,} records: {state['mismatches']:,} mismatches "
+          f"→ {mismatches_path}", file=sys.stderr)
+    if state["mismatches"]:
+        print("[-] Replay FAILED", file=sys.stderr)
+        raise SystemExit(1)
+    print("[*] Replay PASSED", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
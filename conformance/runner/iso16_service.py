@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Streaming Decision Service (Informative)
+-----------------------------------------------
+Long‑running asyncio front end for live PhaseStates. Requests and
+responses are JSON Lines, over stdin/stdout (default) or a local UNIX
+socket (--socket PATH).
+
+Request (one per line):
+
+    {"id": ..., "initial_phase_state": [[x,y,z] × 16],
+     "plugins": {pid: {id, domain, warp_vector, error, version, status}},
+     "implementation_id": ..., "timestamp": ..., "nonce": ...}   (last three optional)
+
+Response (one per request, in request order per connection):
+
+    {"id": ..., "true_delivery": true|false, "tetra_seal": "<64 hex>"}
+    {"id": ..., "error": "<reason>"}
+
+A request {"op": "stats"} returns the latency counters instead.
+
+Pipeline:
+
+  • each connection parses lines and enqueues them on a bounded queue;
+    when the queue is full the reader stops reading (backpressure)
+  • one batcher drains up to --max-batch requests, waiting at most
+    --max-wait-ms for a batch to fill, and evaluates them together with
+    iso16_batch_engine (iso16_decision.evaluate when NumPy is absent)
+  • latency (enqueue → response ready) is kept in a fixed‑size window
+    and reported as p50/p99
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+
+from iso16_decision import evaluate
+from utils.q16 import INT32_MAX, INT32_MIN
+from utils.seal import canonical_serialize_and_hash
+
+try:
+    from iso16_batch_engine import evaluate_vectors
+except ImportError:  # NumPy not installed
+    evaluate_vectors = None
+
+DEFAULT_MAX_BATCH   = 256
+DEFAULT_MAX_WAIT_MS = 2.0
+DEFAULT_QUEUE_SIZE  = 4096
+LATENCY_WINDOW      = 10000
+
+
+# ----------------------------------------------------------------------
+# Latency counters
+# ----------------------------------------------------------------------
+
+class LatencyStats:
+    """
+    Request count plus the latencies of the last `window` requests.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.count = 0
+        self.errors = 0
+        self.batches = 0
+        self._samples = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.count,
+            "errors": self.errors,
+            "batches": self.batches,
+            "latency_p50_ms": self.percentile(0.50) * 1e3,
+            "latency_p99_ms": self.percentile(0.99) * 1e3,
+        }
+
+
+# ----------------------------------------------------------------------
+# Request checking and evaluation
+# ----------------------------------------------------------------------
+
+def _is_q16(value) -> bool:
+    # bool is an int subclass; floats and out‑of‑range ints would be
+    # truncated or rejected inside the batch, failing its other requests
+    return type(value) is int and INT32_MIN <= value <= INT32_MAX
+
+
+def _check_request(request: dict) -> None:
+    """
+    Structural check, so that one malformed request cannot fail the
+    batch it is evaluated in.
+    """
+    phases = request["initial_phase_state"]
+    if len(phases) != 16 or any(len(p) != 3 for p in phases):
+        raise ValueError("initial_phase_state must be 16×3")
+    if not all(_is_q16(c) for p in phases for c in p):
+        raise ValueError("initial_phase_state must hold int32 Q16.16 integers")
+    plugins = request["plugins"]
+    if not isinstance(plugins, dict) or not plugins:
+        raise ValueError("plugins must be a non-empty object")
+    for p in plugins.values():
+        warp = p["warp_vector"]
+        if len(warp) != 3 or not all(_is_q16(c) for c in warp) or not _is_q16(p["error"]):
+            raise ValueError("plugin warp_vector and error must hold int32 Q16.16 integers")
+        if not all(isinstance(p[k], str) for k in ("id", "domain", "version", "status")):
+            raise ValueError("plugin id, domain, version and status must be strings")
+
+
+def _error_response(request, exc: BaseException) -> dict:
+    rid = request.get("id") if isinstance(request, dict) else None
+    return {"id": rid, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def _decide_batch(requests: list) -> list:
+    """
+    Evaluate and seal a micro‑batch; returns one response dict per request.
+    """
+    if evaluate_vectors is not None:
+        result = evaluate_vectors(requests)
+        actuals = [result.record(i) for i in range(len(requests))]
+    else:
+        actuals = [evaluate(r) for r in requests]
+
+    return [
+        {
+            "id": request.get("id"),
+            "true_delivery": actual["true_delivery"],
+            "tetra_seal": canonical_serialize_and_hash(request, actual),
+        }
+        for request, actual in zip(requests, actuals)
+    ]
+
+
+def _decide_each(requests: list) -> list:
+    """
+    Fallback after a failed micro‑batch: evaluate each request on its
+    own, so only the offending ones get an error response.
+    """
+    responses = []
+    for request in requests:
+        try:
+            responses.append(_decide_batch([request])[0])
+        except Exception as e:
+            responses.append(_error_response(request, e))
+    return responses
+
+
+# ----------------------------------------------------------------------
+# Service
+# ----------------------------------------------------------------------
+
+class DecisionService:
+    def __init__(self, max_batch=DEFAULT_MAX_BATCH, max_wait_ms=DEFAULT_MAX_WAIT_MS,
+                 queue_size=DEFAULT_QUEUE_SIZE):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1e3
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.stats = LatencyStats()
+
+    async def submit(self, request: dict) -> asyncio.Future:
+        """
+        Enqueue one request; waits while the queue is full. The returned
+        future resolves to the response dict.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future, time.perf_counter()))
+        return future
+
+    async def _next_batch(self) -> list:
+        batch = [await self.queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def run_batcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            requests = [request for request, _, _ in batch]
+            # Evaluate off the event loop so connections keep reading. No
+            # exception may escape: a dead batcher would hang every client.
+            try:
+                responses = await loop.run_in_executor(None, _decide_batch, requests)
+            except Exception:
+                try:
+                    responses = await loop.run_in_executor(None, _decide_each, requests)
+                except Exception as e:
+                    responses = [_error_response(r, e) for r in requests]
+                self.stats.errors += sum("error" in r for r in responses)
+            self.stats.batches += 1
+
+            now = time.perf_counter()
+            for (_, future, t0), response in zip(batch, responses):
+                self.stats.observe(now - t0)
+                if not future.done():
+                    future.set_result(response)
+
+    async def handle(self, readline, write) -> None:
+        """
+        Serve one JSON Lines stream. `readline` is a coroutine returning
+        the next line (b"" at EOF); `write` is a coroutine taking bytes.
+        Responses are written in request order.
+        """
+        pending = asyncio.Queue(maxsize=self.max_batch * 2)
+
+        async def writer():
+            while True:
+                item = await pending.get()
+                if item is None:
+                    return
+                response = await item if isinstance(item, asyncio.Future) else item
+                await write((json.dumps(response) + "\n").encode("utf-8"))
+
+        writer_task = asyncio.ensure_future(writer())
+        try:
+            while True:
+                line = await readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                request = None
+                try:
+                    request = json.loads(line)
+                    if request.get("op") == "stats":
+                        await pending.put(self.stats.snapshot())
+                        continue
+                    _check_request(request)
+                except (KeyError, TypeError, ValueError, AttributeError) as e:
+                    self.stats.errors += 1
+                    await pending.put(_error_response(request, e))
+                    continue
+                await pending.put(await self.submit(request))
+        finally:
+            await pending.put(None)
+            await writer_task
+
+
+# ----------------------------------------------------------------------
+# Transports
+# ----------------------------------------------------------------------
+
+async def _serve_stdio(service: DecisionService) -> None:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=1 << 20)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        readline = reader.readline
+    except ValueError:
+        # stdin is a regular file: read it on a worker thread
+        async def readline():
+            return await loop.run_in_executor(None, sys.stdin.buffer.readline)
+
+    out = sys.stdout.buffer
+
+    async def write(data):
+        out.write(data)
+        out.flush()
+
+    batcher = asyncio.ensure_future(service.run_batcher())
+    try:
+        await service.handle(readline, write)
+    finally:
+        batcher.cancel()
+
+
+async def _serve_socket(service: DecisionService, path: str) -> None:
+    async def on_connect(reader, writer):
+        async def write(data):
+            writer.write(data)
+            await writer.drain()
+        try:
+            await service.handle(reader.readline, write)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    batcher = asyncio.ensure_future(service.run_batcher())
+    server = await asyncio.start_unix_server(on_connect, path=path, limit=1 << 20)
+    print(f"[*] ISO-16 decision service listening on {path}", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batcher.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Streaming Decision Service")
+    parser.add_argument("--socket", help="Listen on this UNIX socket path instead of stdin/stdout.")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help=f"Requests per evaluation batch. Default: {DEFAULT_MAX_BATCH}.")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS,
+                        help=f"Longest wait for a batch to fill. Default: {DEFAULT_MAX_WAIT_MS}.")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f"Pending requests before readers block. Default: {DEFAULT_QUEUE_SIZE}.")
+    args = parser.parse_args()
+
+    async def serve():
+        service = DecisionService(args.max_batch, args.max_wait_ms, args.queue_size)
+        try:
+            if args.socket:
+                await _serve_socket(service, args.socket)
+            else:
+                await _serve_stdio(service)
+        finally:
+            print(f"[*] {json.dumps(service.stats.snapshot())}", file=sys.stderr)
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Engine Trace Sinks (Informative)
+---------------------------------------
+Pluggable destinations for the per‑cycle signal snapshots of ISO16Engine.
+Tracing is chosen per run:
+
+  • none     no tracing; the engine never builds a snapshot
+  • vcd      every cycle written to <vector_id>.vcd
+  • ring     last K cycles kept in memory, written to VCD only if the
+             vector fails
+  • sampled  full VCD for a deterministic 1‑in‑N subset of vectors
+             (selected by CRC32 of the vector id), none for the rest
+"""
+
+import zlib
+from collections import deque
+from typing import NamedTuple
+
+from iso16_vcd_logger import ISO16VCDLogger
+
+TRACE_MODES = ("none", "vcd", "ring", "sampled")
+
+
+class TraceConfig(NamedTuple):
+    mode: str = "vcd"
+    depth: int = 64        # ring: cycles retained
+    sample_every: int = 100  # sampled: trace 1 in N vectors
+
+
+class VCDTraceSink:
+    """
+    Write every recorded cycle straight to a VCD file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._vcd = ISO16VCDLogger(str(path))
+
+    def record(self, signals: dict) -> None:
+        self._vcd.dump(signals)
+
+    def close(self, failed: bool = False) -> None:
+        self._vcd.close()
+
+
+class RingBufferTraceSink:
+    """
+    Keep the last `depth` cycles in memory. The VCD file is only created
+    when the sink is closed with failed=True.
+    """
+
+    def __init__(self, path, depth: int = 64):
+        self.path = path
+        self._cycles = deque(maxlen=depth)
+
+    def record(self, signals: dict) -> None:
+        self._cycles.append(signals)
+
+    def close(self, failed: bool = False) -> None:
+        if failed:
+            vcd = ISO16VCDLogger(str(self.path))
+            for signals in self._cycles:
+                vcd.dump(signals)
+            vcd.close()
+        self._cycles.clear()
+
+
+def make_trace_sink(config: TraceConfig, out_dir, vector_id: str):
+    """
+    Build the sink for one vector, or None when it should not be traced.
+    """
+    mode = config.mode
+    path = out_dir / f"{vector_id}.vcd"
+
+    if mode == "none":
+        return None
+    if mode == "vcd":
+        return VCDTraceSink(path)
+    if mode == "ring":
+        return RingBufferTraceSink(path, config.depth)
+    if mode == "sampled":
+        if zlib.crc32(vector_id.encode("utf-8")) % max(1, config.sample_every) == 0:
+            return VCDTraceSink(path)
+        return None
+    raise ValueError(f"Unknown trace mode: {mode!r}")
@@ -8,34 +8,88 @@ the HDL signal set defined in iso16_true_delivery.v. It is intended for:
   • conformance debugging
   • cross‑checking HDL vs C++/Python behavior
   • GTKWave visualization
+
+Output follows VCD value‑change semantics: one `#timestamp` per cycle,
+followed only by the signals whose value changed in that cycle. The first
+cycle is emitted as a `$dumpvars` block with every signal. Vector values
+are written without leading zeros (VCD zero‑extends them).
+
+Output is written through a large buffer and may be compressed:
+
+  • compression="gzip" (or a filename ending in .gz)
+  • compression="zstd" (or a filename ending in .zst; needs `zstandard`)
 """
 
-import time
 import datetime
+import gzip
+import io
+import time
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# Signal name → (VCD identifier, bit width), in declaration order
+SIGNALS = {
+    "state":         ("s", 4),
+    "cycle":         ("c", 32),
+    "warp_sum_x":    ("w", 32),
+    "warp_sum_y":    ("u", 32),
+    "warp_sum_z":    ("v", 32),
+    "error_sum":     ("e", 32),
+    "symmetry_ok":   ("y", 1),
+    "error_ok":      ("r", 1),
+    "true_delivery": ("t", 1),
+    "seal_start":    ("a", 1),
+    "seal_ready":    ("b", 1),
+    "seal_out":      ("z", 256),
+}
+
+
+def _open_stream(filename, compression, buffer_size):
+    """
+    Return (buffered_writer, layers) where layers are closed in order
+    after the buffered writer.
+    """
+    if compression is None:
+        if filename.endswith(".gz"):
+            compression = "gzip"
+        elif filename.endswith(".zst"):
+            compression = "zstd"
+
+    raw = open(filename, "wb", buffering=0)
+    if compression is None:
+        return io.BufferedWriter(raw, buffer_size), []
+    if compression == "gzip":
+        gz = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6)
+        return io.BufferedWriter(gz, buffer_size), [raw]
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raw.close()
+            raise RuntimeError("zstd output requires the 'zstandard' package")
+        zw = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        return io.BufferedWriter(zw, buffer_size), [raw]
+
+    raw.close()
+    raise ValueError(f"Unsupported compression: {compression!r}")
+
 
 class ISO16VCDLogger:
-    def __init__(self, filename="iso16_trace.vcd"):
+    def __init__(self, filename="iso16_trace.vcd", compression=None,
+                 buffer_size=DEFAULT_BUFFER_SIZE):
         self.filename = filename
         self.start_time = time.time()
-        self.f = open(filename, "w")
+        self.f, self._layers = _open_stream(filename, compression, buffer_size)
+
+        # VCD identifier codes (short ASCII tokens)
+        self.ids = {name: sid for name, (sid, _) in SIGNALS.items()}
 
         self._write_header()
         self._define_signals()
 
-        # VCD identifier codes (short ASCII tokens)
-        self.ids = {
-            "state": "s",
-            "cycle": "c",
-            "warp_sum_x": "w",
-            "error_sum": "e",
-            "symmetry_ok": "y",
-            "error_ok": "r",
-            "true_delivery": "t",
-            "seal_start": "a",
-            "seal_ready": "b",
-            "seal_out": "z"
-        }
-
+        # Last emitted value per signal, and changes staged for this cycle
+        self._last = {}
+        self._pending = {}
         self.timestamp = 0
 
     # ----------------------------------------------------------------------
@@ -43,65 +97,80 @@ class ISO16VCDLogger:
     # ----------------------------------------------------------------------
     def _write_header(self):
         now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.f.write("$date\n    " + now + "\n$end\n")
-        self.f.write("$version\n    ISO‑16 Python VCD Logger\n$end\n")
-        self.f.write("$timescale 1ns $end\n")
+        self._emit("$date\n    " + now + "\n$end\n")
+        self._emit("$version\n    ISO‑16 Python VCD Logger\n$end\n")
+        self._emit("$timescale 1ns $end\n")
 
     # ----------------------------------------------------------------------
     # Declare signals
     # ----------------------------------------------------------------------
     def _define_signals(self):
-        self.f.write("$scope module iso16 $end\n")
-
-        self.f.write("$var wire 4 s state $end\n")
-        self.f.write("$var wire 32 c cycle $end\n")
-        self.f.write("$var wire 32 w warp_sum_x $end\n")
-        self.f.write("$var wire 32 e error_sum $end\n")
-        self.f.write("$var wire 1 y symmetry_ok $end\n")
-        self.f.write("$var wire 1 r error_ok $end\n")
-        self.f.write("$var wire 1 t true_delivery $end\n")
-        self.f.write("$var wire 1 a seal_start $end\n")
-        self.f.write("$var wire 1 b seal_ready $end\n")
-        self.f.write("$var wire 256 z seal_out $end\n")
-
-        self.f.write("$upscope $end\n")
-        self.f.write("$enddefinitions $end\n\n")
+        lines = ["$scope module iso16 $end\n"]
+        for name, (sid, width) in SIGNALS.items():
+            lines.append(f"$var wire {width} {sid} {name} $end\n")
+        lines.append("$upscope $end\n")
+        lines.append("$enddefinitions $end\n\n")
+        self._emit("".join(lines))
+
+    def _emit(self, text):
+        self.f.write(text.encode("utf-8"))
 
     # ----------------------------------------------------------------------
-    # Emit timestamp
+    # Format a single value change
     # ----------------------------------------------------------------------
-    def _tick(self):
-        self.timestamp += 1
-        self.f.write(f"#{self.timestamp}\n")
+    @staticmethod
+    def _format(signal, value):
+        sid, width = SIGNALS[signal]
+        if not isinstance(value, int):
+            # Strings (rare)
+            return f"{value}{sid}\n"
+        if width == 1:
+            return f"{value & 1}{sid}\n"
+        return f"b{value & ((1 << width) - 1):b} {sid}\n"
 
     # ----------------------------------------------------------------------
-    # Write a value change
+    # Stage a value for the current cycle
     # ----------------------------------------------------------------------
     def write(self, signal, value):
-        self._tick()
-
-        sid = self.ids[signal]
-
-        if isinstance(value, int):
-            # Binary dump for multi‑bit signals
-            if signal == "seal_out":
-                self.f.write(f"b{value:0256b} {sid}\n")
-            elif signal in ("warp_sum_x", "error_sum", "cycle"):
-                self.f.write(f"b{value:032b} {sid}\n")
-            elif signal == "state":
-                self.f.write(f"b{value:04b} {sid}\n")
-            else:
-                self.f.write(f"{value}{sid}\n")
-        else:
-            # Strings (rare)
-            self.f.write(f"{value}{sid}\n")
+        if signal not in SIGNALS:
+            raise KeyError(signal)
+        self._pending[signal] = value
+
+    # ----------------------------------------------------------------------
+    # Close the current cycle: one timestamp, changed signals only
+    # ----------------------------------------------------------------------
+    def end_cycle(self):
+        changes = []
+        last = self._last
+        for signal, value in self._pending.items():
+            if last.get(signal) != value:
+                last[signal] = value
+                changes.append(self._format(signal, value))
+        self._pending.clear()
+
+        if self.timestamp == 0:
+            self._emit("#0\n$dumpvars\n" + "".join(changes) + "$end\n")
+        elif changes:
+            self._emit(f"#{self.timestamp}\n" + "".join(changes))
+        self.timestamp += 1
+
+    def dump(self, values):
+        """
+        Record a full cycle snapshot ({signal: value}) and close the cycle.
+        """
+        self._pending.update(values)
+        self.end_cycle()
 
     # ----------------------------------------------------------------------
     # Close VCD file
     # ----------------------------------------------------------------------
     def close(self):
-        self.f.write("\n$comment\nISO‑16 VCD Logger Closed\n$end\n")
+        if self._pending:
+            self.end_cycle()
+        self._emit("\n$comment\nISO‑16 VCD Logger Closed\n$end\n")
         self.f.close()
+        for layer in self._layers:
+            layer.close()
 
 
 # --------------------------------------------------------------------------
@@ -113,11 +182,17 @@ if __name__ == "__main__":
     vcd.write("state", 1)          # COLLECT
     vcd.write("warp_sum_x", 0x4B82)
     vcd.write("error_sum", 0)
+    vcd.end_cycle()
+
     vcd.write("symmetry_ok", 1)
     vcd.write("error_ok", 1)
+    vcd.end_cycle()
 
     vcd.write("seal_start", 1)
+    vcd.end_cycle()
+
     vcd.write("seal_out", int("d8e4f0c4e9b6a5b8"*4, 16))
     vcd.write("seal_ready", 1)
+    vcd.end_cycle()
 
     vcd.close()
@@ -15,26 +15,41 @@
 //      CHECK_ERROR
 //      DECIDE_TRUE_FALSE
 // 3. Compare against expected outputs (JSON)
-// 4. (Optionally) integrate with a seal implementation
+// 4. Compute the Tetra‑Seal in worker mode (utils/seal.hpp, utils/seal.cpp)
+// 5. Worker mode (--worker): evaluate batches of vectors streamed over
+//    stdin/stdout for differential testing (iso16_differential.py)
 //
 // Dependencies: nlohmann/json (header-only JSON library)
 //   https://github.com/nlohmann/json
+// Building with -DISO16_NO_JSON drops it; only --worker is available then.
 //
 // Build example:
-//   g++ -std=c++17 -O2 -o iso16_runner reference_runner.cpp
+//   g++ -std=c++17 -O2 -o iso16_runner reference_runner.cpp utils/seal.cpp
 //   ./iso16_runner ../conformance/vectors/V0001.json ../conformance/expected/V0001_expected.json
+//
+//   g++ -std=c++17 -O2 -DISO16_NO_JSON -o iso16_worker reference_runner.cpp utils/seal.cpp
+//   ./iso16_worker --worker
 
 #include <iostream>
 #include <fstream>
 #include <vector>
+#include <array>
 #include <string>
+#include <tuple>
+#include <algorithm>
+#include <cstdio>
 #include <cstdint>
 #include <cmath>
 #include <stdexcept>
 
+#include "utils/q16.hpp"
+#include "utils/seal.hpp"
+
+#ifndef ISO16_NO_JSON
 #include "json.hpp"  // nlohmann::json
 
 using json = nlohmann::json;
+#endif
 
 // Q16.16 is represented as int32_t
 using q16 = int32_t;
@@ -44,16 +59,19 @@ static constexpr q16 EPSILON = 1; // 0x00000001
 
 // ---------------------- Q16.16 helpers ----------------------
 
+// Wraparound and the INT32_MIN clamp follow utils/q16.hpp; plain int32
+// arithmetic would overflow (undefined behavior) on edge vectors.
+
 inline q16 q16_add(q16 a, q16 b) {
-    return static_cast<q16>(a + b);
+    return iso16::add(a, b);
 }
 
 inline q16 q16_sub(q16 a, q16 b) {
-    return static_cast<q16>(a - b);
+    return iso16::sub(a, b);
 }
 
 inline q16 q16_abs(q16 a) {
-    return (a < 0) ? static_cast<q16>(-a) : a;
+    return iso16::abs(a);
 }
 
 inline bool q16_leq(q16 a, q16 b) {
@@ -106,6 +124,8 @@ struct ActualOutput {
     bool true_delivery;
 };
 
+#ifndef ISO16_NO_JSON
+
 // ---------------------- JSON helpers ----------------------
 
 json load_json_file(const std::string &path) {
@@ -204,6 +224,8 @@ ExpectedOutput parse_expected(const json &j) {
     return e;
 }
 
+#endif // ISO16_NO_JSON
+
 // ---------------------- ISO‑16 logic ----------------------
 
 std::tuple<std::vector<q16>, q16, bool> eval_plugins(const std::vector<Plugin> &plugins) {
@@ -320,11 +342,249 @@ void compare_results(const ActualOutput &actual, const ExpectedOutput &expected,
     }
 }
 
+// ---------------------- Tetra‑Seal ----------------------
+
+struct SealTrailer {
+    std::string implementation_id = "iso16-ref";
+    uint64_t timestamp = 0;
+    std::array<uint8_t, 16> nonce{};
+};
+
+std::vector<std::array<q16, 3>> phase_arrays(const std::vector<Phase> &phases) {
+    std::vector<std::array<q16, 3>> out;
+    out.reserve(phases.size());
+    for (const auto &p : phases) {
+        out.push_back({p.x, p.y, p.z});
+    }
+    return out;
+}
+
+// Lowercase hex Tetra‑Seal of a run. v.plugins must already be sorted by id.
+std::string compute_seal(const VectorInput &v, const ActualOutput &out,
+                         const SealTrailer &trailer) {
+    std::vector<iso16::Plugin> plugins;
+    plugins.reserve(v.plugins.size());
+    for (const auto &p : v.plugins) {
+        plugins.push_back({p.id, p.domain, p.warp_x, p.warp_y, p.warp_z, p.error, p.version});
+    }
+    return iso16::canonical_serialize_and_hash(
+        phase_arrays(v.initial_phase_state),
+        plugins,
+        {out.warp_total[0], out.warp_total[1], out.warp_total[2]},
+        out.error_total,
+        phase_arrays(out.phase_state_warped),
+        out.symmetry_ok,
+        out.error_ok,
+        out.true_delivery,
+        trailer.implementation_id,
+        trailer.timestamp,
+        trailer.nonce,
+        &iso16::sha3_256
+    );
+}
+
+// ---------------------- Worker mode ----------------------
+//
+// `--worker` stays resident and evaluates batches of vectors streamed on
+// stdin, answering each batch with one frame on stdout. Driven by
+// iso16_differential.py. All integers are little‑endian; strings are
+// UTF‑8 with a u16 length prefix.
+//
+//   greeting  "ISO16WK1"                              worker → harness, once
+//   frame     u32 payload_length, payload             both directions
+//   request   u32 count, count × vector
+//   vector    i32[48] initial_phase_state
+//             u16 plugin_count, plugin_count × plugin
+//             str implementation_id, u64 timestamp, u8[16] nonce
+//   plugin    str id, str domain, i32 warp[3], i32 error, str version,
+//             str status
+//   response  u32 count, count × result (WORKER_RESULT_SIZE bytes)
+//   result    u8 accepted (0: the seal rejected the vector, rest zero)
+//             i32 warp_total[3], i32 error_total, i32 phase_state_warped[48]
+//             u8 flags (bit 0 symmetry_ok, 1 error_ok, 2 true_delivery)
+//             u8[64] tetra_seal (lowercase hex)
+//
+// A zero‑length frame or EOF ends the session. A malformed frame is
+// fatal: the worker reports it on stderr and exits with status 2.
+
+static const char WORKER_GREETING[8] = {'I', 'S', 'O', '1', '6', 'W', 'K', '1'};
+static constexpr size_t WORKER_RESULT_SIZE = 1 + 4 * (3 + 1 + 48) + 1 + 64;
+
+class FrameReader {
+public:
+    FrameReader(const uint8_t *data, size_t size) : p_(data), end_(data + size) {}
+
+    const uint8_t *take(size_t n) {
+        if (static_cast<size_t>(end_ - p_) < n) {
+            throw std::runtime_error("truncated request frame");
+        }
+        const uint8_t *at = p_;
+        p_ += n;
+        return at;
+    }
+
+    uint64_t u(size_t n) {
+        const uint8_t *b = take(n);
+        uint64_t v = 0;
+        for (size_t i = n; i-- > 0;) {
+            v = (v << 8) | b[i];
+        }
+        return v;
+    }
+
+    q16 i32() { return static_cast<q16>(static_cast<uint32_t>(u(4))); }
+
+    std::string str() {
+        size_t n = u(2);
+        const uint8_t *b = take(n);
+        return std::string(reinterpret_cast<const char *>(b), n);
+    }
+
+    bool done() const { return p_ == end_; }
+
+private:
+    const uint8_t *p_;
+    const uint8_t *end_;
+};
+
+void put_u32(std::vector<uint8_t> &out, uint32_t v) {
+    for (int i = 0; i < 4; ++i) {
+        out.push_back((v >> (8 * i)) & 0xFF);
+    }
+}
+
+bool read_exact(uint8_t *buf, size_t n) {
+    return std::fread(buf, 1, n, stdin) == n;
+}
+
+void write_exact(const uint8_t *buf, size_t n) {
+    if (std::fwrite(buf, 1, n, stdout) != n) {
+        throw std::runtime_error("short write to harness");
+    }
+}
+
+void read_worker_vector(FrameReader &r, VectorInput &v, SealTrailer &trailer) {
+    v.initial_phase_state.resize(16);
+    for (auto &p : v.initial_phase_state) {
+        p.x = r.i32();
+        p.y = r.i32();
+        p.z = r.i32();
+    }
+
+    size_t count = r.u(2);
+    v.plugins.resize(count);
+    for (auto &pl : v.plugins) {
+        pl.id = r.str();
+        pl.domain = r.str();
+        pl.warp_x = r.i32();
+        pl.warp_y = r.i32();
+        pl.warp_z = r.i32();
+        pl.error = r.i32();
+        pl.version = r.str();
+        pl.status = r.str();
+    }
+    // Canonical plugin order (iso16_seal.md): lexicographic by id
+    std::sort(v.plugins.begin(), v.plugins.end(),
+              [](const Plugin &a, const Plugin &b) { return a.id < b.id; });
+
+    trailer.implementation_id = r.str();
+    trailer.timestamp = r.u(8);
+    const uint8_t *nonce = r.take(16);
+    std::copy(nonce, nonce + 16, trailer.nonce.begin());
+}
+
+void write_worker_result(std::vector<uint8_t> &out, const ActualOutput &act,
+                         const std::string &seal) {
+    out.push_back(1);
+    for (q16 w : act.warp_total) {
+        put_u32(out, static_cast<uint32_t>(w));
+    }
+    put_u32(out, static_cast<uint32_t>(act.error_total));
+    for (const auto &p : act.phase_state_warped) {
+        put_u32(out, static_cast<uint32_t>(p.x));
+        put_u32(out, static_cast<uint32_t>(p.y));
+        put_u32(out, static_cast<uint32_t>(p.z));
+    }
+    out.push_back((act.symmetry_ok ? 1 : 0) | (act.error_ok ? 2 : 0) | (act.true_delivery ? 4 : 0));
+    out.insert(out.end(), seal.begin(), seal.end());
+}
+
+int run_worker() {
+    write_exact(reinterpret_cast<const uint8_t *>(WORKER_GREETING), sizeof(WORKER_GREETING));
+    std::fflush(stdout);
+
+    std::vector<uint8_t> request;
+    std::vector<uint8_t> response;
+    VectorInput vec;
+    SealTrailer trailer;
+
+    for (;;) {
+        uint8_t len_bytes[4];
+        if (!read_exact(len_bytes, 4)) {
+            return 0;  // EOF
+        }
+        FrameReader len_reader(len_bytes, 4);
+        size_t length = len_reader.u(4);
+        if (length == 0) {
+            return 0;
+        }
+        request.resize(length);
+        if (!read_exact(request.data(), length)) {
+            throw std::runtime_error("truncated request frame");
+        }
+
+        FrameReader r(request.data(), request.size());
+        uint32_t count = static_cast<uint32_t>(r.u(4));
+        response.clear();
+        response.reserve(8 + count * WORKER_RESULT_SIZE);
+        put_u32(response, 0);  // payload length, patched below
+        put_u32(response, count);
+
+        for (uint32_t i = 0; i < count; ++i) {
+            read_worker_vector(r, vec, trailer);
+            ActualOutput act = execute_iso16(vec);
+            std::string seal;
+            try {
+                seal = compute_seal(vec, act, trailer);
+            } catch (const std::runtime_error &) {
+                // Not canonically encodable (e.g. a string over 255 bytes)
+                response.insert(response.end(), WORKER_RESULT_SIZE, 0);
+                continue;
+            }
+            write_worker_result(response, act, seal);
+        }
+        if (!r.done()) {
+            throw std::runtime_error("trailing bytes in request frame");
+        }
+
+        uint32_t payload = static_cast<uint32_t>(response.size() - 4);
+        for (int i = 0; i < 4; ++i) {
+            response[i] = (payload >> (8 * i)) & 0xFF;
+        }
+        write_exact(response.data(), response.size());
+        std::fflush(stdout);
+    }
+}
+
 // ---------------------- Main ----------------------
 
 int main(int argc, char **argv) {
+    if (argc == 2 && std::string(argv[1]) == "--worker") {
+        try {
+            return run_worker();
+        } catch (const std::exception &ex) {
+            std::cerr << "Worker error: " << ex.what() << "\n";
+            return 2;
+        }
+    }
+
+#ifdef ISO16_NO_JSON
+    std::cerr << "Usage: reference_runner --worker  (built without JSON support)\n";
+    return 1;
+#else
     if (argc != 3) {
-        std::cerr << "Usage: reference_runner <vector.json> <expected.json>\n";
+        std::cerr << "Usage: reference_runner <vector.json> <expected.json>\n"
+                  << "       reference_runner --worker\n";
         return 1;
     }
 
@@ -362,4 +622,5 @@ int main(int argc, char **argv) {
     }
 
     return 0;
+#endif
 }
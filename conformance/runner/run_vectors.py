@@ -33,16 +33,21 @@ def main(vectors_dir, expected_dir):
         require(const, ["epsilon","resolution","faces"], f"{name}.constants")
         eps = float(const["epsilon"])
 
-        # basic plugin status check
+        # basic plugin status check: a non-OK plugin decides FALSE on its own,
+        # so the phase metric is only computed when every plugin is OK
         plugins = vec["plugins"]
+        status_ok = True
         for p in plugins:
             require(p, ["plugin_id","status"], f"{name}.plugins")
             if p["status"] != "OK":
-                # must be FALSE unless explicitly permitted
-                pass
+                status_ok = False
 
-        metric = linf_metric(vec["initial_phase_state"])
-        verdict = "TRUE" if metric < eps and all(p["status"]=="OK" for p in plugins) else "FALSE"
+        if status_ok:
+            metric = linf_metric(vec["initial_phase_state"])
+            verdict = "TRUE" if metric < eps else "FALSE"
+        else:
+            metric = "skipped (plugin status)"
+            verdict = "FALSE"
 
         exp = vec["expected"]
         exp_verdict = exp["verdict"]
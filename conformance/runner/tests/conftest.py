@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# Tests import runner modules (utils.q16, ...) the way the scripts do
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
@@ -0,0 +1,66 @@
+"""
+iso16_differential.run_differential() against a scripted worker.
+
+The worker stands in for the C++ reference: it answers with the Python
+engine's own outputs except where a test makes it reject a vector or
+report a different value, so the mismatch stream can be checked
+without building the worker.
+"""
+
+import io
+import json
+
+from iso16_differential import COMPARED_FIELDS, boundary_vectors, reference_outputs, run_differential
+
+
+class ScriptedWorker:
+    """
+    submit()/receive() like ReferenceWorker; `answer(index, outputs)`
+    returns what the worker reports for the vector at `index`.
+    """
+
+    def __init__(self, vectors, answer):
+        self.vectors = vectors
+        self.answer = answer
+        self.batches = []
+
+    def submit(self, payload: bytes) -> None:
+        self.batches.append(payload)
+
+    def receive(self) -> list:
+        self.batches.pop(0)
+        return [self.answer(i, reference_outputs(v)) for i, v in enumerate(self.vectors)]
+
+
+def run(answer, count: int = 4):
+    vectors = boundary_vectors()[:count]
+    out = io.StringIO()
+    stats = run_differential([("vectors", vectors)], ScriptedWorker(vectors, answer), out)
+    return stats, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_agreeing_worker_reports_nothing():
+    stats, mismatches = run(lambda i, outputs: outputs)
+    assert stats["vectors"] == 4 and stats["mismatches"] == 0
+    assert mismatches == []
+
+
+def test_one_sided_rejection_is_reported():
+    stats, mismatches = run(lambda i, outputs: None if i == 1 else outputs)
+    assert stats["mismatches"] == 1
+    (record,) = mismatches
+    assert record["index"] == 1 and record["fields"] == ["accepted"]
+    assert record["cpp"] is None
+    assert sorted(record["python"]) == sorted(COMPARED_FIELDS)
+
+
+def test_field_mismatch_reports_only_differing_fields():
+    def answer(i, outputs):
+        if i == 2:
+            outputs = dict(outputs, error_total=outputs["error_total"] + 1)
+        return outputs
+
+    stats, mismatches = run(answer)
+    (record,) = mismatches
+    assert record["fields"] == ["error_total"]
+    assert record["python"]["error_total"] + 1 == record["cpp"]["error_total"]
@@ -0,0 +1,154 @@
+"""
+Property tests: utils/q16_array.py against the scalar utils/q16.py.
+
+Every vectorized op, wrapping and saturating, is checked element by
+element on seeded random int32 samples mixed with the int32 edge values.
+With hypothesis installed the same properties are also checked on
+generated examples.
+"""
+
+import numpy as np
+import pytest
+
+from utils import q16
+from utils.q16 import INT32_MAX, INT32_MIN
+from utils.q16_array import (adjacent_deltas, as_q16, q16_abs, q16_add, q16_leq, q16_mul,
+                             q16_norm2, q16_sub, q16_sum)
+
+try:
+    from hypothesis import given, strategies as st
+except ImportError:  # hypothesis not installed: seeded sweeps only
+    given = None
+
+N = 20000
+EDGES = [0, 1, -1, 2, -2, 1 << 16, -(1 << 16), INT32_MAX, INT32_MIN, INT32_MAX - 1, INT32_MIN + 1]
+
+
+def clamp(v: int) -> int:
+    return max(INT32_MIN, min(INT32_MAX, v))
+
+
+def scalar_sum(row) -> int:
+    total = 0
+    for c in row:
+        total = q16.q16_add(total, c)
+    return total
+
+
+@pytest.fixture
+def sample():
+    rng = np.random.default_rng(16)
+
+    def draw(size):
+        out = rng.integers(INT32_MIN, INT32_MAX, size=size, endpoint=True, dtype=np.int64)
+        mask = rng.random(size) < 0.25
+        out[mask] = rng.choice(EDGES, size=int(mask.sum()))
+        return out
+
+    return draw
+
+
+def ints(a) -> list:
+    return [int(x) for x in np.asarray(a).reshape(-1)]
+
+
+# ------------------------------------------------------------
+# Element‑wise binary and unary ops
+# ------------------------------------------------------------
+
+BINARY = {
+    "add":     (lambda a, b: q16_add(a, b), q16.q16_add),
+    "sub":     (lambda a, b: q16_sub(a, b), q16.q16_sub),
+    "leq":     (lambda a, b: q16_leq(a, b), q16.q16_leq),
+    "mul":     (lambda a, b: q16_mul(a, b), q16.q16_mul),
+    "add_sat": (lambda a, b: q16_add(a, b, saturate=True), lambda x, y: clamp(x + y)),
+    "sub_sat": (lambda a, b: q16_sub(a, b, saturate=True), lambda x, y: clamp(x - y)),
+    "mul_sat": (lambda a, b: q16_mul(a, b, saturate=True), lambda x, y: clamp((x * y) >> 16)),
+}
+
+
+@pytest.mark.parametrize("name", sorted(BINARY))
+def test_binary_matches_scalar(name, sample):
+    vectorized, scalar = BINARY[name]
+    a, b = sample(N), sample(N)
+    got = vectorized(a, b).tolist()
+    assert got == [scalar(x, y) for x, y in zip(ints(a), ints(b))]
+
+
+def test_abs_matches_scalar(sample):
+    a = sample(N)
+    assert q16_abs(a).tolist() == [q16.q16_abs(x) for x in ints(a)]
+
+
+def test_as_q16_wraps_like_to_int32():
+    rng = np.random.default_rng(16)
+    wide = rng.integers(-(1 << 40), 1 << 40, size=N, dtype=np.int64)
+    assert as_q16(wide).tolist() == [q16._to_int32(x) for x in ints(wide)]
+
+
+def test_results_are_int32(sample):
+    a, b = sample(64), sample(64)
+    for result in (q16_add(a, b), q16_sub(a, b), q16_abs(a), q16_mul(a, b),
+                   q16_mul(a, b, saturate=True), q16_norm2(sample((8, 3)))):
+        assert result.dtype == np.int32
+
+
+# ------------------------------------------------------------
+# Reductions
+# ------------------------------------------------------------
+
+def test_norm2_matches_scalar(sample):
+    v = sample((N // 3, 3))
+    rows = [ints(row) for row in v]
+    assert q16_norm2(v).tolist() == [q16.q16_norm2(row) for row in rows]
+
+
+def test_norm2_saturating_clamps_exact_total(sample):
+    v = sample((N // 3, 3))
+    rows = [ints(row) for row in v]
+    want = [clamp(sum((c * c) >> 16 for c in row)) for row in rows]
+    assert q16_norm2(v, saturate=True).tolist() == want
+
+
+def test_sum_matches_repeated_add(sample):
+    terms = sample((N // 8, 8))
+    assert q16_sum(terms, axis=1).tolist() == [scalar_sum(ints(row)) for row in terms]
+
+
+def test_sum_saturating_clamps_exact_total(sample):
+    terms = sample((N // 8, 8))
+    assert q16_sum(terms, axis=1, saturate=True).tolist() == [clamp(sum(ints(row))) for row in terms]
+
+
+def test_adjacent_deltas_match_scalar_sub(sample):
+    phases = sample((64, 16, 3))
+    want = [q16.q16_sub(int(phases[k, i, c]), int(phases[k, i + 1, c]))
+            for k in range(64) for i in range(15) for c in range(3)]
+    assert adjacent_deltas(phases).reshape(-1).tolist() == want
+
+
+# ------------------------------------------------------------
+# Generated examples (hypothesis)
+# ------------------------------------------------------------
+
+if given is not None:
+    int32s = st.one_of(st.sampled_from(EDGES), st.integers(INT32_MIN, INT32_MAX))
+
+    @given(int32s, int32s)
+    def test_binary_ops_generated(x, y):
+        a, b = np.array([x], dtype=np.int64), np.array([y], dtype=np.int64)
+        for vectorized, scalar in BINARY.values():
+            assert vectorized(a, b).tolist() == [scalar(x, y)]
+        assert q16_abs(a).tolist() == [q16.q16_abs(x)]
+
+    @given(st.lists(int32s, min_size=3, max_size=3))
+    def test_norm2_generated(row):
+        v = np.array([row], dtype=np.int64)
+        assert q16_norm2(v).tolist() == [q16.q16_norm2(row)]
+        assert q16_norm2(v, saturate=True).tolist() == [clamp(sum((c * c) >> 16 for c in row))]
+
+    @given(st.lists(int32s, min_size=1, max_size=32))
+    def test_sum_generated(row):
+        terms = np.array([row], dtype=np.int64)
+        assert q16_sum(terms, axis=1).tolist() == [scalar_sum(row)]
+        assert q16_sum(terms, axis=1, saturate=True).tolist() == [clamp(sum(row))]
@@ -0,0 +1,695 @@
+"""
+ISO‑16 Columnar Audit Archive (.i16a)
+-------------------------------------
+
+Read‑optimized, immutable archive of audit records (iso16_audit.md §3)
+for queries over months of evaluations, e.g.
+
+    true_delivery == false AND error_total > 1 AND plugins.gamma.status != OK
+
+Records are stored by column, in row groups, over the field set of
+utils/seal.canonical_serialize() plus the vector_id, the (unsealed)
+plugin statuses and the recorded Tetra‑Seal. The seal input itself is
+not stored; it is recomputed from the columns when asked for.
+
+Plugin rows are written in key order but read back keyed by their id,
+so add() rejects a record whose plugins are not keyed by their own id
+(utils.seal.check_plugin_ids()), as AuditStore.append() does; such a
+record would otherwise rebuild different seal inputs on scan().
+
+Column encodings (per row group):
+
+    initial_phase_state   phase 0 as int32, phases 1–15 as int32
+                          wraparound deltas from the previous phase
+    phase_state_warped    residual from initial + warp_total (all zero
+                          for a conforming implementation)
+    timestamp             deltas from the previous row
+    symmetry_ok, error_ok, true_delivery
+                          bit‑packed, one column each
+    implementation_id, plugin id/domain/version
+                          codes into archive‑wide dictionaries
+    plugin outputs        flattened in canonical (sorted id) order:
+                          plugin_count per row, then one value per plugin
+    nonce, tetra_seal     raw 16 / 32 bytes
+
+Every integer column is stored in the narrowest signed type that holds
+it, and each chunk is zlib‑compressed when that makes it smaller.
+
+Layout:
+
+    header      32 bytes: magic "ISO16ARC", u16 version, u16 flags,
+                u32 reserved, u64 footer_offset, u64 footer_length
+    chunks      column chunks, 8‑byte aligned
+    footer      JSON: row count, dictionaries, and per row group the
+                chunk directory and statistics (min/max of the scalar
+                columns, plugin id codes present)
+
+Predicate pushdown: scan() first drops row groups whose statistics
+cannot satisfy the predicates, then decodes only the columns the
+predicates name, and decodes the projected columns only for the
+matching rows' groups.
+
+Predicates are (column, op, value) with op one of == != < <= > >=, on:
+
+    error_total, timestamp, plugin_count, warp_total.x|y|z,
+    symmetry_ok, error_ok, true_delivery,
+    vector_id, implementation_id, tetra_seal     (== and != only)
+    plugins.<id>.status|domain|version           (== and != only)
+    plugins.<id>.error
+
+A plugins.<id> predicate holds for a row only if the row has that plugin.
+
+This module is INFORMATIVE. Running it from conformance/runner as
+
+    python3 -m utils.audit_archive build OUT.i16a --store DIR | --jsonl FILE
+    python3 -m utils.audit_archive query ARCHIVE -w "true_delivery==false" ...
+
+builds or queries an archive.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import operator
+import re
+import struct
+import sys
+import zlib
+from typing import NamedTuple
+
+import numpy as np
+
+from utils.q16_array import as_q16
+from utils.seal import SEAL_PREFIX, canonical_serialize, check_plugin_ids
+from utils.vector_pack import STATUS_CODES, STATUS_NAMES
+
+MAGIC   = b"ISO16ARC"
+VERSION = 1
+
+DEFAULT_ROW_GROUP = 65536
+
+_HEADER = struct.Struct("<8sHHIQQ")
+
+_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<":  operator.lt,
+    "<=": operator.le,
+    ">":  operator.gt,
+    ">=": operator.ge,
+}
+
+_INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+# Scalar columns with min/max statistics per row group
+_STAT_COLUMNS = ("error_total", "timestamp", "plugin_count",
+                 "warp_total.x", "warp_total.y", "warp_total.z",
+                 "symmetry_ok", "error_ok", "true_delivery")
+
+_FLAG_COLUMNS = ("symmetry_ok", "error_ok", "true_delivery")
+
+COLUMNS = ("vector_id", "initial_phase_state", "plugins", "warp_total", "error_total",
+           "phase_state_warped", "symmetry_ok", "error_ok", "true_delivery",
+           "implementation_id", "timestamp", "nonce", "tetra_seal")
+
+
+class Predicate(NamedTuple):
+    column: str
+    op: str
+    value: object
+
+
+def parse_predicate(text: str) -> Predicate:
+    """
+    Parse "column OP value"; value is true/false, an integer or a string.
+    """
+    m = re.fullmatch(r"\s*([\w.\-]+)\s*(==|!=|<=|>=|<|>)\s*(.*?)\s*", text)
+    if m is None:
+        raise ValueError(f"Invalid predicate: {text!r}")
+    column, op, raw = m.groups()
+    if raw.lower() in ("true", "false"):
+        value = raw.lower() == "true"
+    elif re.fullmatch(r"-?\d+", raw):
+        value = int(raw)
+    else:
+        value = raw
+    return Predicate(column, op, value)
+
+
+# ------------------------------------------------------------
+# Chunk encoding
+# ------------------------------------------------------------
+
+def _narrow(a: np.ndarray) -> np.ndarray:
+    """
+    Smallest signed integer type holding every value of `a`.
+    """
+    if a.size == 0:
+        return a.astype(np.int8)
+    lo, hi = int(a.min()), int(a.max())
+    for dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return a.astype(dtype)
+    raise OverflowError("Column value outside int64")
+
+
+def _wrap_delta(a: np.ndarray, axis: int) -> np.ndarray:
+    """
+    int32 wraparound differences along `axis` (first element dropped).
+    """
+    return as_q16(np.diff(a.astype(np.int64), axis=axis))
+
+
+# ------------------------------------------------------------
+# Writer
+# ------------------------------------------------------------
+
+class AuditArchiveWriter:
+    """
+    Stream audit records into an .i16a archive, one row group at a time.
+    """
+
+    def __init__(self, path, row_group_size: int = DEFAULT_ROW_GROUP, compress: bool = True):
+        self.path = path
+        self.row_group_size = row_group_size
+        self.compress = compress
+        self._f = open(path, "wb")
+        self._f.write(bytes(_HEADER.size))
+
+        self._dicts = {name: {} for name in ("implementation_id", "plugin_id", "domain", "version")}
+        self._groups = []
+        self._rows = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buf = {name: [] for name in (
+            "vector_id", "initial", "warped", "warp_total", "error_total", "flags",
+            "implementation_id", "timestamp", "nonce", "tetra_seal", "plugin_count",
+            "plugin_id", "domain", "version", "plugin_warp", "plugin_error", "status",
+        )}
+
+    def _code(self, dictionary: str, value: str) -> int:
+        d = self._dicts[dictionary]
+        code = d.get(value)
+        if code is None:
+            code = d[value] = len(d)
+        return code
+
+    def add(self, vector: dict, actual: dict = None, tetra_seal=None) -> None:
+        """
+        Append one record. As with AuditStore.append(), `vector` alone is
+        a flat audit record; a missing Tetra‑Seal is computed. Raises
+        ValueError if a plugin is not keyed by its own id.
+        """
+        check_plugin_ids(vector["plugins"])
+        if actual is None:
+            actual = vector
+            if tetra_seal is None:
+                tetra_seal = vector.get("tetra_seal")
+        if tetra_seal is None:
+            tetra_seal = hashlib.sha3_256(SEAL_PREFIX + canonical_serialize(vector, actual)).digest()
+        elif isinstance(tetra_seal, str):
+            tetra_seal = bytes.fromhex(tetra_seal)
+        nonce = vector.get("nonce", bytes(16))
+        if isinstance(nonce, str):
+            nonce = bytes.fromhex(nonce)
+        if len(tetra_seal) != 32 or len(nonce) != 16:
+            raise ValueError("tetra_seal must be 32 bytes and nonce 16 bytes")
+
+        b = self._buf
+        b["vector_id"].append(vector.get("vector_id") or "")
+        b["initial"].append([c for phase in vector["initial_phase_state"] for c in phase])
+        b["warped"].append([c for phase in actual["phase_state_warped"] for c in phase])
+        b["warp_total"].append(actual["warp_total"])
+        b["error_total"].append(actual["error_total"])
+        b["flags"].append((actual["symmetry_ok"], actual["error_ok"], actual["true_delivery"]))
+        b["implementation_id"].append(self._code("implementation_id",
+                                                 vector.get("implementation_id", "iso16-ref")))
+        b["timestamp"].append(vector.get("timestamp", 0))
+        b["nonce"].append(nonce)
+        b["tetra_seal"].append(bytes(tetra_seal))
+
+        plugins = vector["plugins"]
+        b["plugin_count"].append(len(plugins))
+        for pid in sorted(plugins):
+            p = plugins[pid]
+            b["plugin_id"].append(self._code("plugin_id", p["id"]))
+            b["domain"].append(self._code("domain", p["domain"]))
+            b["version"].append(self._code("version", p["version"]))
+            b["plugin_warp"].append(p["warp_vector"])
+            b["plugin_error"].append(p["error"])
+            b["status"].append(STATUS_CODES[p["status"]])
+
+        if len(b["vector_id"]) >= self.row_group_size:
+            self._flush_group()
+
+    def _write_chunk(self, columns: dict, name: str, a: np.ndarray) -> None:
+        a = np.ascontiguousarray(a)
+        data = a.tobytes()
+        codec = "raw"
+        if self.compress:
+            packed = zlib.compress(data, 1)
+            if len(packed) < len(data):
+                data, codec = packed, "zlib"
+        pad = -self._f.tell() % 8
+        self._f.write(bytes(pad))
+        columns[name] = {
+            "offset": self._f.tell(),
+            "length": len(data),
+            "dtype": a.dtype.str,
+            "shape": list(a.shape),
+            "codec": codec,
+        }
+        self._f.write(data)
+
+    def _flush_group(self) -> None:
+        b = self._buf
+        n = len(b["vector_id"])
+        if n == 0:
+            return
+        columns = {}
+
+        def chunk(name, a):
+            self._write_chunk(columns, name, a)
+
+        vid = [s.encode("utf-8") for s in b["vector_id"]]
+        chunk("vector_id.offsets", _narrow(np.cumsum([0] + [len(s) for s in vid], dtype=np.int64)))
+        chunk("vector_id.data", np.frombuffer(b"".join(vid), dtype=np.uint8))
+
+        initial = np.array(b["initial"], dtype=np.int64).reshape(n, 16, 3)
+        warp_total = np.array(b["warp_total"], dtype=np.int64).reshape(n, 3)
+        warped = np.array(b["warped"], dtype=np.int64).reshape(n, 16, 3)
+        chunk("initial_phase_state.base", initial[:, 0, :].astype(np.int32))
+        chunk("initial_phase_state.delta", _narrow(_wrap_delta(initial, axis=1)))
+        chunk("phase_state_warped.residual",
+              _narrow(as_q16(warped - initial - warp_total[:, None, :])))
+
+        error_total = np.array(b["error_total"], dtype=np.int64)
+        chunk("warp_total", _narrow(warp_total))
+        chunk("error_total", _narrow(error_total))
+
+        flags = np.array(b["flags"], dtype=bool).reshape(n, 3)
+        for k, name in enumerate(_FLAG_COLUMNS):
+            chunk(name, np.packbits(flags[:, k]))
+
+        timestamp = np.array(b["timestamp"], dtype=np.uint64).view(np.int64)
+        chunk("timestamp.delta", _narrow(np.diff(timestamp, prepend=np.int64(0))))
+        chunk("implementation_id", _narrow(np.array(b["implementation_id"], dtype=np.int64)))
+        chunk("nonce", np.frombuffer(b"".join(b["nonce"]), dtype=np.uint8).reshape(n, 16))
+        chunk("tetra_seal", np.frombuffer(b"".join(b["tetra_seal"]), dtype=np.uint8).reshape(n, 32))
+
+        plugin_count = np.array(b["plugin_count"], dtype=np.int64)
+        plugin_ids = np.array(b["plugin_id"], dtype=np.int64)
+        plugin_error = np.array(b["plugin_error"], dtype=np.int64)
+        chunk("plugin_count", _narrow(plugin_count))
+        chunk("plugin.id", _narrow(plugin_ids))
+        chunk("plugin.domain", _narrow(np.array(b["domain"], dtype=np.int64)))
+        chunk("plugin.version", _narrow(np.array(b["version"], dtype=np.int64)))
+        chunk("plugin.warp_vector", _narrow(np.array(b["plugin_warp"], dtype=np.int64).reshape(-1, 3)))
+        chunk("plugin.error", _narrow(plugin_error))
+        chunk("plugin.status", np.array(b["status"], dtype=np.uint8))
+
+        stats = {}
+        scalars = {
+            "error_total": error_total,
+            "timestamp": np.array(b["timestamp"], dtype=np.uint64),
+            "plugin_count": plugin_count,
+            "warp_total.x": warp_total[:, 0],
+            "warp_total.y": warp_total[:, 1],
+            "warp_total.z": warp_total[:, 2],
+        }
+        for k, name in enumerate(_FLAG_COLUMNS):
+            scalars[name] = flags[:, k]
+        for name, a in scalars.items():
+            stats[name] = [int(a.min()), int(a.max())]
+        stats["plugin_ids"] = sorted(set(b["plugin_id"]))
+
+        self._groups.append({"rows": n, "columns": columns, "stats": stats})
+        self._rows += n
+        self._reset()
+
+    @property
+    def row_count(self) -> int:
+        return self._rows + len(self._buf["vector_id"])
+
+    def close(self) -> None:
+        if self._f is None:
+            return
+        self._flush_group()
+
+        footer = json.dumps({
+            "rows": self._rows,
+            "dictionaries": {name: list(d) for name, d in self._dicts.items()},
+            "row_groups": self._groups,
+        }, separators=(",", ":")).encode("utf-8")
+        footer_offset = self._f.tell()
+        self._f.write(footer)
+
+        self._f.seek(0)
+        self._f.write(_HEADER.pack(MAGIC, VERSION, 0, 0, footer_offset, len(footer)))
+        self._f.close()
+        self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_archive(path, records, row_group_size: int = DEFAULT_ROW_GROUP) -> int:
+    """
+    Write flat audit records to an archive; returns the record count.
+    """
+    with AuditArchiveWriter(path, row_group_size) as w:
+        for record in records:
+            w.add(record)
+        return w.row_count
+
+
+# ------------------------------------------------------------
+# Reader
+# ------------------------------------------------------------
+
+class _RowGroup:
+    """
+    Lazily decoded columns of one row group.
+    """
+
+    def __init__(self, archive, meta: dict):
+        self.archive = archive
+        self.rows = meta["rows"]
+        self.stats = meta["stats"]
+        self._chunks = meta["columns"]
+        self._decoded = {}
+
+    def chunk(self, name: str) -> np.ndarray:
+        c = self._chunks[name]
+        data = self.archive._mm[c["offset"]:c["offset"] + c["length"]]
+        if c["codec"] == "zlib":
+            data = zlib.decompress(data)
+        return np.frombuffer(data, dtype=np.dtype(c["dtype"])).reshape(c["shape"])
+
+    def column(self, name: str):
+        out = self._decoded.get(name)
+        if out is None:
+            out = self._decoded[name] = self._decode(name)
+        return out
+
+    def _decode(self, name: str):
+        n = self.rows
+        if name == "vector_id":
+            offsets = self.chunk("vector_id.offsets")
+            data = self.chunk("vector_id.data").tobytes()
+            return [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n)]
+        if name == "initial_phase_state":
+            base = self.chunk("initial_phase_state.base").astype(np.int64)
+            delta = self.chunk("initial_phase_state.delta").astype(np.int64)
+            return as_q16(np.cumsum(np.concatenate((base[:, None, :], delta), axis=1), axis=1))
+        if name == "phase_state_warped":
+            residual = self.chunk("phase_state_warped.residual").astype(np.int64)
+            initial = self.column("initial_phase_state").astype(np.int64)
+            warp_total = self.column("warp_total").astype(np.int64)
+            return as_q16(initial + warp_total[:, None, :] + residual)
+        if name in ("warp_total", "error_total"):
+            return self.chunk(name).astype(np.int32)
+        if name.startswith("warp_total."):
+            return self.column("warp_total")[:, "xyz".index(name[-1])]
+        if name in _FLAG_COLUMNS:
+            return np.unpackbits(self.chunk(name), count=n).astype(bool)
+        if name == "timestamp":
+            return np.cumsum(self.chunk("timestamp.delta").astype(np.int64)).view(np.uint64)
+        if name == "plugin_offsets":
+            return np.concatenate(([0], np.cumsum(self.column("plugin_count"))))
+        if name == "plugin_row":
+            return np.repeat(np.arange(n), self.column("plugin_count"))
+        if name in ("implementation_id", "nonce", "tetra_seal", "plugin_count") or name.startswith("plugin."):
+            return self.chunk(name)
+        raise KeyError(f"Unknown column: {name!r}")
+
+
+class AuditArchive:
+    """
+    Memory‑mapped, read‑only view of an .i16a archive.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, _, footer_offset, footer_length = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not an ISO-16 audit archive")
+        if version != VERSION:
+            raise ValueError(f"{path}: unsupported archive version {version}")
+        raw = self._mm[footer_offset:footer_offset + footer_length]
+        footer = json.loads(raw)
+
+        # Identifies the archive contents (e.g. for replay checkpoints)
+        self.fingerprint = hashlib.sha256(raw).hexdigest()
+
+        self.rows = footer["rows"]
+        self.dictionaries = footer["dictionaries"]
+        self._codes = {name: {v: i for i, v in enumerate(values)}
+                       for name, values in self.dictionaries.items()}
+        self._groups = footer["row_groups"]
+
+    def __len__(self):
+        return self.rows
+
+    @property
+    def row_group_count(self) -> int:
+        return len(self._groups)
+
+    def row_group(self, i: int) -> _RowGroup:
+        return _RowGroup(self, self._groups[i])
+
+    # --------------------------------------------------------
+    # Predicates
+    # --------------------------------------------------------
+
+    def _code(self, dictionary: str, value):
+        return self._codes[dictionary].get(value, -1)
+
+    def _may_match(self, stats: dict, pred: Predicate) -> bool:
+        """
+        False when the row group's statistics rule the predicate out.
+        """
+        if pred.column.startswith("plugins."):
+            pid = pred.column[len("plugins."):].rsplit(".", 1)[0]
+            return self._code("plugin_id", pid) in stats["plugin_ids"]
+        if pred.column not in _STAT_COLUMNS:
+            return True
+        lo, hi = stats[pred.column]
+        v = int(pred.value)
+        return {
+            "==": lo <= v <= hi,
+            "!=": not lo == hi == v,
+            "<":  lo < v,
+            "<=": lo <= v,
+            ">":  hi > v,
+            ">=": hi >= v,
+        }[pred.op]
+
+    def _mask(self, group: _RowGroup, pred: Predicate) -> np.ndarray:
+        op = _OPS[pred.op]
+        column, value = pred.column, pred.value
+
+        if column.startswith("plugins."):
+            pid, field = column[len("plugins."):].rsplit(".", 1)
+            if field in ("status", "domain", "version"):
+                if pred.op not in ("==", "!="):
+                    raise ValueError(f"{column} supports == and != only")
+                values = group.column(f"plugin.{field}")
+                if field == "status":
+                    code = STATUS_CODES.get(value, -1)
+                else:
+                    code = self._code(field, value)
+            elif field == "error":
+                values, code = group.column("plugin.error"), value
+            else:
+                raise KeyError(f"Unknown plugin field: {field!r}")
+            hits = (group.column("plugin.id") == self._code("plugin_id", pid)) & op(values, code)
+            mask = np.zeros(group.rows, dtype=bool)
+            mask[group.column("plugin_row")[hits]] = True
+            return mask
+
+        if column in ("vector_id", "implementation_id", "tetra_seal"):
+            if pred.op not in ("==", "!="):
+                raise ValueError(f"{column} supports == and != only")
+            if column == "vector_id":
+                eq = np.array([v == value for v in group.column("vector_id")], dtype=bool)
+            elif column == "implementation_id":
+                eq = group.column(column) == self._code("implementation_id", value)
+            else:
+                seal = np.frombuffer(bytes.fromhex(value), dtype=np.uint8)
+                eq = np.all(group.column(column) == seal, axis=1)
+            return eq if pred.op == "==" else ~eq
+
+        if column in _STAT_COLUMNS:
+            if column == "timestamp":
+                value = np.uint64(value)
+            return op(group.column(column), value)
+
+        raise KeyError(f"Unknown predicate column: {column!r}")
+
+    # --------------------------------------------------------
+    # Scanning
+    # --------------------------------------------------------
+
+    def _matches(self, group: _RowGroup, where) -> np.ndarray:
+        mask = np.ones(group.rows, dtype=bool)
+        for pred in where:
+            mask &= self._mask(group, pred)
+            if not mask.any():
+                break
+        return mask
+
+    def _record(self, group: _RowGroup, i: int, columns) -> dict:
+        record = {}
+        for name in columns:
+            if name == "vector_id":
+                record[name] = group.column(name)[i]
+            elif name in ("initial_phase_state", "phase_state_warped"):
+                record[name] = group.column(name)[i].tolist()
+            elif name == "plugins":
+                names = self.dictionaries
+                statuses = group.column("plugin.status")
+                start, stop = group.column("plugin_offsets")[i:i + 2]
+                plugins = {}
+                for k in range(start, stop):
+                    pid = names["plugin_id"][group.column("plugin.id")[k]]
+                    plugins[pid] = {
+                        "id": pid,
+                        "domain": names["domain"][group.column("plugin.domain")[k]],
+                        "warp_vector": group.column("plugin.warp_vector")[k].astype(np.int32).tolist(),
+                        "error": int(group.column("plugin.error")[k]),
+                        "version": names["version"][group.column("plugin.version")[k]],
+                        "status": STATUS_NAMES[statuses[k]],
+                    }
+                record[name] = plugins
+            elif name == "warp_total":
+                record[name] = group.column(name)[i].tolist()
+            elif name == "error_total":
+                record[name] = int(group.column(name)[i])
+            elif name in _FLAG_COLUMNS:
+                record[name] = bool(group.column(name)[i])
+            elif name == "implementation_id":
+                record[name] = self.dictionaries["implementation_id"][group.column(name)[i]]
+            elif name == "timestamp":
+                record[name] = int(group.column(name)[i])
+            elif name in ("nonce", "tetra_seal"):
+                record[name] = group.column(name)[i].tobytes().hex()
+            else:
+                raise KeyError(f"Unknown column: {name!r}")
+        return record
+
+    def scan(self, where=(), columns=None, groups=None):
+        """
+        Yield records (dicts of the projected `columns`, default all)
+        matching every predicate in `where`, in archive order. Predicates
+        may be Predicate tuples or "column OP value" strings; `groups`
+        restricts the scan to those row group indices.
+
+        The column "seal_inputs" yields the recomputed canonical
+        serialization (hex) and needs no other column in the projection.
+        """
+        where = [parse_predicate(p) if isinstance(p, str) else Predicate(*p) for p in where]
+        columns = list(COLUMNS if columns is None else columns)
+        with_seal_inputs = "seal_inputs" in columns
+        fields = [c for c in columns if c != "seal_inputs"]
+        read = list(COLUMNS) if with_seal_inputs else fields
+
+        for g in range(len(self._groups)) if groups is None else groups:
+            if not all(self._may_match(self._groups[g]["stats"], p) for p in where):
+                continue
+            group = self.row_group(g)
+            for i in np.flatnonzero(self._matches(group, where)):
+                record = self._record(group, int(i), read)
+                if with_seal_inputs:
+                    record["seal_inputs"] = canonical_serialize(record, record).hex()
+                    record = {c: record[c] for c in columns}
+                yield record
+
+    def count(self, where=()) -> int:
+        """
+        Number of matching records; no projected column is decoded.
+        """
+        where = [parse_predicate(p) if isinstance(p, str) else Predicate(*p) for p in where]
+        total = 0
+        for g, meta in enumerate(self._groups):
+            if all(self._may_match(meta["stats"], p) for p in where):
+                total += int(self._matches(self.row_group(g), where).sum())
+        return total
+
+    def __iter__(self):
+        return self.scan()
+
+    def close(self) -> None:
+        self._mm.close()
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ------------------------------------------------------------
+# CLI (informative)
+# ------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Columnar Audit Archive")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build an archive from an audit store or JSON Lines records.")
+    build.add_argument("output", help="Archive path (.i16a).")
+    source = build.add_mutually_exclusive_group(required=True)
+    source.add_argument("--store", help="Audit store directory (utils/audit_store.py).")
+    source.add_argument("--jsonl", help="Flat audit records, one JSON object per line ('-' for stdin).")
+    build.add_argument("--row-group", type=int, default=DEFAULT_ROW_GROUP,
+                       help=f"Rows per row group. Default: {DEFAULT_ROW_GROUP}.")
+
+    query = sub.add_parser("query", help="Scan an archive with predicate pushdown.")
+    query.add_argument("archive")
+    query.add_argument("-w", "--where", action="append", default=[],
+                       help='Predicate "column OP value"; repeat for AND.')
+    query.add_argument("-c", "--columns", help="Comma-separated projection. Default: all.")
+    query.add_argument("--count", action="store_true", help="Print only the number of matches.")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if args.store:
+            from utils.audit_store import AuditStore
+            store = AuditStore(args.store)
+            records = iter(store)
+        else:
+            store = None
+            f = sys.stdin if args.jsonl == "-" else open(args.jsonl)
+            records = (json.loads(line) for line in f if line.strip())
+        try:
+            n = write_archive(args.output, records, args.row_group)
+        finally:
+            if store is not None:
+                store.close()
+        print(f"[*] Archived {n:,} records → {args.output}", file=sys.stderr)
+        return
+
+    with AuditArchive(args.archive) as archive:
+        if args.count:
+            print(archive.count(args.where))
+            return
+        columns = args.columns.split(",") if args.columns else None
+        n = 0
+        for record in archive.scan(args.where, columns):
+            print(json.dumps(record, separators=(",", ":")))
+            n += 1
+        print(f"[*] {n:,} of {len(archive):,} records matched", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,656 @@
+"""
+ISO‑16 Append‑Only Audit Record Store
+-------------------------------------
+
+Stores the full audit record of iso16_audit.md §3 for every evaluation
+in an append‑only, segmented log, with sidecar indexes so that a single
+record can be fetched by tetra_seal, vector_id or time range without
+scanning.
+
+Each record is kept as its seal input, canonical_serialize() bytes
+(iso16_seal.md §3), which already carry the initial and warped
+PhaseState, plugin outputs, totals, flags, implementation_id, timestamp
+and nonce. Alongside it are the vector_id, the plugin statuses (not
+sealed, but needed to re‑derive error_ok) and the recorded Tetra‑Seal.
+
+Layout:
+
+    <store_dir>/seg-<n:08d>.log    records, append‑only
+    <store_dir>/seg-<n:08d>.idx    sidecar index, written when the
+                                   segment is sealed
+
+Segment file (integers little‑endian):
+
+    header   magic "ISO16AUD", u16 version, 6 bytes reserved
+    records  u32 payload_length, u32 crc32(payload), payload
+
+    payload  u16 vector_id length, u16 plugin_count, u32 seal_inputs length,
+             vector_id (UTF‑8), plugin_count × u8 status code
+             (canonical plugin order), seal_inputs, 32 bytes tetra_seal
+
+Index file:
+
+    header   magic "ISO16AIX", u16 version, 6 bytes reserved,
+             u64 count, u64 timestamp_min, u64 timestamp_max,
+             u64 bloom_bytes
+    seals    count × (32 bytes tetra_seal, u64 offset), sorted
+    ids      count × (u64 BLAKE2b‑64 of vector_id, u64 offset), sorted
+    times    count × (u64 timestamp, u64 offset), sorted
+    blooms   bloom_bytes of seal filter, bloom_bytes of vector_id filter
+
+Each sealed segment carries a bloom filter (10 bits per record, 7
+probes, about 1 % false positives) over the first 8 bytes of every
+tetra_seal and one over the vector_id hashes. A seal or vector_id
+lookup probes the filters and binary‑searches the memory‑mapped tables
+(O(log n)) only of the segments that may hold the key, so a lookup
+costs O(segments) bit tests plus O(log n) for the few segments that
+match; the active segment is served from in‑memory maps. Time ranges
+skip segments whose [timestamp_min, timestamp_max] does not overlap.
+The time axis is the sealed timestamp (µs since epoch, 0 when the
+vector has none). Indexes of an older version are rebuilt on open.
+
+Plugins must be keyed by their own id (utils.seal.check_plugin_ids()):
+only the id is sealed, so a record keyed otherwise could not be read
+back with the same Tetra‑Seal and is rejected by append().
+
+Crash safety:
+
+  • records are only appended; a record torn by a crash fails its
+    length/CRC check and is truncated when the store is reopened
+  • rollover fsyncs the full segment, writes its index to a temporary
+    file, fsyncs and renames it into place, and only then creates the
+    next segment; a segment found without a valid index is re‑indexed
+    by scanning it on open
+  • durable=True additionally fsyncs after every append
+
+This module is INFORMATIVE. Running it from conformance/runner as
+
+    python3 -m utils.audit_store STORE_DIR --seal HEX | --vector-id ID |
+        --from T0 --to T1 | --import records.jsonl | --stats
+
+queries or fills a store from the command line.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+from utils.seal import SEAL_PREFIX, CanonicalSerializer, canonical_deserialize, check_plugin_ids
+from utils.vector_pack import STATUS_CODES, STATUS_NAMES
+
+SEGMENT_MAGIC = b"ISO16AUD"
+INDEX_MAGIC   = b"ISO16AIX"
+VERSION       = 1
+INDEX_VERSION = 2
+
+DEFAULT_MAX_SEGMENT_BYTES = 256 * 1024 * 1024
+
+_SEG_HEADER   = struct.Struct("<8sH6x")
+_FRAME        = struct.Struct("<II")      # payload length, crc32
+_PAYLOAD      = struct.Struct("<HHI")     # vector_id length, plugin count, seal_inputs length
+_INDEX_HEADER = struct.Struct("<8sH6xQQQQ")
+_SEAL_ENTRY   = struct.Struct("<32sQ")
+_KEY_ENTRY    = struct.Struct("<QQ")      # id hash or timestamp, offset
+_TIMESTAMP    = struct.Struct(">Q")       # sealed timestamp, 24 bytes from the end
+
+SEAL_SIZE = 32
+
+_BLOOM_BITS_PER_KEY = 10
+_BLOOM_PROBES       = 7
+
+
+def _id_hash(vector_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(vector_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _seal_key(seal: bytes) -> int:
+    return int.from_bytes(seal[:8], "little")
+
+
+def _fsync_dir(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# ------------------------------------------------------------
+# Record encoding
+# ------------------------------------------------------------
+
+def encode_record(vector_id: str, statuses, seal_inputs: bytes, tetra_seal: bytes) -> bytes:
+    """
+    Framed record: [length][crc32][payload].
+    """
+    vid = vector_id.encode("utf-8")
+    payload = b"".join((
+        _PAYLOAD.pack(len(vid), len(statuses), len(seal_inputs)),
+        vid,
+        bytes(STATUS_CODES[s] for s in statuses),
+        seal_inputs,
+        tetra_seal,
+    ))
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _payload_keys(payload):
+    """
+    (vector_id, tetra_seal, timestamp) without decoding the record.
+    """
+    vid_len, count, size = _PAYLOAD.unpack_from(payload, 0)
+    start = _PAYLOAD.size + vid_len + count
+    vector_id = bytes(payload[_PAYLOAD.size:_PAYLOAD.size + vid_len]).decode("utf-8")
+    timestamp = _TIMESTAMP.unpack_from(payload, start + size - 24)[0]
+    return vector_id, bytes(payload[start + size:start + size + SEAL_SIZE]), timestamp
+
+
+def decode_record(payload) -> dict:
+    """
+    Flat audit record (the iso16_decision.audit_record() / verify_seals.py
+    layout) plus seal_inputs as hex.
+    """
+    vid_len, count, size = _PAYLOAD.unpack_from(payload, 0)
+    off = _PAYLOAD.size
+    vector_id = bytes(payload[off:off + vid_len]).decode("utf-8")
+    off += vid_len
+    statuses = [STATUS_NAMES[c] for c in payload[off:off + count]]
+    off += count
+    seal_inputs = bytes(payload[off:off + size])
+    tetra_seal = bytes(payload[off + size:off + size + SEAL_SIZE])
+
+    vector, actual = canonical_deserialize(seal_inputs, count)
+    for p, status in zip(vector["plugins"].values(), statuses):
+        p["status"] = status
+
+    record = {"vector_id": vector_id}
+    record.update(vector)
+    record.update(actual)
+    record["seal_inputs"] = seal_inputs.hex()
+    record["tetra_seal"] = tetra_seal.hex()
+    return record
+
+
+def _scan(buf, start: int, end: int):
+    """
+    Walk framed records in buf[start:end]. Returns the index entries
+    [(offset, seal, id_hash, timestamp)] and the end of the last intact
+    record.
+    """
+    entries = []
+    off = start
+    while off + _FRAME.size <= end:
+        length, crc = _FRAME.unpack_from(buf, off)
+        body = off + _FRAME.size
+        if body + length > end or length < _PAYLOAD.size:
+            break
+        payload = memoryview(buf)[body:body + length]
+        if zlib.crc32(payload) != crc:
+            break
+        vector_id, seal, timestamp = _payload_keys(payload)
+        entries.append((off, seal, _id_hash(vector_id), timestamp))
+        off = body + length
+    return entries, off
+
+
+# ------------------------------------------------------------
+# Sidecar index
+# ------------------------------------------------------------
+
+def _bloom_size(count: int) -> int:
+    return max(8, (count * _BLOOM_BITS_PER_KEY + 7) // 8)
+
+
+def _bloom_bits(key: int, nbits: int):
+    """
+    Probe positions of a 64‑bit key (double hashing on its two halves).
+    """
+    h1 = key & 0xFFFFFFFF
+    h2 = (key >> 32) | 1
+    return [(h1 + i * h2) % nbits for i in range(_BLOOM_PROBES)]
+
+
+def _bloom(keys, nbytes: int) -> bytearray:
+    bits = bytearray(nbytes)
+    nbits = nbytes * 8
+    for key in keys:
+        for b in _bloom_bits(key, nbits):
+            bits[b >> 3] |= 1 << (b & 7)
+    return bits
+
+
+def _write_index(path: Path, entries) -> None:
+    """
+    Write the index atomically: temporary file, fsync, rename.
+    """
+    times = sorted((ts, off) for off, _, _, ts in entries)
+    bloom_bytes = _bloom_size(len(entries))
+    header = _INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(entries),
+                                times[0][0] if times else 0,
+                                times[-1][0] if times else 0,
+                                bloom_bytes)
+    tmp = path.with_suffix(".idx.tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(b"".join(_SEAL_ENTRY.pack(seal, off)
+                         for seal, off in sorted((seal, off) for off, seal, _, _ in entries)))
+        f.write(b"".join(_KEY_ENTRY.pack(h, off)
+                         for h, off in sorted((h, off) for off, _, h, _ in entries)))
+        f.write(b"".join(_KEY_ENTRY.pack(ts, off) for ts, off in times))
+        f.write(_bloom((_seal_key(seal) for _, seal, _, _ in entries), bloom_bytes))
+        f.write(_bloom((h for _, _, h, _ in entries), bloom_bytes))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+
+
+def _lower_bound(buf, base: int, count: int, entry: struct.Struct, key) -> int:
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if entry.unpack_from(buf, base + mid * entry.size)[0] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class _SealedSegment:
+    """
+    Read‑only, memory‑mapped segment with its index.
+    """
+
+    def __init__(self, log_path: Path, idx_path: Path):
+        self.log = _map(log_path)
+        self.idx = _map(idx_path)
+        if len(self.idx) < _INDEX_HEADER.size:
+            raise ValueError(f"{idx_path}: invalid audit index")
+        (magic, version, self.count, self.ts_min, self.ts_max,
+         self._bloom_bytes) = _INDEX_HEADER.unpack_from(self.idx, 0)
+        self._seals = _INDEX_HEADER.size
+        self._ids = self._seals + self.count * _SEAL_ENTRY.size
+        self._times = self._ids + self.count * _KEY_ENTRY.size
+        self._seal_bloom = self._times + self.count * _KEY_ENTRY.size
+        self._id_bloom = self._seal_bloom + self._bloom_bytes
+        expected = self._id_bloom + self._bloom_bytes
+        if (magic != INDEX_MAGIC or version != INDEX_VERSION or self._bloom_bytes == 0
+                or len(self.idx) != expected):
+            raise ValueError(f"{idx_path}: invalid audit index")
+        self._bloom_nbits = self._bloom_bytes * 8
+
+    def read(self, off: int) -> dict:
+        length, crc = _FRAME.unpack_from(self.log, off)
+        payload = memoryview(self.log)[off + _FRAME.size:off + _FRAME.size + length]
+        if zlib.crc32(payload) != crc:
+            raise ValueError(f"Corrupt audit record at offset {off}")
+        return decode_record(payload)
+
+    def _may_contain(self, base: int, key: int) -> bool:
+        idx = self.idx
+        for b in _bloom_bits(key, self._bloom_nbits):
+            if not idx[base + (b >> 3)] & (1 << (b & 7)):
+                return False
+        return True
+
+    def find_seal(self, seal: bytes):
+        if not self._may_contain(self._seal_bloom, _seal_key(seal)):
+            return None
+        i = _lower_bound(self.idx, self._seals, self.count, _SEAL_ENTRY, seal)
+        if i < self.count:
+            found, off = _SEAL_ENTRY.unpack_from(self.idx, self._seals + i * _SEAL_ENTRY.size)
+            if found == seal:
+                return off
+        return None
+
+    def _find_keys(self, base: int, lo_key: int, hi_key: int) -> list:
+        """
+        Offsets of entries with lo_key <= key < hi_key, in append order.
+        """
+        i = _lower_bound(self.idx, base, self.count, _KEY_ENTRY, lo_key)
+        offsets = []
+        while i < self.count:
+            key, off = _KEY_ENTRY.unpack_from(self.idx, base + i * _KEY_ENTRY.size)
+            if key >= hi_key:
+                break
+            offsets.append(off)
+            i += 1
+        return sorted(offsets)
+
+    def find_id(self, h: int) -> list:
+        if not self._may_contain(self._id_bloom, h):
+            return []
+        return self._find_keys(self._ids, h, h + 1)
+
+    def find_range(self, t0: int, t1: int) -> list:
+        if t1 <= self.ts_min or t0 > self.ts_max:
+            return []
+        return self._find_keys(self._times, t0, t1)
+
+    def offsets(self) -> list:
+        return self._find_keys(self._times, 0, 1 << 64)
+
+
+def _outdated_index(path: Path) -> bool:
+    """
+    True if `path` is a complete index of an older INDEX_VERSION.
+    """
+    try:
+        with path.open("rb") as f:
+            head = f.read(10)
+    except OSError:
+        return False
+    return (len(head) == 10 and head[:8] == INDEX_MAGIC
+            and struct.unpack("<H", head[8:])[0] < INDEX_VERSION)
+
+
+def _map(path: Path):
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# ------------------------------------------------------------
+# Store
+# ------------------------------------------------------------
+
+class AuditStore:
+    """
+    Append‑only audit record store rooted at `store_dir`. Not thread
+    safe; one writer per directory.
+    """
+
+    def __init__(self, store_dir, max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+                 durable: bool = False):
+        self.dir = Path(store_dir)
+        self.max_segment_bytes = max_segment_bytes
+        self.durable = durable
+        self._serializer = CanonicalSerializer()
+        self._sealed = []   # [(segment number, _SealedSegment)]
+        self._file = None
+        self._open()
+
+    # --------------------------------------------------------
+    # Opening and recovery
+    # --------------------------------------------------------
+
+    def _log_path(self, n: int) -> Path:
+        return self.dir / f"seg-{n:08d}.log"
+
+    def _open(self) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        for tmp in self.dir.glob("seg-*.idx.tmp"):
+            tmp.unlink()
+        numbers = sorted(int(p.stem[4:]) for p in self.dir.glob("seg-*.log"))
+
+        for n in numbers[:-1]:
+            self._sealed.append((n, self._load_sealed(n, rebuild=True)))
+
+        if numbers:
+            last = numbers[-1]
+            try:
+                self._sealed.append((last, self._load_sealed(last, rebuild=False)))
+            except (OSError, ValueError):
+                self._resume_active(last)
+                return
+            self._start_active(last + 1)
+        else:
+            self._start_active(0)
+
+    def _load_sealed(self, n: int, rebuild: bool) -> _SealedSegment:
+        log_path = self._log_path(n)
+        idx_path = log_path.with_suffix(".idx")
+        try:
+            return _SealedSegment(log_path, idx_path)
+        except (OSError, ValueError):
+            if not (rebuild or _outdated_index(idx_path)):
+                raise
+        # Sealed segment without a usable index (crash during rollover,
+        # or an index written by an older version)
+        entries, end = self._recover(log_path)
+        _write_index(idx_path, entries)
+        return _SealedSegment(log_path, idx_path)
+
+    def _recover(self, log_path: Path):
+        """
+        Scan a segment, truncating any torn tail; returns (entries, end).
+        """
+        data = log_path.read_bytes()
+        if len(data) < _SEG_HEADER.size or _SEG_HEADER.unpack_from(data)[0] != SEGMENT_MAGIC:
+            # Crash while the segment was being created
+            with log_path.open("wb") as f:
+                f.write(_SEG_HEADER.pack(SEGMENT_MAGIC, VERSION))
+                f.flush()
+                os.fsync(f.fileno())
+            return [], _SEG_HEADER.size
+        entries, end = _scan(data, _SEG_HEADER.size, len(data))
+        if end != len(data):
+            with log_path.open("r+b") as f:
+                f.truncate(end)
+                f.flush()
+                os.fsync(f.fileno())
+        return entries, end
+
+    def _start_active(self, n: int) -> None:
+        path = self._log_path(n)
+        with path.open("wb") as f:
+            f.write(_SEG_HEADER.pack(SEGMENT_MAGIC, VERSION))
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_dir(self.dir)
+        self._activate(n, [], _SEG_HEADER.size)
+
+    def _resume_active(self, n: int) -> None:
+        entries, end = self._recover(self._log_path(n))
+        self._activate(n, entries, end)
+
+    def _activate(self, n: int, entries, size: int) -> None:
+        self._active_n = n
+        self._active_size = size
+        self._entries = []
+        self._by_seal = {}
+        self._by_id = {}
+        for entry in entries:
+            self._index_active(entry)
+        self._file = self._log_path(n).open("a+b")
+
+    def _index_active(self, entry) -> None:
+        off, seal, h, _ = entry
+        self._entries.append(entry)
+        self._by_seal.setdefault(seal, off)
+        self._by_id.setdefault(h, []).append(off)
+
+    # --------------------------------------------------------
+    # Writing
+    # --------------------------------------------------------
+
+    def append(self, vector: dict, actual: dict = None, tetra_seal=None) -> str:
+        """
+        Append one audit record and return its Tetra‑Seal (hex).
+
+        With `actual` omitted, `vector` is a flat audit record
+        (iso16_decision.audit_record()) holding both the vector fields and
+        the outputs. `tetra_seal` (or the record's own tetra_seal) is
+        stored as recorded; when absent it is computed. Raises ValueError
+        if a plugin is not keyed by its own id.
+        """
+        if actual is None:
+            actual = vector
+            if tetra_seal is None:
+                tetra_seal = vector.get("tetra_seal")
+
+        check_plugin_ids(vector["plugins"])
+        seal_inputs = self._serializer.serialize(vector, actual)
+        if tetra_seal is None:
+            seal = hashlib.sha3_256(SEAL_PREFIX + seal_inputs).digest()
+        elif isinstance(tetra_seal, str):
+            seal = bytes.fromhex(tetra_seal)
+        else:
+            seal = bytes(tetra_seal)
+        if len(seal) != SEAL_SIZE:
+            raise ValueError("tetra_seal must be 32 bytes")
+
+        plugins = vector["plugins"]
+        statuses = [plugins[pid]["status"] for pid in sorted(plugins)]
+        vector_id = vector.get("vector_id") or ""
+        record = encode_record(vector_id, statuses, seal_inputs, seal)
+
+        if self._entries and self._active_size + len(record) > self.max_segment_bytes:
+            self.rollover()
+
+        off = self._active_size
+        self._file.write(record)
+        self._active_size += len(record)
+        if self.durable:
+            self.flush(sync=True)
+        timestamp = _TIMESTAMP.unpack_from(seal_inputs, len(seal_inputs) - 24)[0]
+        self._index_active((off, seal, _id_hash(vector_id), timestamp))
+        return seal.hex()
+
+    def flush(self, sync: bool = False) -> None:
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def rollover(self) -> None:
+        """
+        Seal the active segment (fsync, index) and start the next one.
+        """
+        self.flush(sync=True)
+        self._file.close()
+        n = self._active_n
+        log_path = self._log_path(n)
+        _write_index(log_path.with_suffix(".idx"), self._entries)
+        self._sealed.append((n, _SealedSegment(log_path, log_path.with_suffix(".idx"))))
+        self._start_active(n + 1)
+
+    def close(self) -> None:
+        if self._file is not None and not self._file.closed:
+            self.flush(sync=True)
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --------------------------------------------------------
+    # Reading
+    # --------------------------------------------------------
+
+    def _read_active(self, off: int) -> dict:
+        self._file.flush()
+        fd = self._file.fileno()
+        length, crc = _FRAME.unpack(os.pread(fd, _FRAME.size, off))
+        payload = os.pread(fd, length, off + _FRAME.size)
+        if zlib.crc32(payload) != crc:
+            raise ValueError(f"Corrupt audit record at offset {off}")
+        return decode_record(payload)
+
+    def get_by_seal(self, tetra_seal):
+        """
+        The record with this Tetra‑Seal (hex or raw), or None.
+        """
+        seal = bytes.fromhex(tetra_seal) if isinstance(tetra_seal, str) else bytes(tetra_seal)
+        for _, segment in self._sealed:
+            off = segment.find_seal(seal)
+            if off is not None:
+                return segment.read(off)
+        off = self._by_seal.get(seal)
+        return self._read_active(off) if off is not None else None
+
+    def get_by_vector_id(self, vector_id: str) -> list:
+        """
+        Every record of `vector_id`, in append order.
+        """
+        h = _id_hash(vector_id)
+        records = [segment.read(off) for _, segment in self._sealed for off in segment.find_id(h)]
+        records += [self._read_active(off) for off in self._by_id.get(h, ())]
+        return [r for r in records if r["vector_id"] == vector_id]
+
+    def range(self, t0: int, t1: int):
+        """
+        Yield records with t0 <= timestamp < t1, in append order.
+        """
+        for _, segment in self._sealed:
+            for off in segment.find_range(t0, t1):
+                yield segment.read(off)
+        for off, _, _, ts in list(self._entries):
+            if t0 <= ts < t1:
+                yield self._read_active(off)
+
+    def __iter__(self):
+        for _, segment in self._sealed:
+            for off in segment.offsets():
+                yield segment.read(off)
+        for off, _, _, _ in list(self._entries):
+            yield self._read_active(off)
+
+    def __len__(self):
+        return sum(segment.count for _, segment in self._sealed) + len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "records": len(self),
+            "sealed_segments": len(self._sealed),
+            "active_segment": self._active_n,
+            "active_bytes": self._active_size,
+        }
+
+
+# ------------------------------------------------------------
+# CLI (informative)
+# ------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Audit Record Store")
+    parser.add_argument("store", help="Store directory.")
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument("--seal", help="Fetch the record with this Tetra-Seal.")
+    query.add_argument("--vector-id", help="Fetch every record of this vector_id.")
+    query.add_argument("--from", dest="t0", type=int, help="Fetch records with timestamp >= T0 (µs).")
+    query.add_argument("--import", dest="source", help="Append flat audit records from a JSON Lines file.")
+    query.add_argument("--stats", action="store_true", help="Print record and segment counts.")
+    parser.add_argument("--to", dest="t1", type=int, default=1 << 64, help="With --from: timestamp < T1 (µs).")
+    args = parser.parse_args()
+
+    with AuditStore(args.store) as store:
+        if args.seal:
+            records = [r for r in [store.get_by_seal(args.seal)] if r is not None]
+        elif args.vector_id:
+            records = store.get_by_vector_id(args.vector_id)
+        elif args.t0 is not None:
+            records = store.range(args.t0, args.t1)
+        elif args.source:
+            n = 0
+            with open(args.source) as f:
+                for line in f:
+                    if line.strip():
+                        store.append(json.loads(line))
+                        n += 1
+            print(f"[*] Appended {n:,} records", file=sys.stderr)
+            records = []
+        else:
+            print(json.dumps(store.stats()))
+            records = []
+
+        found = 0
+        for record in records:
+            print(json.dumps(record, separators=(",", ":")))
+            found += 1
+        if not (args.source or args.stats):
+            print(f"[*] {found} record(s)", file=sys.stderr)
+            if not found:
+                raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
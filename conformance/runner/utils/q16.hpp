@@ -62,6 +62,16 @@ inline bool leq(q16 a, q16 b) {
     return a <= b;
 }
 
+inline q16 mul(q16 a, q16 b) {
+    // 64‑bit product, arithmetic shift (rounds toward negative infinity)
+    return to_int32((static_cast<int64_t>(a) * static_cast<int64_t>(b)) >> 16);
+}
+
+inline q16 norm2(q16 x, q16 y, q16 z) {
+    // Squared norm: §3.3 surrogate metric
+    return add(add(mul(x, x), mul(y, y)), mul(z, z));
+}
+
 // ------------------------------------------------------------
 // Optional helpers (informative only)
 // ------------------------------------------------------------
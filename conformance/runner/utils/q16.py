@@ -12,6 +12,7 @@ This module provides minimal, deterministic helpers for:
     - subtraction
     - absolute value
     - comparison (<=)
+    - multiplication and squared norm (§3.3 surrogate metric)
     - conversion helpers (optional, informative)
 
 No floating‑point operations appear anywhere in this file.
@@ -22,6 +23,9 @@ INT32_MASK = 0xFFFFFFFF
 INT32_MAX  = 0x7FFFFFFF
 INT32_MIN  = -0x80000000
 
+# Canonical epsilon (iso16_core.md §2.2): 2^-16 in Q16.16
+EPSILON    = 0x00000001
+
 
 def _to_int32(value: int) -> int:
     """
@@ -69,6 +73,26 @@ def q16_leq(a: int, b: int) -> bool:
     return a <= b
 
 
+def q16_mul(a: int, b: int) -> int:
+    """
+    Deterministic Q16.16 multiplication: the 64‑bit product shifted right
+    by 16 (rounding toward negative infinity), wrapped to 32 bits.
+    """
+    return _to_int32((a * b) >> 16)
+
+
+def q16_norm2(v) -> int:
+    """
+    Squared Euclidean norm of a Q16.16 vector, x² + y² + z², as the
+    wraparound sum of q16_mul(c, c). Monotone surrogate for the distance
+    metric of iso16_core.md §3.3 while it does not overflow.
+    """
+    total = 0
+    for c in v:
+        total = q16_add(total, q16_mul(c, c))
+    return total
+
+
 # ------------------------------------------------------------
 # Optional helpers (informative)
 # ------------------------------------------------------------
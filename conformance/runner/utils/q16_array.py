@@ -0,0 +1,120 @@
+"""
+Vectorized Q16.16 Arithmetic (NumPy)
+------------------------------------
+
+Array counterpart of utils/q16.py for PhaseState‑, plugin‑ and
+batch‑scale computations. Every function works element‑wise (with NumPy
+broadcasting) on int32 or int64 buffers and returns int32 results that
+are bit‑identical to the scalar functions:
+
+    - q16_add, q16_sub         ↔ q16.q16_add, q16.q16_sub
+    - q16_abs                  ↔ q16.q16_abs (INT32_MIN clamped)
+    - q16_leq                  ↔ q16.q16_leq
+    - q16_mul                  ↔ q16.q16_mul
+    - q16_norm2                ↔ q16.q16_norm2 (§3.3 surrogate metric)
+    - q16_sum                  ↔ repeated q16.q16_add
+
+Inputs outside the int32 range (int64 buffers) are first wrapped to
+int32, as q16._to_int32 does. With saturate=True, add/sub/mul/norm2/sum
+clamp the exact result to [INT32_MIN, INT32_MAX] instead of wrapping;
+q16_sum and q16_norm2 then clamp the exact total, not each partial sum.
+
+Intermediate results are computed in int64, which holds every product
+and any sum of fewer than 2^32 int32 terms exactly.
+
+This module is INFORMATIVE. Its equivalence with utils/q16.py is
+checked by tests/test_q16_array.py (python3 -m pytest tests).
+"""
+
+import numpy as np
+
+from utils.q16 import INT32_MAX, INT32_MIN
+
+
+# ------------------------------------------------------------
+# Conversion
+# ------------------------------------------------------------
+
+def as_q16(a) -> np.ndarray:
+    """
+    Convert to an int32 array, wrapping values outside the int32 range.
+    int32 input is returned without copying.
+    """
+    a = np.asarray(a)
+    if a.dtype == np.int32:
+        return a
+    return np.asarray(a, dtype=np.int64).astype(np.int32)
+
+
+def _wide(a) -> np.ndarray:
+    return as_q16(a).astype(np.int64)
+
+
+def _finish(exact, saturate: bool) -> np.ndarray:
+    """
+    Reduce an exact int64 result to int32 by wrapping or saturating.
+    """
+    if saturate:
+        return np.clip(exact, INT32_MIN, INT32_MAX).astype(np.int32)
+    return exact.astype(np.int32)
+
+
+# ------------------------------------------------------------
+# Core Q16.16 operations
+# ------------------------------------------------------------
+
+def q16_add(a, b, saturate: bool = False) -> np.ndarray:
+    return _finish(_wide(a) + _wide(b), saturate)
+
+
+def q16_sub(a, b, saturate: bool = False) -> np.ndarray:
+    return _finish(_wide(a) - _wide(b), saturate)
+
+
+def q16_abs(a) -> np.ndarray:
+    """
+    |a| with INT32_MIN clamped to INT32_MAX.
+    """
+    a = as_q16(a)
+    return np.where(a == INT32_MIN, np.int32(INT32_MAX), np.abs(a)).astype(np.int32)
+
+
+def q16_leq(a, b) -> np.ndarray:
+    return as_q16(a) <= as_q16(b)
+
+
+def q16_mul(a, b, saturate: bool = False) -> np.ndarray:
+    """
+    Q16.16 product: (a * b) >> 16, rounding toward negative infinity.
+    """
+    return _finish((_wide(a) * _wide(b)) >> 16, saturate)
+
+
+def q16_sum(a, axis=None, saturate: bool = False) -> np.ndarray:
+    """
+    Sum along `axis` with int32 wraparound (or saturation of the exact
+    total).
+    """
+    return _finish(np.sum(_wide(a), axis=axis), saturate)
+
+
+def q16_norm2(v, axis: int = -1, saturate: bool = False) -> np.ndarray:
+    """
+    Squared Euclidean norm along `axis` (x² + y² + z² for 3‑vectors),
+    the monotone surrogate metric of iso16_core.md §3.3.
+    """
+    w = _wide(v)
+    return _finish(np.sum((w * w) >> 16, axis=axis), saturate)
+
+
+# ------------------------------------------------------------
+# PhaseState helpers
+# ------------------------------------------------------------
+
+def adjacent_deltas(phases) -> np.ndarray:
+    """
+    phase[i] - phase[i+1] for i in [0, 14] along the phase axis
+    (…×16×3 → …×15×3), with wraparound.
+    """
+    p = as_q16(phases)
+    return q16_sub(p[..., :-1, :], p[..., 1:, :])
@@ -0,0 +1,132 @@
+"""
+Content‑Addressed Result Cache for ISO‑16 Conformance Runs
+----------------------------------------------------------
+
+Stores per‑vector conformance results on disk, keyed by:
+
+    SHA‑256( code_fingerprint || vector file bytes )
+
+where the code fingerprint covers every source file that can change a
+result (reference runner, seal serializer, Q16.16 arithmetic). Editing a
+vector or any fingerprinted file therefore produces a new key, and stale
+entries simply stop being referenced until eviction removes them.
+
+Layout:
+
+    <cache_dir>/<key[:2]>/<key>.json
+
+Eviction is size‑bounded and least‑recently‑used: entries are touched on
+every hit, and prune() removes the oldest entries until the cache fits
+within max_bytes.
+
+This module is INFORMATIVE. Cached results are only ever reused for
+byte‑identical inputs under byte‑identical code.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def code_fingerprint(paths) -> str:
+    """
+    Hash the contents of the given source files, in the given order.
+    """
+    h = hashlib.sha256()
+    for p in paths:
+        data = Path(p).read_bytes()
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, cache_dir, fingerprint: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = bytes.fromhex(fingerprint)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, vector_bytes: bytes) -> str:
+        """
+        Content address for a vector under the current code fingerprint.
+        """
+        h = hashlib.sha256(self.fingerprint)
+        h.update(vector_bytes)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str):
+        """
+        Return the cached result for `key`, or None on a miss.
+        """
+        p = self._path(key)
+        try:
+            with p.open("r") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            # Missing or truncated entry: treat as a miss.
+            self.misses += 1
+            return None
+
+        # Mark as recently used for LRU eviction.
+        try:
+            os.utime(p)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        """
+        Store `value` under `key`. The write is atomic, so concurrent
+        readers never observe a partial entry.
+        """
+        p = self._path(key)
+        p.parent.mkdir(exist_ok=True)
+
+        tmp = p.with_name(f"{p.name}.{os.getpid()}.tmp")
+        with tmp.open("w") as f:
+            json.dump(value, f)
+        os.replace(tmp, p)
+
+    def prune(self) -> int:
+        """
+        Evict least‑recently‑used entries until the cache fits within
+        max_bytes. Returns the number of entries removed.
+        """
+        entries = []
+        total = 0
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -9,16 +9,27 @@ Validates JSON documents against the canonical schemas:
 
 This module is INFORMATIVE. It exists to keep the reference runner
 honest and to give vendors/auditors a clear validation path.
+
+Fast path: documents for the two canonical schemas are first run
+through a hand‑specialized structural checker for their fixed shapes
+(16×3 PhaseState, 3‑element warp vectors, enums, required keys). A
+document it accepts is valid; anything it does not accept is passed to
+the full, cached Draft7Validator, which decides and produces the
+diagnostics. The checkers only ever accept a subset of what the schemas
+accept, and must be kept in step with them.
 """
 
 import json
+import re
 from pathlib import Path
 
 from jsonschema import Draft7Validator
 
 
-# Simple in‑memory cache so we don’t re‑parse schemas repeatedly
+# Simple in‑memory caches so we don’t re‑parse schemas or rebuild
+# validators repeatedly
 _SCHEMA_CACHE = {}
+_VALIDATOR_CACHE = {}
 
 
 def _load_schema(schema_path: str) -> dict:
@@ -38,15 +49,118 @@ def _load_schema(schema_path: str) -> dict:
     return schema
 
 
-def validate_json(data: dict, schema_path: str) -> None:
+def get_validator(schema_path: str) -> Draft7Validator:
+    """
+    Return the compiled (cached) Draft7Validator for a schema file.
+    """
+    p = Path(schema_path).resolve()
+    validator = _VALIDATOR_CACHE.get(p)
+    if validator is None:
+        validator = _VALIDATOR_CACHE[p] = Draft7Validator(_load_schema(p))
+    return validator
+
+
+# ------------------------------------------------------------
+# Structural fast path
+# ------------------------------------------------------------
+
+_DOMAINS  = frozenset(("Refraction", "FrameDrag", "Jitter", "Custom"))
+_STATUSES = frozenset(("OK", "INSUFFICIENT_DATA", "OUT_OF_RANGE", "TIMEOUT", "SENSOR_MISMATCH"))
+_PLUGIN_KEYS = ("id", "domain", "warp_vector", "error", "version", "status")
+_EXPECTED_KEYS = ("vector_id", "warp_total", "error_total", "phase_state_warped",
+                  "symmetry_ok", "error_ok", "true_delivery", "tetra_seal")
+_SEAL_HEX = re.compile(r"[a-f0-9]{64}")
+
+
+def _is_ints(value, n: int) -> bool:
+    return (type(value) is list and len(value) == n and
+            all(type(c) is int for c in value))
+
+
+def _is_phase_state(value) -> bool:
+    return (type(value) is list and len(value) == 16 and
+            all(_is_ints(phase, 3) for phase in value))
+
+
+def _check_vector(data) -> bool:
+    if type(data) is not dict:
+        return False
+    if type(data.get("vector_id")) is not str:
+        return False
+    if "description" in data and type(data["description"]) is not str:
+        return False
+    if not _is_phase_state(data.get("initial_phase_state")):
+        return False
+
+    plugins = data.get("plugins")
+    if type(plugins) is not dict or not plugins:
+        return False
+    for p in plugins.values():
+        if type(p) is not dict or not all(k in p for k in _PLUGIN_KEYS):
+            return False
+        if (type(p["id"]) is not str or type(p["version"]) is not str or
+                type(p["domain"]) is not str or p["domain"] not in _DOMAINS or
+                type(p["status"]) is not str or p["status"] not in _STATUSES or
+                not _is_ints(p["warp_vector"], 3) or type(p["error"]) is not int):
+            return False
+    return True
+
+
+def _check_expected(data) -> bool:
+    if type(data) is not dict or not all(k in data for k in _EXPECTED_KEYS):
+        return False
+    return (type(data["vector_id"]) is str and
+            _is_ints(data["warp_total"], 3) and
+            type(data["error_total"]) is int and
+            _is_phase_state(data["phase_state_warped"]) and
+            type(data["symmetry_ok"]) is bool and
+            type(data["error_ok"]) is bool and
+            type(data["true_delivery"]) is bool and
+            type(data["tetra_seal"]) is str and
+            _SEAL_HEX.fullmatch(data["tetra_seal"]) is not None)
+
+
+# Keyed by schema title
+_FAST_CHECKS = {
+    "ISO-16 Conformance Vector Schema": _check_vector,
+    "ISO-16 Expected Output Schema":    _check_expected,
+}
+
+# schema_path as given → fast checker (or None), so the hot path does
+# not resolve the path on every call
+_FAST_CHECK_CACHE = {}
+
+
+def _fast_check(schema_path):
+    try:
+        return _FAST_CHECK_CACHE[schema_path]
+    except KeyError:
+        check = _FAST_CHECKS.get(_load_schema(schema_path).get("title"))
+        _FAST_CHECK_CACHE[schema_path] = check
+        return check
+
+
+# ------------------------------------------------------------
+# Validation
+# ------------------------------------------------------------
+
+def validate_json(data: dict, schema_path: str, fail_fast: bool = False) -> None:
     """
     Validate `data` against the JSON Schema at `schema_path`.
 
-    Raises jsonschema.ValidationError on failure.
+    Raises ValueError on failure, listing every error, or only the first
+    one found with fail_fast=True.
     """
-    schema = _load_schema(schema_path)
-    validator = Draft7Validator(schema)
-    errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
+    fast_check = _fast_check(schema_path)
+    if fast_check is not None and fast_check(data):
+        return
+
+    validator = get_validator(schema_path)
+    if fail_fast:
+        first = next(validator.iter_errors(data), None)
+        errors = [] if first is None else [first]
+    else:
+        errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
 
     if errors:
         # Build a concise, high‑signal error message
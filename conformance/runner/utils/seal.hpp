@@ -1,6 +1,7 @@
 #ifndef ISO16_SEAL_HPP
 #define ISO16_SEAL_HPP
 
+#include <array>
 #include <cstdint>
 #include <vector>
 #include <string>
@@ -13,12 +14,15 @@
 //
 //     std::vector<uint8_t> sha3_256(const uint8_t* data, size_t len);
 //
-// This header assumes such a function exists.
+// This header assumes such a function exists; utils/seal.cpp provides
+// the reference one, declared below.
 
 namespace iso16 {
 
 using q16 = int32_t;
 
+std::vector<uint8_t> sha3_256(const uint8_t* data, size_t len);
+
 // ------------------------------------------------------------
 // Encoding helpers
 // ------------------------------------------------------------
@@ -20,6 +20,8 @@ Responsibilities:
 import hashlib
 import struct
 import json
+import threading
+from itertools import chain
 
 
 # ------------------------------------------------------------
@@ -58,6 +60,17 @@ def _encode_length_prefixed_string(s: str) -> bytes:
     return bytes([len(b)]) + b
 
 
+def _nonce_bytes(nonce) -> bytes:
+    """
+    Accept a nonce as 16 raw bytes or 32 hex characters.
+    """
+    if isinstance(nonce, str):
+        nonce = bytes.fromhex(nonce)
+    if len(nonce) != 16:
+        raise ValueError("Nonce must be 16 bytes")
+    return nonce
+
+
 # ------------------------------------------------------------
 # Canonical Serialization
 # ------------------------------------------------------------
@@ -168,6 +181,363 @@ def canonical_serialize(vector: dict, actual: dict) -> bytes:
     return bytes(out)
 
 
+# ------------------------------------------------------------
+# Precompiled Canonical Serializer
+# ------------------------------------------------------------
+
+_DOMAIN_CODES = {
+    "Refraction": 0x01,
+    "FrameDrag":  0x02,
+    "Jitter":     0x03,
+}
+
+# Fixed‑width sections of the canonical layout
+_PHASE_STATE = struct.Struct(">48i")     # 16×3 Q16.16
+_TOTALS      = struct.Struct(">4i")      # warp_total x/y/z + error_total
+_FLAGS       = struct.Struct(">3B")      # symmetry_ok, error_ok, true_delivery
+_TAIL        = struct.Struct(">Q16s")    # timestamp + nonce
+
+# Domain‑separation prefix (iso16_seal.md §5.3)
+SEAL_PREFIX = b"ISO16-SEAL-V1:"
+
+# Cached plugin layouts are bounded so long‑running processes that see
+# many distinct plugin sets do not grow without limit.
+_MAX_CACHED_LAYOUTS = 4096
+
+
+class _PluginLayout:
+    """
+    Precompiled layout of the plugin_outputs section for one plugin set:
+    the canonical (sorted) order, the constant id/domain/version bytes of
+    each plugin, and one struct covering the whole section.
+    """
+
+    __slots__ = ("order", "statics", "struct")
+
+    def __init__(self, plugins: dict):
+        self.order = tuple(sorted(plugins.keys()))
+        self.statics = []
+        fmt = ">"
+        for pid in self.order:
+            p = plugins[pid]
+            # [id_length][id_bytes][domain_code]
+            prefix = (_encode_length_prefixed_string(p["id"]) +
+                      bytes([_DOMAIN_CODES.get(p["domain"], 0xFF)]))
+            # [version_length][version_bytes]
+            suffix = _encode_length_prefixed_string(p["version"])
+            self.statics.append((prefix, suffix))
+            fmt += f"{len(prefix)}s4i{len(suffix)}s"
+        self.struct = struct.Struct(fmt)
+
+    def pack_args(self, plugins: dict) -> list:
+        """
+        Arguments for self.struct in canonical order.
+        """
+        args = []
+        for pid, (prefix, suffix) in zip(self.order, self.statics):
+            p = plugins[pid]
+            args.append(prefix)
+            args.extend(p["warp_vector"])
+            args.append(p["error"])
+            args.append(suffix)
+        return args
+
+
+class CanonicalSerializer:
+    """
+    Byte‑identical, faster equivalent of canonical_serialize().
+
+    Every section of the seal input is packed with a single precompiled
+    struct.Struct.pack_into() call into a reusable buffer. The sorted
+    plugin order and per‑plugin id/domain/version bytes are cached per
+    plugin set.
+
+    Instances are not thread‑safe; use one serializer per thread.
+    """
+
+    def __init__(self, initial_size: int = 1024):
+        self._buf = bytearray(initial_size)
+        self._layouts = {}
+
+    def _plugin_layout(self, plugins: dict) -> _PluginLayout:
+        key = tuple((pid, p["id"], p["domain"], p["version"])
+                    for pid, p in plugins.items())
+        layout = self._layouts.get(key)
+        if layout is None:
+            if len(self._layouts) >= _MAX_CACHED_LAYOUTS:
+                self._layouts.clear()
+            layout = self._layouts[key] = _PluginLayout(plugins)
+        return layout
+
+    def serialize_into(self, vector: dict, actual: dict) -> memoryview:
+        """
+        Serialize into the internal buffer and return a view of the
+        canonical bytes. The view is only valid until the next call.
+        """
+        plugins = vector["plugins"]
+        layout = self._plugin_layout(plugins)
+        plugin_args = layout.pack_args(plugins)
+
+        impl_id = _encode_string(vector.get("implementation_id", "iso16-ref"))
+        nonce = _nonce_bytes(vector.get("nonce", bytes(16)))
+
+        size = (2 * _PHASE_STATE.size + layout.struct.size + _TOTALS.size +
+                _FLAGS.size + len(impl_id) + _TAIL.size)
+        if size > len(self._buf):
+            self._buf = bytearray(max(size, 2 * len(self._buf)))
+        buf = self._buf
+
+        # 1. phase_state_initial
+        _PHASE_STATE.pack_into(buf, 0, *chain.from_iterable(vector["initial_phase_state"]))
+        off = _PHASE_STATE.size
+
+        # 2. plugin_outputs
+        layout.struct.pack_into(buf, off, *plugin_args)
+        off += layout.struct.size
+
+        # 3–4. warp_total + error_total
+        _TOTALS.pack_into(buf, off, *actual["warp_total"], actual["error_total"])
+        off += _TOTALS.size
+
+        # 5. phase_state_warped
+        _PHASE_STATE.pack_into(buf, off, *chain.from_iterable(actual["phase_state_warped"]))
+        off += _PHASE_STATE.size
+
+        # 6–8. symmetry_ok, error_ok, true_delivery
+        _FLAGS.pack_into(buf, off,
+                         1 if actual["symmetry_ok"] else 0,
+                         1 if actual["error_ok"] else 0,
+                         1 if actual["true_delivery"] else 0)
+        off += _FLAGS.size
+
+        # 9. implementation_id
+        end = off + len(impl_id)
+        buf[off:end] = impl_id
+        off = end
+
+        # 10–11. timestamp + nonce
+        _TAIL.pack_into(buf, off, vector.get("timestamp", 0), nonce)
+        off += _TAIL.size
+
+        return memoryview(buf)[:off]
+
+    def serialize(self, vector: dict, actual: dict) -> bytes:
+        """
+        Serialize and return an independent copy of the canonical bytes.
+        """
+        return bytes(self.serialize_into(vector, actual))
+
+
+_local = threading.local()
+
+
+def _default_serializer() -> CanonicalSerializer:
+    s = getattr(_local, "serializer", None)
+    if s is None:
+        s = _local.serializer = CanonicalSerializer()
+    return s
+
+
+# ------------------------------------------------------------
+# Canonical Deserialization
+# ------------------------------------------------------------
+
+_DOMAIN_NAMES = {code: name for name, code in _DOMAIN_CODES.items()}
+
+
+def _decode_length_prefixed_string(data, off: int):
+    end = off + 1 + data[off]
+    return bytes(data[off + 1:end]).decode("utf-8"), end
+
+
+def check_plugin_ids(plugins: dict) -> None:
+    """
+    Raise ValueError unless every plugin is keyed by its own id.
+
+    The seal orders plugins by dict key but serializes p["id"], and only
+    the id survives canonical_deserialize(); a record keyed otherwise
+    would decode into a plugin set that re‑seals differently.
+    """
+    for pid, p in plugins.items():
+        if p["id"] != pid:
+            raise ValueError(f"plugin keyed {pid!r} has id {p['id']!r}")
+
+
+def canonical_deserialize(data, plugin_count: int):
+    """
+    Inverse of canonical_serialize(): split canonical bytes back into
+    (vector, actual). The plugin count is not part of the encoding and
+    must be supplied; implementation_id is everything between the flags
+    and the fixed‑width timestamp/nonce tail.
+
+    Plugins are keyed by their serialized id, so the input must come
+    from a plugin set that satisfies check_plugin_ids(); ids that are
+    not strictly increasing raise ValueError instead of decoding into a
+    different plugin set. Plugin statuses are not sealed and are absent
+    from the result. Any domain outside §4.3 decodes as "Custom"; the
+    nonce decodes as hex.
+    """
+    coords = _PHASE_STATE.unpack_from(data, 0)
+    off = _PHASE_STATE.size
+
+    plugins = {}
+    last = None
+    for _ in range(plugin_count):
+        pid, off = _decode_length_prefixed_string(data, off)
+        if last is not None and pid <= last:
+            raise ValueError(f"plugin id {pid!r} out of canonical order")
+        last = pid
+        domain = _DOMAIN_NAMES.get(data[off], "Custom")
+        x, y, z, error = _TOTALS.unpack_from(data, off + 1)
+        version, off = _decode_length_prefixed_string(data, off + 1 + _TOTALS.size)
+        plugins[pid] = {
+            "id": pid,
+            "domain": domain,
+            "warp_vector": [x, y, z],
+            "error": error,
+            "version": version,
+        }
+
+    wx, wy, wz, error_total = _TOTALS.unpack_from(data, off)
+    off += _TOTALS.size
+    warped = _PHASE_STATE.unpack_from(data, off)
+    off += _PHASE_STATE.size
+    symmetry_ok, error_ok, true_delivery = _FLAGS.unpack_from(data, off)
+    off += _FLAGS.size
+
+    tail = len(data) - _TAIL.size
+    if tail < off:
+        raise ValueError("Truncated canonical serialization")
+    timestamp, nonce = _TAIL.unpack_from(data, tail)
+
+    vector = {
+        "initial_phase_state": [list(coords[k:k + 3]) for k in range(0, 48, 3)],
+        "plugins": plugins,
+        "implementation_id": bytes(data[off:tail]).decode("utf-8"),
+        "timestamp": timestamp,
+        "nonce": nonce.hex(),
+    }
+    actual = {
+        "warp_total": [wx, wy, wz],
+        "error_total": error_total,
+        "phase_state_warped": [list(warped[k:k + 3]) for k in range(0, 48, 3)],
+        "symmetry_ok": bool(symmetry_ok),
+        "error_ok": bool(error_ok),
+        "true_delivery": bool(true_delivery),
+    }
+    return vector, actual
+
+
+# ------------------------------------------------------------
+# Streaming Seal Hasher
+# ------------------------------------------------------------
+
+# SHA3‑256 state after absorbing the domain‑separation prefix
+_PREFIX_STATE = hashlib.sha3_256(SEAL_PREFIX)
+
+_SECTIONS = ("initial_phase_state", "plugins", "outputs", "trailer")
+
+
+class SealHasher:
+    """
+    Feeds the canonical seal input into SHA3‑256 section by section,
+    without building the serialized body:
+
+        h = SealHasher()
+        h.initial_phase_state(phases)      # §3 field 1
+        h.plugins(plugins)                 # field 2
+        h.outputs(actual)                  # fields 3–8
+        h.trailer(impl_id, timestamp, nonce)  # fields 9–11
+        h.hexdigest()
+
+    Sections must be fed in this order. copy() checkpoints the hash
+    state, so evaluations that share the leading sections (e.g. the
+    same initial PhaseState and plugin set) hash only what differs:
+
+        base = SealHasher.for_inputs(vector)
+        seal = base.copy().finish(vector, actual)
+
+    Every hasher starts from a copy of the SHA3 state that has already
+    absorbed ISO16-SEAL-V1:.
+    """
+
+    __slots__ = ("_h", "_section")
+
+    def __init__(self):
+        self._h = _PREFIX_STATE.copy()
+        self._section = 0
+
+    def _enter(self, section: int) -> None:
+        if self._section != section:
+            expected = _SECTIONS[self._section] if self._section < len(_SECTIONS) else "digest"
+            raise ValueError(f"Seal section out of order: got {_SECTIONS[section]}, "
+                             f"expected {expected}")
+        self._section += 1
+
+    def initial_phase_state(self, phases) -> "SealHasher":
+        self._enter(0)
+        self._h.update(_PHASE_STATE.pack(*chain.from_iterable(phases)))
+        return self
+
+    def plugins(self, plugins: dict) -> "SealHasher":
+        self._enter(1)
+        layout = _default_serializer()._plugin_layout(plugins)
+        self._h.update(layout.struct.pack(*layout.pack_args(plugins)))
+        return self
+
+    def outputs(self, actual: dict) -> "SealHasher":
+        self._enter(2)
+        h = self._h
+        h.update(_TOTALS.pack(*actual["warp_total"], actual["error_total"]))
+        h.update(_PHASE_STATE.pack(*chain.from_iterable(actual["phase_state_warped"])))
+        h.update(_FLAGS.pack(1 if actual["symmetry_ok"] else 0,
+                             1 if actual["error_ok"] else 0,
+                             1 if actual["true_delivery"] else 0))
+        return self
+
+    def trailer(self, implementation_id: str = "iso16-ref", timestamp: int = 0,
+                nonce=bytes(16)) -> "SealHasher":
+        self._enter(3)
+        self._h.update(_encode_string(implementation_id))
+        self._h.update(_TAIL.pack(timestamp, _nonce_bytes(nonce)))
+        return self
+
+    def copy(self) -> "SealHasher":
+        """
+        Independent hasher continuing from the current state.
+        """
+        other = SealHasher.__new__(SealHasher)
+        other._h = self._h.copy()
+        other._section = self._section
+        return other
+
+    def digest(self) -> bytes:
+        if self._section != len(_SECTIONS):
+            raise ValueError("Seal input incomplete")
+        return self._h.digest()
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    @classmethod
+    def for_inputs(cls, vector: dict) -> "SealHasher":
+        """
+        Hasher with the vector's initial PhaseState and plugins absorbed.
+        """
+        return cls().initial_phase_state(vector["initial_phase_state"]).plugins(vector["plugins"])
+
+    def finish(self, vector: dict, actual: dict) -> str:
+        """
+        Absorb the outputs and the vector's implementation_id, timestamp
+        and nonce; return the Tetra‑Seal as lowercase hex.
+        """
+        self.outputs(actual)
+        self.trailer(vector.get("implementation_id", "iso16-ref"),
+                     vector.get("timestamp", 0),
+                     vector.get("nonce", bytes(16)))
+        return self.hexdigest()
+
+
 # ------------------------------------------------------------
 # Seal Hashing
 # ------------------------------------------------------------
@@ -176,13 +546,8 @@ def canonical_serialize_and_hash(vector: dict, actual: dict) -> str:
     """
     Serialize fields, prepend domain‑separation prefix,
     compute SHA3‑256, return lowercase hex string.
-    """
 
-    prefix = b"ISO16-SEAL-V1:"
-    body = canonical_serialize(vector, actual)
-
-    h = hashlib.sha3_256()
-    h.update(prefix)
-    h.update(body)
-
-    return h.hexdigest()
+    Sections are streamed into the hash (SealHasher); no serialized body
+    is built.
+    """
+    return SealHasher.for_inputs(vector).finish(vector, actual)
@@ -0,0 +1,403 @@
+"""
+ISO‑16 Packed Vector Container (.i16p)
+--------------------------------------
+
+A compact binary form of conformance vectors for large corpora. JSON
+(conformance/vectors/*.json, validated against vector_schema.json) stays
+the human‑facing source of truth; this container exists so runners can
+mmap a corpus and read it without parsing JSON.
+
+Layout (all integers little‑endian):
+
+    header          56 bytes
+    vector table    vector_count × 248‑byte records
+    plugin table    plugin_count × 32‑byte records
+    string table    (string_count + 1) × u64 offsets, then UTF‑8 blob
+
+Header:
+    magic "ISO16VPK", u16 version, u16 flags, u32 reserved,
+    u64 vector_count, u64 plugin_count, u64 string_count,
+    u64 plugins_offset, u64 strings_offset
+
+Vector record:
+    u32 vector_id (string index)
+    u32 description (string index, NO_STRING if absent)
+    u32 flags (bit 0: expected_seal present)
+    u32 plugin_count
+    u64 plugin_first (index into the plugin table)
+    48 × i32 initial_phase_state (16 phases × x,y,z)
+    32 bytes expected_seal (raw SHA3‑256, zero if absent)
+
+Plugin record:
+    u32 key, u32 id, u32 version (string indices)
+    u8 domain_code (iso16_seal.md §4.3), u8 status_code, 2 bytes padding
+    3 × i32 warp_vector, i32 error
+
+Plugins are stored in the vector's JSON key order so that unpacking
+reproduces the source document. Fields outside vector_schema.json (other
+than expected_seal) are rejected rather than silently dropped.
+
+NumPy is only needed for the array views (arrays(), batch_inputs()).
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+
+MAGIC   = b"ISO16VPK"
+VERSION = 1
+
+NO_STRING = 0xFFFFFFFF
+
+FLAG_EXPECTED_SEAL = 0x1
+
+_HEADER  = struct.Struct("<8sHHIQQQQQ")
+_VECTOR  = struct.Struct("<IIIIQ48i32s")
+_PLUGIN  = struct.Struct("<IIIBB2x3ii")
+_OFFSET  = struct.Struct("<Q")
+
+DOMAIN_CODES = {"Refraction": 0x01, "FrameDrag": 0x02, "Jitter": 0x03, "Custom": 0xFF}
+DOMAIN_NAMES = {code: name for name, code in DOMAIN_CODES.items()}
+
+STATUS_CODES = {
+    "OK": 0,
+    "INSUFFICIENT_DATA": 1,
+    "OUT_OF_RANGE": 2,
+    "TIMEOUT": 3,
+    "SENSOR_MISMATCH": 4,
+}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+_VECTOR_KEYS = {"vector_id", "description", "initial_phase_state", "plugins", "expected_seal"}
+_PLUGIN_KEYS = {"id", "domain", "warp_vector", "error", "version", "status"}
+
+
+# ------------------------------------------------------------
+# Writer
+# ------------------------------------------------------------
+
+class VectorPackWriter:
+    """
+    Stream vectors into a .i16p container.
+
+    Vector records go straight to the output file; plugin records and
+    strings are spooled to temporary files and appended on close(), so
+    memory use does not grow with the number of vectors. Only plugin
+    strings (keys, ids, versions) are interned.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, "wb")
+        self._f.write(bytes(_HEADER.size))
+
+        self._plugins = tempfile.TemporaryFile()
+        self._offsets = tempfile.TemporaryFile()
+        self._blob    = tempfile.TemporaryFile()
+
+        self._interned = {}
+        self._vector_count = 0
+        self._plugin_count = 0
+        self._string_count = 0
+        self._blob_size = 0
+
+    def _add_string(self, s: str) -> int:
+        b = s.encode("utf-8")
+        self._offsets.write(_OFFSET.pack(self._blob_size))
+        self._blob.write(b)
+        self._blob_size += len(b)
+        self._string_count += 1
+        return self._string_count - 1
+
+    def _intern(self, s: str) -> int:
+        idx = self._interned.get(s)
+        if idx is None:
+            idx = self._interned[s] = self._add_string(s)
+        return idx
+
+    def add(self, vector: dict) -> None:
+        """
+        Append one conformance vector (vector_schema.json layout).
+        """
+        extra = set(vector) - _VECTOR_KEYS
+        if extra:
+            raise ValueError(f"Fields not representable in .i16p: {sorted(extra)}")
+
+        flags = 0
+        seal = bytes(32)
+        if "expected_seal" in vector:
+            flags |= FLAG_EXPECTED_SEAL
+            seal = bytes.fromhex(vector["expected_seal"])
+            if len(seal) != 32:
+                raise ValueError("expected_seal must be 32 bytes")
+
+        description = vector.get("description")
+        desc_idx = NO_STRING if description is None else self._add_string(description)
+
+        # Pack every record before writing any, so a vector that fails
+        # (e.g. struct.error on an out‑of‑range coordinate) leaves no
+        # orphan plugin records behind. Strings it interned stay in the
+        # table unreferenced, which readers never see.
+        plugins = vector["plugins"]
+        plugin_records = []
+        for key, p in plugins.items():
+            extra = set(p) - _PLUGIN_KEYS
+            if extra:
+                raise ValueError(f"Plugin fields not representable in .i16p: {sorted(extra)}")
+            plugin_records.append(_PLUGIN.pack(
+                self._intern(key),
+                self._intern(p["id"]),
+                self._intern(p["version"]),
+                DOMAIN_CODES[p["domain"]],
+                STATUS_CODES[p["status"]],
+                *p["warp_vector"],
+                p["error"],
+            ))
+
+        phases = [c for phase in vector["initial_phase_state"] for c in phase]
+        record = _VECTOR.pack(
+            self._add_string(vector["vector_id"]),
+            desc_idx,
+            flags,
+            len(plugins),
+            self._plugin_count,
+            *phases,
+            seal,
+        )
+
+        self._plugins.write(b"".join(plugin_records))
+        self._plugin_count += len(plugin_records)
+        self._f.write(record)
+        self._vector_count += 1
+
+    @property
+    def vector_count(self) -> int:
+        return self._vector_count
+
+    def close(self) -> None:
+        if self._f is None:
+            return
+
+        plugins_offset = self._f.tell()
+        self._plugins.seek(0)
+        shutil.copyfileobj(self._plugins, self._f)
+
+        strings_offset = self._f.tell()
+        self._offsets.write(_OFFSET.pack(self._blob_size))
+        self._offsets.seek(0)
+        shutil.copyfileobj(self._offsets, self._f)
+        self._blob.seek(0)
+        shutil.copyfileobj(self._blob, self._f)
+
+        self._f.seek(0)
+        self._f.write(_HEADER.pack(
+            MAGIC, VERSION, 0, 0,
+            self._vector_count, self._plugin_count, self._string_count,
+            plugins_offset, strings_offset,
+        ))
+        self._f.close()
+        self._f = None
+
+        for spool in (self._plugins, self._offsets, self._blob):
+            spool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_pack(path, vectors) -> int:
+    """
+    Write an iterable of vector dicts to `path`. Returns the vector count.
+    """
+    with VectorPackWriter(path) as w:
+        for vector in vectors:
+            w.add(vector)
+        return w.vector_count
+
+
+# ------------------------------------------------------------
+# Reader
+# ------------------------------------------------------------
+
+class VectorPack:
+    """
+    Read‑only, memory‑mapped view of a .i16p container. Records are
+    decoded on access straight from the mapping; nothing is parsed or
+    copied up front.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{self.path}: not an ISO-16 vector pack")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mm)
+
+        (magic, version, _flags, _reserved,
+         self.vector_count, self.plugin_count, self.string_count,
+         self._plugins_offset, self._strings_offset) = _HEADER.unpack_from(self._buf, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not an ISO-16 vector pack")
+        if version != VERSION:
+            raise ValueError(f"{self.path}: unsupported pack version {version}")
+
+        self._blob_offset = self._strings_offset + (self.string_count + 1) * _OFFSET.size
+
+    # --------------------------------------------------------
+    # Record access
+    # --------------------------------------------------------
+
+    def __len__(self):
+        return self.vector_count
+
+    def string(self, idx: int) -> str:
+        start, = _OFFSET.unpack_from(self._buf, self._strings_offset + idx * _OFFSET.size)
+        end,   = _OFFSET.unpack_from(self._buf, self._strings_offset + (idx + 1) * _OFFSET.size)
+        return str(self._buf[self._blob_offset + start:self._blob_offset + end], "utf-8")
+
+    def _vector_record(self, i: int):
+        if not 0 <= i < self.vector_count:
+            raise IndexError(i)
+        return _VECTOR.unpack_from(self._buf, _HEADER.size + i * _VECTOR.size)
+
+    def vector_id(self, i: int) -> str:
+        return self.string(self._vector_record(i)[0])
+
+    def vector(self, i: int) -> dict:
+        """
+        Decode vector `i` into the same dict layout as its JSON source.
+        """
+        rec = self._vector_record(i)
+        id_idx, desc_idx, flags, plugin_count, plugin_first = rec[:5]
+        coords = rec[5:53]
+
+        vector = {"vector_id": self.string(id_idx)}
+        if desc_idx != NO_STRING:
+            vector["description"] = self.string(desc_idx)
+        vector["initial_phase_state"] = [list(coords[k:k + 3]) for k in range(0, 48, 3)]
+
+        plugins = {}
+        base = self._plugins_offset + plugin_first * _PLUGIN.size
+        for j in range(plugin_count):
+            key, pid, ver, domain, status, wx, wy, wz, err = \
+                _PLUGIN.unpack_from(self._buf, base + j * _PLUGIN.size)
+            plugins[self.string(key)] = {
+                "id": self.string(pid),
+                "domain": DOMAIN_NAMES[domain],
+                "warp_vector": [wx, wy, wz],
+                "error": err,
+                "version": self.string(ver),
+                "status": STATUS_NAMES[status],
+            }
+        vector["plugins"] = plugins
+
+        if flags & FLAG_EXPECTED_SEAL:
+            vector["expected_seal"] = rec[53].hex()
+        return vector
+
+    def __iter__(self):
+        for i in range(self.vector_count):
+            yield self.vector(i)
+
+    def entry_bytes(self, i: int) -> bytes:
+        """
+        Bytes that fully determine vector `i` (its record, its plugin
+        records and the strings they reference). Used as a content key
+        by the result cache.
+        """
+        rec = self._vector_record(i)
+        plugin_count, plugin_first = rec[3], rec[4]
+        start = _HEADER.size + i * _VECTOR.size
+        parts = [bytes(self._buf[start:start + _VECTOR.size])]
+
+        base = self._plugins_offset + plugin_first * _PLUGIN.size
+        parts.append(bytes(self._buf[base:base + plugin_count * _PLUGIN.size]))
+
+        string_ids = [rec[0]] + ([rec[1]] if rec[1] != NO_STRING else [])
+        for j in range(plugin_count):
+            string_ids.extend(_PLUGIN.unpack_from(self._buf, base + j * _PLUGIN.size)[:3])
+        for idx in string_ids:
+            b = self.string(idx).encode("utf-8")
+            parts.append(len(b).to_bytes(4, "little") + b)
+        return b"".join(parts)
+
+    # --------------------------------------------------------
+    # Array views (NumPy)
+    # --------------------------------------------------------
+
+    def arrays(self):
+        """
+        Zero‑copy NumPy structured views of the vector and plugin tables.
+        The views must be released before close().
+        """
+        import numpy as np
+
+        vector_dtype = np.dtype([
+            ("vector_id", "<u4"), ("description", "<u4"), ("flags", "<u4"),
+            ("plugin_count", "<u4"), ("plugin_first", "<u8"),
+            ("phase_state", "<i4", (16, 3)), ("expected_seal", "V32"),
+        ])
+        plugin_dtype = np.dtype([
+            ("key", "<u4"), ("id", "<u4"), ("version", "<u4"),
+            ("domain", "u1"), ("status", "u1"), ("_pad", "V2"),
+            ("warp_vector", "<i4", (3,)), ("error", "<i4"),
+        ])
+        assert vector_dtype.itemsize == _VECTOR.size
+        assert plugin_dtype.itemsize == _PLUGIN.size
+
+        vectors = np.frombuffer(self._buf, dtype=vector_dtype,
+                                count=self.vector_count, offset=_HEADER.size)
+        plugins = np.frombuffer(self._buf, dtype=plugin_dtype,
+                                count=self.plugin_count, offset=self._plugins_offset)
+        return vectors, plugins
+
+    def batch_inputs(self, start: int = 0, stop: int = None):
+        """
+        Build (phase_states, plugin_warp, plugin_error, plugin_ok) for
+        vectors [start, stop), in the layout iso16_batch_engine expects.
+        Plugins stay in stored order: the batch outputs are wraparound
+        sums and conjunctions, which do not depend on plugin order.
+
+        phase_states is a zero‑copy view into the mapping (the other
+        arrays are copies); drop it before close().
+        """
+        import numpy as np
+
+        vectors, plugins = self.arrays()
+        vs = vectors[start:stop]
+
+        counts = vs["plugin_count"].astype(np.int64)
+        p = int(counts.max()) if len(vs) else 0
+        slot = np.arange(p)
+        present = slot[np.newaxis, :] < counts[:, np.newaxis]
+        index = np.where(present, vs["plugin_first"].astype(np.int64)[:, np.newaxis] + slot, 0)
+
+        gathered = plugins[index] if self.plugin_count else np.zeros(index.shape, plugins.dtype)
+        plugin_warp  = np.where(present[..., np.newaxis], gathered["warp_vector"], 0).astype(np.int32)
+        plugin_error = np.where(present, gathered["error"], 0).astype(np.int32)
+        plugin_ok    = ~present | (gathered["status"] == STATUS_CODES["OK"])
+
+        return vs["phase_state"], plugin_warp, plugin_error, plugin_ok
+
+    def close(self) -> None:
+        """
+        Unmap the file. Raises BufferError while a view from arrays() or
+        the phase_states of batch_inputs() is still alive.
+        """
+        self._buf.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+ISO‑16 Bulk Tetra‑Seal Verifier (Informative)
+---------------------------------------------
+Re‑verifies Tetra‑Seals over a stream of audit records, following the
+auditor procedure in iso16_seal.md §7:
+
+  1. reconstruct the canonical seal input from the record
+  2. prepend the domain‑separation prefix and compute SHA3‑256
+  3. compare against the recorded tetra_seal
+
+Audit records are JSON objects, one per line (JSON Lines), carrying the
+canonical field set under the names used by utils/seal.py:
+
+    initial_phase_state, plugins, warp_total, error_total,
+    phase_state_warped, symmetry_ok, error_ok, true_delivery,
+    implementation_id, timestamp, nonce, tetra_seal
+    (vector_id optional, echoed back in results)
+
+Records are read lazily and verified in fixed‑size chunks on a thread
+pool with a bounded number of chunks in flight, so memory use stays
+constant regardless of archive size. Results are yielded in input order.
+
+Usage:
+    python3 verify_seals.py records.jsonl [--jobs N] [--failures-only]
+    cat records.jsonl | python3 verify_seals.py -
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.seal import canonical_serialize_and_hash
+
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+def _verify_record(index: int, record) -> dict:
+    """
+    Verify one audit record (a dict, or a JSON document as str/bytes).
+    """
+    vector_id = None
+    try:
+        if isinstance(record, (str, bytes, bytearray)):
+            record = json.loads(record)
+        vector_id = record.get("vector_id")
+        expected = record["tetra_seal"].strip().lower()
+        actual = canonical_serialize_and_hash(record, record)
+    except (KeyError, TypeError, ValueError, AttributeError, struct.error) as e:
+        return {
+            "index": index,
+            "vector_id": vector_id,
+            "status": "FAIL",
+            "reason": "malformed_record",
+            "error": f"{type(e).__name__}: {e}",
+        }
+
+    result = {
+        "index": index,
+        "vector_id": vector_id,
+        "status": "PASS" if actual == expected else "FAIL",
+        "expected": expected,
+        "actual": actual,
+    }
+    if actual != expected:
+        result["reason"] = "seal_mismatch"
+    return result
+
+
+def _verify_chunk(start: int, records) -> list:
+    return [_verify_record(start + i, r) for i, r in enumerate(records)]
+
+
+def _chunks(records, chunk_size: int):
+    chunk = []
+    start = 0
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield start, chunk
+            start += chunk_size
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def verify_seals(records, jobs: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Lazily verify an iterable of audit records and yield one result dict
+    per record, in input order.
+
+    `records` may contain dicts or raw JSON lines; parsing happens on the
+    worker threads. At most 2×jobs chunks are held in memory at a time.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    max_in_flight = 2 * jobs
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for start, chunk in _chunks(records, chunk_size):
+            pending.append(pool.submit(_verify_chunk, start, chunk))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def read_audit_records(path: str):
+    """
+    Yield raw JSON lines from a JSON Lines file ("-" for stdin),
+    skipping blank lines.
+    """
+    f = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        for line in f:
+            if line.strip():
+                yield line
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISO-16 Bulk Tetra-Seal Verifier")
+    parser.add_argument("records", help="Audit records as JSON Lines ('-' for stdin).")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker threads (0 = one per CPU core). Default: 0."
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Records per work item. Default: {DEFAULT_CHUNK_SIZE}."
+    )
+    parser.add_argument(
+        "--failures-only",
+        action="store_true",
+        help="Only emit results for records that fail verification."
+    )
+    args = parser.parse_args()
+
+    passed = failed = 0
+    out = sys.stdout
+    for result in verify_seals(read_audit_records(args.records),
+                               jobs=args.jobs or None,
+                               chunk_size=args.chunk_size):
+        if result["status"] == "PASS":
+            passed += 1
+            if args.failures_only:
+                continue
+        else:
+            failed += 1
+        out.write(json.dumps(result) + "\n")
+
+    print(f"[*] Results: {passed} Passed, {failed} Failed.", file=sys.stderr)
+    sys.exit(0 if failed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()